@@ -0,0 +1,108 @@
+"""Append / compact / read round-trips through yahtzii_archive."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import yahtzii_archive
+from yahtzii_archive import GameArchive
+from yahtzii_strategy import simulate_game
+
+
+def games(n, seed=0):
+    rnd = random.Random(seed)
+    names = ["Ann", "Bob", "Cy", "Di"]
+    return [simulate_game(rnd.sample(names, rnd.randint(1, 3)), rnd.random,
+                          f"2026-01-{1 + i % 28:02d} 12:{i % 60:02d}") for i in range(n)]
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Shrink the chunk thresholds so a handful of games exercise compact()."""
+    monkeypatch.setattr(yahtzii_archive, "SMALL_CHUNK", 4)
+    monkeypatch.setattr(yahtzii_archive, "COMPACT_AFTER", 1000)
+
+
+@pytest.mark.parametrize("compression", [None, "zlib", "lzma"])
+def test_append_then_iter_games_round_trips(tmp_path, compression):
+    played = games(6)
+    arch = GameArchive(str(tmp_path))
+    arch.append(played, compression=compression)
+    assert len(arch) == 6
+    assert list(GameArchive(str(tmp_path)).iter_games()) == played
+
+
+def test_unknown_compression_is_rejected(tmp_path):
+    arch = GameArchive(str(tmp_path))
+    with pytest.raises(ValueError):
+        arch.append(games(1), compression="gzip")
+    with pytest.raises(ValueError):
+        arch.compact("gzip")
+
+
+def test_compact_merges_small_chunks_and_keeps_games(tmp_path, small_chunks):
+    played = games(10)
+    arch = GameArchive(str(tmp_path))
+    for game in played:
+        arch.append([game])
+    assert len(arch.chunk_metas()) == 10
+    arch.compact()
+    metas = arch.chunk_metas()
+    assert [m["games"] for m in metas] == [4, 4, 2]
+    assert list(arch.iter_games()) == played
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+        ["manifest.json"] + [m["name"] for m in metas])
+
+
+def test_compact_does_not_rewrite_full_chunks(tmp_path, small_chunks):
+    arch = GameArchive(str(tmp_path))
+    for game in games(8):
+        arch.append([game])
+    arch.compact()
+    merged = [m["name"] for m in arch.chunk_metas()]
+    arch.append(games(1, seed=1))
+    arch.compact()
+    assert [m["name"] for m in arch.chunk_metas()][:2] == merged
+
+
+def test_compact_keep_preserves_each_runs_compression(tmp_path, small_chunks):
+    played = games(6)
+    arch = GameArchive(str(tmp_path))
+    for game, packing in zip(played, ["lzma", "lzma", None, None, "zlib", "zlib"]):
+        arch.append([game], compression=packing)
+    arch.compact()
+    assert [(m["games"], m["compression"]) for m in arch.chunk_metas()] == [
+        (2, "lzma"), (2, None), (2, "zlib")]
+    assert list(arch.iter_games()) == played
+
+
+def test_compact_with_explicit_compression_rewrites_runs(tmp_path, small_chunks):
+    played = games(4)
+    arch = GameArchive(str(tmp_path))
+    for game, packing in zip(played, ["lzma", None, "zlib", None]):
+        arch.append([game], compression=packing)
+    arch.compact(compression="zlib")
+    assert [(m["games"], m["compression"]) for m in arch.chunk_metas()] == [(4, "zlib")]
+    assert list(arch.iter_games()) == played
+
+
+def test_indexes_find_players_and_dates(tmp_path):
+    played = games(12)
+    arch = GameArchive(str(tmp_path))
+    arch.append(played[:6])
+    arch.append(played[6:])
+    ann = sum(g["players"].count("Ann") for g in played)
+    assert sum(len(rows) for rows in arch.player_scores("Ann")) == ann
+    assert list(arch.player_scores("Nobody")) == []
+    jan = sum(1 for g in played if g["date"] < "2026-01-05")
+    assert sum(len(rows) for rows in arch.games_between("2026-01-01", "2026-01-05")) == jan
+
+
+def test_iter_rankings_matches_games(tmp_path):
+    played = games(5)
+    arch = GameArchive(str(tmp_path))
+    arch.append(played)
+    rankings = list(arch.iter_rankings())
+    assert [[n for n, _ in r] for r in rankings] == [g["players"] for g in played]
@@ -0,0 +1,124 @@
+"""Multiplayer Elo in yahtzii_stats.EloRatings."""
+
+import itertools
+import json
+import random
+
+import pytest
+
+from yahtzii_stats import EloRatings, game_ranking
+
+
+def seeded(ratings):
+    elo = EloRatings()
+    elo.ratings = dict(ratings)
+    return elo
+
+
+def test_new_players_start_from_base():
+    elo = EloRatings()
+    assert elo.rating("Ann") is None
+    elo.update([("Ann", 200), ("Bob", 100)])
+    assert elo.rating("Ann") == pytest.approx(EloRatings.BASE + EloRatings.K / 2)
+    assert elo.rating("Bob") == pytest.approx(EloRatings.BASE - EloRatings.K / 2)
+    assert elo.games == {"Ann": 1, "Bob": 1}
+
+
+@pytest.mark.parametrize("ranking", [
+    [("Ann", 250), ("Bob", 180)],
+    [("Ann", 250), ("Bob", 180), ("Cy", 310)],
+    [("Ann", 250), ("Bob", 250), ("Cy", 90), ("Di", 400)],
+])
+def test_update_is_zero_sum(ranking):
+    before = {"Ann": 1620.0, "Bob": 1480.0, "Cy": 1500.0, "Di": 1390.0}
+    elo = seeded(before)
+    elo.update(ranking)
+    deltas = [elo.ratings[n] - before[n] for n, _ in ranking]
+    assert sum(deltas) == pytest.approx(0.0, abs=1e-9)
+
+
+def test_update_ignores_seating_order():
+    before = {"Ann": 1620.0, "Bob": 1480.0, "Cy": 1555.0}
+    ranking = [("Ann", 250), ("Bob", 310), ("Cy", 250)]
+    results = []
+    for order in itertools.permutations(ranking):
+        elo = seeded(before)
+        elo.update(list(order))
+        results.append(elo.ratings)
+    for r in results[1:]:
+        assert r == pytest.approx(results[0])
+
+
+def test_swapping_scores_mirrors_the_deltas():
+    before = {"Ann": 1600.0, "Bob": 1500.0}
+    won, lost = seeded(before), seeded(before)
+    won.update([("Ann", 300), ("Bob", 200)])
+    lost.update([("Ann", 200), ("Bob", 300)])
+    # Ann gains a little for the expected win and loses more for the upset.
+    assert 0 < won.ratings["Ann"] - 1600 < 1600 - lost.ratings["Ann"]
+    assert (won.ratings["Ann"] - 1600) + (1600 - lost.ratings["Ann"]) == pytest.approx(EloRatings.K)
+
+
+def test_tie_between_equals_changes_nothing():
+    elo = seeded({"Ann": 1530.0, "Bob": 1530.0})
+    elo.update([("Ann", 222), ("Bob", 222)])
+    assert elo.ratings == {"Ann": 1530.0, "Bob": 1530.0}
+    assert elo.games == {"Ann": 1, "Bob": 1}
+
+
+def test_solo_game_is_not_rated():
+    elo = EloRatings()
+    elo.update([("Ann", 300)])
+    elo.update([])
+    assert not elo and elo.games == {}
+
+
+def random_rankings(n, seed=3):
+    rnd = random.Random(seed)
+    names = ["Ann", "Bob", "Cy", "Di", "Ed"]
+    return [[(name, rnd.randint(80, 400)) for name in rnd.sample(names, rnd.randint(1, 4))]
+            for _ in range(n)]
+
+
+def test_replay_equals_sequential_updates():
+    rankings = random_rankings(200)
+    elo = EloRatings()
+    for ranking in rankings:
+        elo.update(ranking)
+    replayed = EloRatings.replay(iter(rankings), "ratings.json")
+    assert replayed.path == "ratings.json"
+    assert replayed.ratings == elo.ratings and replayed.games == elo.games
+    board = replayed.leaderboard()
+    assert [r for _, r, _ in board] == sorted(elo.ratings.values(), reverse=True)
+
+
+def test_game_ranking_reads_recorded_cards():
+    game = {"players": ["Ann", "Bob"],
+            "cards": [{"0": 3, "14": 50, "15": 1}, {"16": 20}]}
+    assert game_ranking(game) == [("Ann", 153), ("Bob", 20)]
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "ratings.json")
+    elo = EloRatings.replay(random_rankings(30), path)
+    elo.save()
+    back = EloRatings.load(path)
+    assert back.ratings == elo.ratings and back.games == elo.games
+    snapshot = elo.to_json()
+    elo.update([("Ann", 1), ("Bob", 2)])
+    assert snapshot["ratings"] != elo.ratings
+
+
+@pytest.mark.parametrize("data", [[], {"ratings": {}}, {"ratings": [1], "games": {}},
+                                  {"ratings": {}, "games": 7}])
+def test_load_ignores_damaged_files(tmp_path, data):
+    path = tmp_path / "ratings.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    elo = EloRatings.load(str(path))
+    assert elo.ratings == {} and elo.games == {}
+    elo.update([("Ann", 2), ("Bob", 1)])
+    assert elo.rating("Ann") > elo.rating("Bob")
+
+
+def test_load_missing_file(tmp_path):
+    assert not EloRatings.load(str(tmp_path / "missing.json"))
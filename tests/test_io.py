@@ -0,0 +1,109 @@
+"""Background file I/O in yahtzii_io: the coalescing worker and JSON helpers."""
+
+import json
+import os
+import threading
+
+import pytest
+
+from yahtzii_io import IOWorker, read_json, remove_file, write_json_atomic
+
+TIMEOUT = 5.0
+
+
+@pytest.fixture
+def worker():
+    w = IOWorker("test-io")
+    yield w
+    assert w.flush(TIMEOUT)
+
+
+@pytest.fixture
+def blocked(worker):
+    """The worker parked inside a job until the returned event is set."""
+    started, release = threading.Event(), threading.Event()
+
+    def hold():
+        started.set()
+        release.wait(TIMEOUT)
+
+    worker.submit("hold", hold)
+    assert started.wait(TIMEOUT)
+    yield release
+    release.set()
+
+
+def test_queued_job_for_the_same_key_is_replaced(worker, blocked):
+    ran = []
+    worker.submit("scores", lambda: ran.append("first"))
+    worker.submit("scores", lambda: ran.append("second"))
+    assert worker.pending("scores")
+    blocked.set()
+    assert worker.flush(TIMEOUT)
+    assert ran == ["second"]
+    assert not worker.pending("scores")
+
+
+def test_different_keys_run_in_submission_order(worker, blocked):
+    ran = []
+    for key in ("a", "b", "c"):
+        worker.submit(key, lambda key=key: ran.append(key))
+    worker.submit("a", lambda: ran.append("a2"))      # resubmitting moves it last
+    blocked.set()
+    assert worker.flush(TIMEOUT)
+    assert ran == ["b", "c", "a2"]
+
+
+def test_flush_times_out_while_a_job_runs(worker, blocked):
+    assert not worker.flush(0.05)
+    blocked.set()
+    assert worker.flush(TIMEOUT)
+
+
+def test_failing_job_is_counted_and_the_worker_carries_on(worker):
+    ran = []
+
+    def boom():
+        raise OSError("disk full")
+
+    worker.submit("bad", boom)
+    worker.submit("good", lambda: ran.append(1))
+    assert worker.flush(TIMEOUT)
+    assert worker.errors == 1
+    assert isinstance(worker.last_error, OSError)
+    assert ran == [1]
+
+
+def test_write_json_atomic_replaces_the_file(tmp_path):
+    path = str(tmp_path / "scores.json")
+    write_json_atomic(path, {"a": [1, 2]})
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == '{"a":[1,2]}'
+    write_json_atomic(path, {"b": 3}, indent=2)
+    assert read_json(path) == {"b": 3}
+    assert os.listdir(tmp_path) == ["scores.json"]
+
+
+def test_failed_write_leaves_the_old_file(tmp_path):
+    path = str(tmp_path / "scores.json")
+    write_json_atomic(path, [1])
+    with pytest.raises(TypeError):
+        write_json_atomic(path, [object()])
+    assert read_json(path) == [1]
+
+
+def test_read_json_default(tmp_path):
+    missing = str(tmp_path / "missing.json")
+    assert read_json(missing) is None
+    assert read_json(missing, []) == []
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json", encoding="utf-8")
+    assert read_json(str(bad), {}) == {}
+
+
+def test_remove_file_ignores_missing(tmp_path):
+    path = tmp_path / "autosave.json"
+    path.write_text(json.dumps({}), encoding="utf-8")
+    remove_file(str(path))
+    assert not path.exists()
+    remove_file(str(path))
@@ -0,0 +1,123 @@
+"""Scoring and the precomputed legal-move engine in yahtzii_rules."""
+
+import random
+from itertools import product
+
+import pytest
+
+from yahtzii_rules import (
+    ALL_MASK, CATEGORY_BIT, CATEGORY_INDEX, LOWER_SECTION_PRIMARY, PRIMARY_CATEGORIES,
+    UPPER_SECTION, best_hint, card_totals, joker_rows, legal_moves, next_player_index,
+    row_score, rows_in,
+)
+
+
+@pytest.mark.parametrize("dice, row, score", [
+    ([1, 1, 2, 3, 4], 0, 2),
+    ([6, 6, 6, 2, 1], 5, 18),
+    ([3, 3, 3, 2, 1], 9, 12),
+    ([3, 3, 2, 2, 1], 9, 0),
+    ([4, 4, 4, 4, 1], 10, 17),
+    ([2, 2, 3, 3, 3], 11, 25),
+    ([3, 3, 3, 3, 3], 11, 0),           # a Yahtzii is not a Full House without Joker
+    ([1, 2, 3, 4, 6], 12, 30),
+    ([1, 3, 4, 5, 6], 12, 30),
+    ([1, 2, 3, 5, 6], 12, 0),
+    ([2, 3, 4, 5, 6], 13, 40),
+    ([1, 2, 3, 4, 6], 13, 0),
+    ([5, 5, 5, 5, 5], 14, 50),
+    ([1, 2, 3, 4, 6], 16, 16),
+])
+def test_row_score(dice, row, score):
+    assert row_score(row, dice) == score
+
+
+def test_joker_scores_fixed_rows_in_full():
+    dice = [4] * 5
+    assert [row_score(r, dice, joker=True) for r in (11, 12, 13)] == [25, 30, 40]
+
+
+def test_bonus_row_is_not_a_category():
+    with pytest.raises(ValueError):
+        row_score(15, [1, 2, 3, 4, 5])
+
+
+def test_legal_moves_matches_row_score():
+    rnd = random.Random(1)
+    for _ in range(300):
+        dice  = [rnd.randint(1, 6) for _ in range(5)]
+        mask  = rnd.getrandbits(len(PRIMARY_CATEGORIES))
+        moves = legal_moves(dice, mask)
+        assert moves.legal == ALL_MASK & ~mask
+        for r in PRIMARY_CATEGORIES:
+            s = row_score(r, dice)
+            assert moves.scores[CATEGORY_INDEX[r]] == s
+            assert bool(moves.valid & CATEGORY_BIT[r]) == (s > 0)
+
+
+def test_yahtzii_bonus_needs_a_50_in_the_box():
+    dice = [2] * 5
+    assert legal_moves(dice, 0, yahtzii_box=50).bonus
+    assert not legal_moves(dice, 0, yahtzii_box=0).bonus
+    assert not legal_moves(dice, 0, yahtzii_box=None).bonus
+    assert not legal_moves([2, 2, 2, 2, 3], 0, yahtzii_box=50).bonus
+
+
+def _joker_reference(face, open_rows):
+    """The scorecard's Joker priority, written out longhand."""
+    if face - 1 in open_rows:
+        return [face - 1]
+    lower = [r for r in LOWER_SECTION_PRIMARY if r in open_rows]
+    if lower:
+        return lower
+    return [r for r in UPPER_SECTION if r in open_rows]
+
+
+def test_joker_rows_follow_priority_for_every_open_set():
+    non_yahtzii = [r for r in PRIMARY_CATEGORIES if r != 14]   # Yahtzii box is full under Joker
+    rnd = random.Random(2)
+    for face in range(1, 7):
+        for bits in rnd.sample(range(1 << len(non_yahtzii)), 400):
+            open_rows = [r for i, r in enumerate(non_yahtzii) if bits >> i & 1]
+            assert joker_rows([face] * 5, open_rows) == _joker_reference(face, open_rows)
+
+
+def test_joker_legal_mask_and_scores():
+    claimed = CATEGORY_BIT[14] | CATEGORY_BIT[2]                 # Threes taken
+    moves = legal_moves([3] * 5, claimed, yahtzii_box=50, joker=True)
+    assert rows_in(moves.legal) == LOWER_SECTION_PRIMARY
+    assert moves.scores[CATEGORY_INDEX[13]] == 40
+
+
+def test_rows_in_round_trips_masks():
+    for rows in ([], [0], [5, 9, 16], PRIMARY_CATEGORIES):
+        assert rows_in(sum(CATEGORY_BIT[r] for r in rows)) == rows
+
+
+def test_best_hint_prefers_the_specific_field_on_ties():
+    assert best_hint([1, 2, 3, 4, 5]) == ("Large Straight", 40)
+    assert best_hint([6, 6, 6, 6, 6]) == ("Yahtzii", 50)
+    assert best_hint([1, 2, 3, 4, 5], ALL_MASK) == ("No open scoring fields", 0)
+
+
+def test_card_totals():
+    card = {0: 3, 1: 6, 2: 9, 3: 12, 4: 15, 5: 18, 14: 50, 16: 20, 15: 2}
+    totals = card_totals(card)
+    assert totals == {6: 63, 7: 35, 8: 98, 17: 270, 18: 368}
+    assert card_totals({})[18] == 0
+
+
+@pytest.mark.parametrize("current, left, expected", [
+    (0, [True, True, True], 1),
+    (2, [True, True, True], 0),
+    (0, [True, False, True], 2),
+    (1, [False, True, False], 1),       # only the current player is left
+    (0, [False, False, False], None),
+])
+def test_next_player_index(current, left, expected):
+    assert next_player_index(current, len(left), left.__getitem__) == expected
+
+
+def test_every_dice_combination_has_a_table_entry():
+    for dice in product(range(1, 7), repeat=5):
+        assert len(legal_moves(dice, 0).scores) == len(PRIMARY_CATEGORIES)
@@ -0,0 +1,138 @@
+"""Table rules and message validation in yahtzii_server."""
+
+import asyncio
+import json
+import random
+
+import pytest
+
+from yahtzii_server import RuleError, Table, TableServer, MAX_LINE_BYTES
+
+
+class FakeSession:
+    def __init__(self):
+        self.tables = set()
+        self.sent   = []
+
+    def send(self, msg):
+        self.sent.append(msg)
+
+
+def ask(server, session, msg):
+    raw = msg if isinstance(msg, str) else json.dumps(msg)
+    server._handle_message(session, raw)
+    return session.sent[-1]
+
+
+@pytest.fixture
+def server():
+    return TableServer(seed=1)
+
+
+@pytest.fixture
+def table():
+    return Table("t1", ["Ann", "Bob"], random.Random(3))
+
+
+# ------------------------------------------------------------------ Table --
+def test_roll_and_claim_follow_turn_order(table):
+    with pytest.raises(RuleError):
+        table.roll("Bob")
+    table.roll("Ann")
+    assert table.rolls_left == 2 and len(table.dice) == 5
+    row = table.legal_rows()[0]
+    table.claim("Ann", row)
+    assert table.current == 1 and table.dice is None and table.rolls_left == 3
+
+
+def test_held_dice_stay_put(table):
+    table.roll("Ann")
+    first = list(table.dice)
+    table.roll("Ann", [True, 1, False, 0, True])
+    assert [table.dice[i] for i in (0, 1, 4)] == [first[i] for i in (0, 1, 4)]
+
+
+@pytest.mark.parametrize("held", [5, "TTFFT", [True] * 4, [True] * 6,
+                                  [2, 0, 0, 0, 0], [None] * 5, [0.0] * 5])
+def test_malformed_held_is_a_rule_error(table, held):
+    table.roll("Ann")
+    with pytest.raises(RuleError):
+        table.roll("Ann", held)
+
+
+@pytest.mark.parametrize("row", [True, False, "0", 1.0, None, [0]])
+def test_non_integer_row_is_a_rule_error(table, row):
+    table.roll("Ann")
+    with pytest.raises(RuleError):
+        table.claim("Ann", row)
+
+
+def test_claimed_row_cannot_be_claimed_again(table):
+    table.roll("Ann")
+    table.claim("Ann", 16)
+    table.roll("Bob")
+    table.claim("Bob", 16)
+    table.roll("Ann")
+    with pytest.raises(RuleError):
+        table.claim("Ann", 16)
+
+
+def test_claim_before_roll(table):
+    with pytest.raises(RuleError):
+        table.claim("Ann", 16)
+
+
+# ------------------------------------------------------------- messages --
+def test_create_and_state(server):
+    s = FakeSession()
+    reply = ask(server, s, {"op": "create", "players": ["Ann", "Bob"], "id": 7})
+    assert reply["ok"] and reply["id"] == 7
+    state = ask(server, s, {"op": "state", "table": reply["table"]})
+    assert state["ok"]
+
+
+@pytest.mark.parametrize("msg", [
+    "not json", "[1, 2]", "42",
+    {"op": "nope"}, {"op": 5}, {},
+    {"op": "state"}, {"op": "state", "table": "t999"},
+    {"op": "state", "table": [1]}, {"op": "join", "table": {"a": 1}},
+    {"op": "roll", "table": 3}, {"op": "claim", "table": None, "row": 0},
+    {"op": "create", "players": []}, {"op": "create", "players": ["A", "A"]},
+    {"op": "create", "players": [1, 2]}, {"op": "create", "players": ["x"] * 9},
+])
+def test_malformed_messages_get_an_error_reply(server, msg):
+    s = FakeSession()
+    reply = ask(server, s, msg)
+    assert reply["ok"] is False and reply["error"]
+    assert server.stats["errors"] == 1
+
+
+def test_malformed_roll_and_claim_through_messages(server):
+    s = FakeSession()
+    tid = ask(server, s, {"op": "create", "players": ["Ann"]})["table"]
+    assert ask(server, s, {"op": "roll", "table": tid, "player": "Ann", "held": 5})["ok"]
+    for msg in ({"op": "roll", "table": tid, "player": "Ann", "held": {"a": 1}},
+                {"op": "claim", "table": tid, "player": "Ann", "row": True},
+                {"op": "claim", "table": tid, "player": "Ann", "row": "16"}):
+        assert ask(server, s, msg)["ok"] is False
+
+
+def test_connection_survives_bad_messages(server):
+    async def run():
+        srv  = await asyncio.start_server(server.handle_tcp, "127.0.0.1", 0,
+                                          limit=MAX_LINE_BYTES)
+        port = srv.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        replies = []
+        for msg in ({"op": "state", "table": [1]}, {"op": "state", "table": {}},
+                    {"op": "create", "players": ["Ann"]}):
+            writer.write(json.dumps(msg).encode() + b"\n")
+            await writer.drain()
+            replies.append(json.loads(await asyncio.wait_for(reader.readline(), 5)))
+        writer.close()
+        srv.close()
+        await srv.wait_closed()
+        return replies
+
+    replies = asyncio.run(run())
+    assert [r["ok"] for r in replies] == [False, False, True]
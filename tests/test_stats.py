@@ -0,0 +1,176 @@
+"""Running player statistics in yahtzii_stats: sketches, aggregates, the book."""
+
+import random
+import statistics
+
+import pytest
+
+from yahtzii_io import write_json_atomic
+from yahtzii_stats import PlayerAggregate, QuantileSketch, StatsBook
+
+
+def nearest_rank(values, q):
+    """The value QuantileSketch.quantile() promises while its width is 1."""
+    values = sorted(values)
+    return values[int(q * (len(values) - 1))]
+
+
+@pytest.fixture
+def scores():
+    rnd = random.Random(7)
+    return [rnd.randint(40, 420) for _ in range(500)]
+
+
+# ============================================================================
+# QUANTILE SKETCH
+# ============================================================================
+def test_sketch_is_exact_at_width_one(scores):
+    sketch = QuantileSketch()
+    for s in scores:
+        sketch.add(s)
+    assert sketch.width == 1 and sketch.count == len(scores)
+    for q in (0.0, 0.1, 0.25, 0.5, 0.9, 0.99, 1.0):
+        assert sketch.quantile(q) == nearest_rank(scores, q)
+
+
+def test_empty_sketch_has_no_quantile():
+    assert QuantileSketch().quantile(0.5) is None
+
+
+def test_widen_halves_buckets_and_keeps_count():
+    sketch = QuantileSketch()
+    for v in (0, 1, 2, 3, 7):
+        sketch.add(v)
+    sketch._widen()
+    assert sketch.width == 2
+    assert sketch.bins == {0: 2, 1: 2, 3: 1}
+    assert sketch.count == 5 and sum(sketch.bins.values()) == 5
+
+
+def test_sketch_widens_past_max_bins(monkeypatch):
+    monkeypatch.setattr(QuantileSketch, "MAX_BINS", 16)
+    sketch = QuantileSketch()
+    for v in range(100):
+        sketch.add(v)
+    assert len(sketch.bins) <= 16 and sketch.width == 8
+    assert sketch.count == 100
+    assert abs(sketch.quantile(0.5) - nearest_rank(range(100), 0.5)) <= sketch.width / 2
+
+
+def test_merge_matches_one_sketch_over_both_halves(scores):
+    left, right, whole = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    for i, s in enumerate(scores):
+        (left if i % 2 else right).add(s)
+        whole.add(s)
+    left.merge(right)
+    assert (left.width, left.bins, left.count) == (whole.width, whole.bins, whole.count)
+
+
+def test_merge_widens_to_the_coarser_sketch():
+    fine, coarse = QuantileSketch(), QuantileSketch()
+    for v in range(10):
+        fine.add(v)
+        coarse.add(v)
+    coarse._widen()
+    coarse._widen()
+    fine.merge(coarse)
+    assert fine.width == 4 and fine.count == 20
+    assert fine.bins == {0: 8, 1: 8, 2: 4}
+
+
+def test_sketch_json_round_trip(scores):
+    sketch = QuantileSketch()
+    for s in scores:
+        sketch.add(s)
+    sketch._widen()
+    back = QuantileSketch.from_json(sketch.to_json())
+    assert (back.width, back.bins, back.count) == (sketch.width, sketch.bins, sketch.count)
+
+
+# ============================================================================
+# PLAYER AGGREGATE
+# ============================================================================
+def test_welford_matches_statistics(scores):
+    agg = PlayerAggregate()
+    for s in scores:
+        agg.add(s)
+    assert agg.games == len(scores)
+    assert agg.mean == pytest.approx(statistics.fmean(scores))
+    assert agg.stdev == pytest.approx(statistics.stdev(scores))
+    assert agg.m2 == pytest.approx(statistics.variance(scores) * (len(scores) - 1))
+    assert (agg.best, agg.worst) == (max(scores), min(scores))
+    assert agg.percentile(50) == nearest_rank(scores, 0.5)
+
+
+def test_stdev_needs_two_games():
+    agg = PlayerAggregate()
+    assert agg.stdev == 0.0 and agg.bonus_rate == 0.0
+    agg.add(250)
+    assert agg.stdev == 0.0 and agg.mean == 250
+
+
+def test_yahtziis_and_bonus_rate():
+    agg = PlayerAggregate()
+    agg.add(300, yahtziis=2, bonus=True)
+    agg.add(150, yahtziis=0, bonus=False)
+    agg.add(260, yahtziis=1, bonus=True)
+    assert agg.yahtziis == 3
+    assert agg.bonuses == 2
+    assert agg.bonus_rate == pytest.approx(2 / 3)
+
+
+def test_aggregate_json_round_trip(scores):
+    agg = PlayerAggregate()
+    for s in scores[:50]:
+        agg.add(s, yahtziis=s % 2, bonus=s > 200)
+    back = PlayerAggregate.from_json(agg.to_json())
+    assert back.to_json() == agg.to_json()
+
+
+# ============================================================================
+# STATS BOOK
+# ============================================================================
+CARD = {0: 3, 1: 6, 2: 9, 3: 12, 4: 15, 5: 18,      # upper 63 -> bonus
+        9: 20, 10: 0, 11: 25, 12: 30, 13: 0, 14: 50, 15: 1, 16: 22}
+
+
+def test_record_card_folds_totals_and_yahtziis():
+    book = StatsBook()
+    book.record_card("Ann", CARD)
+    agg = book.players["Ann"]
+    assert agg.games == 1
+    assert agg.best == 63 + 35 + 147 + 100
+    assert agg.yahtziis == 2
+    assert agg.bonuses == 1
+
+
+def test_record_game_accepts_string_rows():
+    book = StatsBook()
+    book.record_game({"players": ["Ann", "Bob"],
+                      "cards": [{str(r): v for r, v in CARD.items()}, {"16": 5}]})
+    assert book.players["Ann"].best == 345
+    assert book.players["Bob"].best == 5 and book.players["Bob"].yahtziis == 0
+
+
+def test_book_round_trips_through_the_score_file(tmp_path):
+    path = str(tmp_path / "player_stats.json")
+    book = StatsBook(path)
+    book.record_card("Ann", CARD)
+    book.record_card("Ann", {16: 17})
+    write_json_atomic(path, book.to_json())
+    back = StatsBook.load(path)
+    assert back.path == path
+    assert back.to_json() == book.to_json()
+
+
+@pytest.mark.parametrize("content", ["", "not json", "[]", '{"players": 3}',
+                                     '{"players": {"Ann": {"games": 1}}}'])
+def test_damaged_book_loads_empty(tmp_path, content):
+    path = tmp_path / "player_stats.json"
+    path.write_text(content, encoding="utf-8")
+    book = StatsBook.load(str(path))
+    assert not book and book.path == str(path)
+
+
+def test_missing_book_loads_empty(tmp_path):
+    assert not StatsBook.load(str(tmp_path / "missing.json"))
@@ -13,8 +13,15 @@ import time
 import math
 import json
 import os
+import argparse
+import asyncio
+import atexit
+import threading
+import heapq
+import selectors
+import socket
 from datetime import datetime
-from collections import Counter, defaultdict
+from collections import defaultdict, deque
 
 SCORES_DIR = "scores"
 
@@ -29,12 +36,278 @@ from PyQt6.QtWidgets import (
     QTextEdit, QStatusBar, QCheckBox, QFrame, QProgressBar,
     QSizePolicy,
 )
-from PyQt6.QtCore import Qt, QTimer, QEventLoop, QByteArray, QElapsedTimer, QRectF
+from PyQt6.QtCore import (
+    Qt, QTimer, QEventLoop, QByteArray, QElapsedTimer, QRectF, QPointF, QObject, QEvent,
+    QSocketNotifier, pyqtSignal,
+)
 from PyQt6.QtGui import (
     QColor, QFont, QBrush, QPainter, QPen, QPalette, QPixmap, QLinearGradient,
+    QPolygonF, QShortcut, QKeySequence,
 )
 from PyQt6.QtSvgWidgets import QSvgWidget
 from PyQt6.QtSvg import QSvgRenderer
+from PyQt6.QtNetwork import QLocalServer
+
+from yahtzii_rules import (
+    UPPER_SECTION, LOWER_SECTION_PRIMARY, FIXED_SCORE_ROWS, CALCULATED_ROWS,
+    PRIMARY_CATEGORIES, ROW_LABELS, next_player_index,
+    CATEGORY_BIT, CATEGORY_INDEX, ALL_MASK, LOWER_MASK,
+    legal_moves, rows_in, best_hint,
+    roller_score as _roller_score,
+)
+from yahtzii_stats import StatsBook, EloRatings, SessionStats
+from yahtzii_perf import COUNTERS, FrameStats, StallWatchdog, Tracer
+from yahtzii_io import io_worker, read_json, remove_file, write_json_atomic
+from yahtzii_strategy import (
+    PlayerState, win_tally, win_trial, projection, projection_ready, projection_tables,
+    regret_report,
+)
+
+# ============================================================================
+# SCORE FILES
+# ============================================================================
+AUTOSAVE_FILE = "autosave.json"
+
+
+_AUTOSAVE_FIELDS = {        # key: accepted type(s), as YahtzeeScorecard._snapshot writes them
+    "saved": str, "players": list, "digital": bool, "theme": (str, type(None)),
+    "colored_dice": bool, "turn": int, "cards": list, "joker": bool,
+    "dice": (list, type(None)), "correction": list, "clock_ms": list, "streak": list,
+    "last_msg": str, "turn_log": list, "turn_rolls": list, "proj_history": list,
+}
+
+
+def load_autosave():
+    """
+    The unfinished game in scores/autosave.json, or None.  A truncated,
+    older or otherwise damaged snapshot is ignored rather than resumed.
+    """
+    snap = read_json(os.path.join(SCORES_DIR, AUTOSAVE_FILE))
+    if (not isinstance(snap, dict) or snap.get("version") != 1
+            or any(k not in snap or not isinstance(snap[k], t)
+                   for k, t in _AUTOSAVE_FIELDS.items())):
+        return None
+    players, cards = snap["players"], snap["cards"]
+    if (not 1 <= len(players) <= 8 or not all(isinstance(p, str) and p for p in players)
+            or len(cards) != len(players) or len(snap["proj_history"]) != len(players)
+            or not 0 <= snap["turn"] < len(players)
+            or any(len(snap[k]) != 2 for k in ("correction", "streak", "clock_ms"))
+            or not all(type(ms) is int for ms in snap["clock_ms"])
+            or (snap["dice"] is not None and not _valid_dice(snap["dice"]))
+            or not all(_valid_card(card) for card in cards)
+            or not all(isinstance(h, dict) for h in snap["proj_history"])):
+        return None
+    return snap
+
+
+def _valid_dice(dice) -> bool:
+    return len(dice) == 5 and all(type(d) is int and 1 <= d <= 6 for d in dice)
+
+
+def _valid_card(card) -> bool:
+    """A saved {row: score} card: claimed primary rows plus the bonus count in "15"."""
+    if not isinstance(card, dict):
+        return False
+    for key, v in card.items():
+        if type(v) is not int or not key.isdigit():
+            return False
+        if int(key) not in CATEGORY_BIT and int(key) != 15:
+            return False
+    return True
+
+
+def load_stats_book():
+    """
+    The running player stats in scores/player_stats.json.  The first time,
+    they are back-filled from the game archive if there is one.
+    """
+    path = score_path("player_stats.json")
+    book = StatsBook.load(path)
+    if not book and not os.path.exists(path) and os.path.isdir(score_path("archive")):
+        try:
+            from yahtzii_archive import GameArchive
+            for game in GameArchive(score_path("archive")).iter_games():
+                book.record_game(game)
+        except (ImportError, OSError, ValueError):
+            pass
+    return book
+
+
+def load_ratings():
+    """
+    Player ratings in scores/ratings.json.  The first time, they are
+    rebuilt by replaying the game archive if there is one.
+    """
+    path = score_path("ratings.json")
+    elo  = EloRatings.load(path)
+    if not elo and not os.path.exists(path) and os.path.isdir(score_path("archive")):
+        try:
+            from yahtzii_archive import GameArchive
+            elo = EloRatings.replay(GameArchive(score_path("archive")).iter_rankings(), path)
+        except (ImportError, OSError, ValueError):
+            pass
+    return elo
+
+
+def rating_text(elo, name: str) -> str:
+    if elo is None:
+        return "⭐ …"      # ratings still loading
+    r = elo.rating(name)
+    return "⭐ new" if r is None else f"⭐ {r:.0f}"
+
+
+HIGH_SCORES_FILE = "yahtzee_highscores.json"
+LOW_SCORES_FILE  = "yahtzee_lowscores.json"
+
+
+def write_game_record(game: dict, now: datetime):
+    """
+    Append a finished game to the columnar archive in scores/archive/, or
+    to scores/games/ as one JSON file when NumPy is not installed.
+    """
+    try:
+        from yahtzii_archive import GameArchive
+    except ImportError:
+        GameArchive = None
+    if GameArchive is not None:
+        try:
+            GameArchive(score_path("archive")).append([game])
+            return
+        except OSError:
+            pass
+    os.makedirs(score_path("games"), exist_ok=True)
+    write_json_atomic(score_path(os.path.join("games", now.strftime("%Y%m%d-%H%M%S.json"))), game)
+
+
+def _score_rows(data) -> list:
+    """The well-formed entries of a score board file; anything else is dropped."""
+    if not isinstance(data, list):
+        return []
+    return [e for e in data if isinstance(e, dict) and isinstance(e.get("name"), str)
+            and type(e.get("score")) is int]
+
+
+class ScoreStore(QObject):
+    """
+    In-memory copy of the score boards, player stats and ratings.
+
+    The files are read once, on the I/O worker, and the GUI thread never
+    waits for them: when_loaded() runs a callback once the data is in (at
+    once, if it already is), and updates made earlier are queued the same
+    way, in order.  Every update changes the cache and queues a
+    write-behind snapshot of the file it touched.  wait() blocks until the
+    load is done; it is for tools and benchmarks, not the GUI.
+    """
+
+    KEEP = 10       # entries on each score board
+
+    _ready = pyqtSignal()      # emitted on the I/O worker, delivered on the GUI thread
+
+    def __init__(self):
+        super().__init__()
+        self.high     = []
+        self.low      = []
+        self.book     = None
+        self.ratings  = None
+        self._paths   = {}
+        self._loaded  = threading.Event()
+        self._lock    = threading.Lock()
+        self._pending = []     # callbacks waiting for the load, oldest first
+        self._ready.connect(self._deliver)
+        io_worker().submit(("load", id(self)), self._load)
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded.is_set()
+
+    def _load(self):
+        # A damaged file costs only its own contents: the rest still loads,
+        # and book / ratings are never left as None.
+        try:
+            for board, filename in (("high", HIGH_SCORES_FILE), ("low", LOW_SCORES_FILE)):
+                path = self._paths[board] = score_path(filename)
+                rows = _score_rows(read_json(path, []))
+                setattr(self, board, sorted(rows, key=lambda x: x["score"],
+                                            reverse=board == "high")[:self.KEEP])
+            try:
+                self.book = load_stats_book()
+            except Exception:
+                self.book = StatsBook(score_path("player_stats.json"))
+            try:
+                self.ratings = load_ratings()
+            except Exception:
+                self.ratings = EloRatings(score_path("ratings.json"))
+        finally:
+            with self._lock:
+                self._loaded.set()
+            self._ready.emit()
+
+    def wait(self) -> "ScoreStore":
+        self._loaded.wait()
+        return self
+
+    def when_loaded(self, callback):
+        """Run callback(store) on the GUI thread once the files are loaded."""
+        with self._lock:
+            if not self._loaded.is_set() or self._pending:
+                self._pending.append(callback)
+                return
+        callback(self)
+
+    def _deliver(self):
+        while self._pending:
+            self._pending.pop(0)(self)
+
+    def add_score(self, board: str, name: str, score: int):
+        """Enter a score on the "high" or "low" board, keeping the best KEEP."""
+        entry = {"name": name, "score": score, "date": datetime.now().strftime("%Y-%m-%d")}
+
+        def enter(store):
+            rows = sorted(getattr(store, board) + [entry], key=lambda x: x["score"],
+                          reverse=board == "high")[:store.KEEP]
+            setattr(store, board, rows)
+            store._write(store._paths[board], rows, indent=4)
+
+        self.when_loaded(enter)
+
+    def record_cards(self, cards):
+        """Fold finished (name, card) pairs into the player stats."""
+        cards = list(cards)
+
+        def fold(store):
+            for name, card in cards:
+                store.book.record_card(name, card)
+            store._write(store.book.path, store.book.to_json())
+
+        self.when_loaded(fold)
+
+    def rate(self, ranking):
+        ranking = list(ranking)
+
+        def update(store):
+            store.ratings.update(ranking)
+            store._write(store.ratings.path, store.ratings.to_json())
+
+        self.when_loaded(update)
+
+    def record_game(self, game: dict, now: datetime):
+        io_worker().submit(("game", id(game)), lambda: write_game_record(game, now))
+
+    @staticmethod
+    def _write(path, data, indent=None):
+        io_worker().submit(path, lambda: write_json_atomic(path, data, indent))
+
+
+_store = None
+
+
+def score_store() -> ScoreStore:
+    """The process-wide score cache, loading in the background from first use."""
+    global _store
+    if _store is None:
+        _store = ScoreStore()
+    return _store
+
 
 # ============================================================================
 # THEME — Midnight Steel (scorecard)
@@ -101,6 +374,11 @@ DARK_STYLESHEET = f"""
 # QMenu is fully styleable; QComboBox popups ignore stylesheets on Linux.
 # ============================================================================
 class ScoreButton(QPushButton):
+    # Popup menus are shared by every ScoreButton: one per option list and
+    # theme colours, built on first click and reused after that.  There are
+    # only a few dozen option lists, so the cache stays small.
+    _menus = {}   # (options, accent, bg) -> QMenu
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._options   = []
@@ -116,6 +394,7 @@ class ScoreButton(QPushButton):
         self.clicked.connect(self._show_menu)
 
     def addItems(self, items):
+        COUNTERS.bump("ScoreButton option rebuilds")
         self._options = list(items)
         self._current = self._options[0] if self._options else "-"
         self._refresh_text()
@@ -170,26 +449,34 @@ class ScoreButton(QPushButton):
     def _refresh_text(self):
         self.setText(f"{self._current}  ▾")
 
+    def _menu(self) -> QMenu:
+        key  = (tuple(self._options), self._accent, self._bg)
+        menu = ScoreButton._menus.get(key)
+        if menu is None:
+            COUNTERS.bump("ScoreButton menus built")
+            menu = QMenu()
+            menu.setStyleSheet(f"""
+                QMenu {{
+                    background-color: {self._bg};
+                    color: #F1F5F9;
+                    border: 1px solid {self._accent};
+                    padding: 2px;
+                }}
+                QMenu::item {{ padding: 4px 16px; min-width: 60px; }}
+                QMenu::item:selected {{
+                    background-color: {self._accent};
+                    color: #000000;
+                }}
+            """)
+            for opt in self._options:
+                menu.addAction(opt).setData(opt)
+            ScoreButton._menus[key] = menu
+        return menu
+
     def _show_menu(self):
         if not self._options or not self.isEnabled():
             return
-        menu = QMenu(self)
-        menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: {self._bg};
-                color: #F1F5F9;
-                border: 1px solid {self._accent};
-                padding: 2px;
-            }}
-            QMenu::item {{ padding: 4px 16px; min-width: 60px; }}
-            QMenu::item:selected {{
-                background-color: {self._accent};
-                color: #000000;
-            }}
-        """)
-        for opt in self._options:
-            menu.addAction(opt).setData(opt)
-        chosen = menu.exec(self.mapToGlobal(self.rect().bottomLeft()))
+        chosen = self._menu().exec(self.mapToGlobal(self.rect().bottomLeft()))
         if chosen is not None:
             new_text = chosen.data()
             old_idx  = self.findText(self._current)
@@ -200,23 +487,6 @@ class ScoreButton(QPushButton):
                 self._on_change(new_idx, self)
 
 
-# ============================================================================
-# SCORECARD CONSTANTS
-# ============================================================================
-UPPER_SECTION        = [0, 1, 2, 3, 4, 5]
-LOWER_SECTION_PRIMARY= [9, 10, 11, 12, 13, 16]
-FIXED_SCORE_ROWS     = {11: 25, 12: 30, 13: 40, 14: 50}
-CALCULATED_ROWS      = [6, 7, 8, 17, 18]
-PRIMARY_CATEGORIES   = [0, 1, 2, 3, 4, 5, 9, 10, 11, 12, 13, 14, 16]
-
-ROW_LABELS = (
-    ["Ones", "Twos", "Threes", "Fours", "Fives", "Sixes"] +
-    ["Sum", "Bonus (35)", "Total Upper"] +
-    ["3 of a Kind", "4 of a Kind", "Full House", "Small Straight",
-     "Large Straight", "Yahtzii", "Yahtzii Bonus (Count)", "Chance"] +
-    ["Total Lower", "GRAND TOTAL"]
-)
-
 # ============================================================================
 # ROLLER SVG DATA  (inline — no external files needed)
 # ============================================================================
@@ -257,18 +527,44 @@ def _load_die_svg(face: int, color: str) -> bytes:
     try:
         with open(path, "r", encoding="utf-8") as f:
             svg = f.read()
+        COUNTERS.bump("_load_die_svg file reads")
         svg = svg.replace('fill="#000000"', f'fill="{color}"')
         svg = svg.replace("fill='#000000'", f"fill='{color}'")
         return svg.encode("utf-8")
     except FileNotFoundError:
+        COUNTERS.bump("_load_die_svg inline fallbacks")
         return _make_roller_svg(face, color)
 
 
+_DIE_FACE_PIXMAPS = {}   # (face, dot colour) -> QPixmap, shared by every DieWidget
+
+def _die_face_pixmap(face: int, dot_color: str = "#ffffff") -> QPixmap:
+    """The roller's die face rasterized once per process instead of on every paint."""
+    pix = _DIE_FACE_PIXMAPS.get((face, dot_color))
+    if pix is None:
+        COUNTERS.bump("SVG renders")
+        renderer = QSvgRenderer(QByteArray(_make_roller_svg(face, dot_color)))
+        pix = QPixmap(DieWidget.SIZE, DieWidget.SIZE)
+        pix.fill(Qt.GlobalColor.transparent)
+        pp = QPainter(pix)
+        pp.setRenderHint(QPainter.RenderHint.Antialiasing)
+        renderer.render(pp)
+        pp.end()
+        _DIE_FACE_PIXMAPS[(face, dot_color)] = pix
+    return pix
+
+
+def prerender_die_faces(dot_color: str = "#ffffff"):
+    for face in _ROLLER_SVG_PATHS:
+        _die_face_pixmap(face, dot_color)
+
+
 # ============================================================================
 # ROLLER — DieWidget
 # ============================================================================
 class DieWidget(QWidget):
     SIZE = 80
+    frame_stats = None     # the owning roller's FrameStats, set in _build_ui
 
     def __init__(self, index: int, parent=None):
         super().__init__(parent)
@@ -335,6 +631,9 @@ class DieWidget(QWidget):
         return svg.encode()
 
     def _render_face(self, face: int, dot_color: str) -> QPixmap:
+        if not self.blank:
+            return _die_face_pixmap(face, dot_color)
+        COUNTERS.bump("SVG renders")
         renderer = QSvgRenderer(QByteArray(self._svg_bytes(face, dot_color)))
         pix = QPixmap(self.SIZE, self.SIZE)
         pix.fill(Qt.GlobalColor.transparent)
@@ -346,6 +645,7 @@ class DieWidget(QWidget):
 
     # ---------------------------------------------------------------- paint --
     def paintEvent(self, event):
+        t0 = time.perf_counter()
         p = QPainter(self)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
         p.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
@@ -510,6 +810,9 @@ class DieWidget(QWidget):
                 p.setOpacity(opacity)
             p.drawPixmap(draw_x, draw_y, draw_w, draw_h, pix)
             p.restore()
+        p.end()
+        if self.frame_stats is not None:
+            self.frame_stats.paint(time.perf_counter() - t0)
 
     # ---------------------------------------------------------------- state --
     def set_face(self, face: int, held: bool = False, rolling: bool = False,
@@ -575,61 +878,6 @@ class RollerHistoryRow(QWidget):
         self.setStyleSheet("background: rgba(255,255,255,0.05); border-radius: 8px;")
 
 
-# ============================================================================
-# ROLLER — quick-score helper
-# ============================================================================
-def _roller_score(dice):
-    """
-    Return the highest actual scorecard field available for this roll.
-
-    This intentionally uses only real scorecard categories:
-    Upper section, 3/4 of a Kind, Full House, Small/Large Straight,
-    Yahtzii, and Chance.
-    """
-    counts = Counter(dice)
-    total  = sum(dice)
-    vals   = sorted(counts.values(), reverse=True)
-    uniq   = sorted(set(dice))
-
-    candidates = []
-
-    def add(label, score, priority):
-        candidates.append((score, priority, label))
-
-    # Upper section
-    upper_names = ["Ones", "Twos", "Threes", "Fours", "Fives", "Sixes"]
-    for face in range(1, 7):
-        add(upper_names[face - 1], counts[face] * face, 10 + face)
-
-    # Lower section
-    max_count = vals[0] if vals else 0
-
-    if max_count >= 3:
-        add("3 of a Kind", total, 40)
-
-    if max_count >= 4:
-        add("4 of a Kind", total, 50)
-
-    if max_count == 5:
-        add("Yahtzii", 50, 90)
-
-    if max_count == 3 and len(vals) > 1 and vals[1] == 2:
-        add("Full House", 25, 60)
-
-    if any(all(s in uniq for s in seq) for seq in [(1,2,3,4), (2,3,4,5), (3,4,5,6)]):
-        add("Small Straight", 30, 70)
-
-    if uniq in [[1,2,3,4,5], [2,3,4,5,6]]:
-        add("Large Straight", 40, 80)
-
-    # Chance is always available.
-    add("Chance", total, 30)
-
-    # Highest score wins. Priority breaks ties in favor of more specific fields.
-    best_score, _, best_label = max(candidates, key=lambda x: (x[0], x[1]))
-    return (best_label, best_score)
-
-
 # ============================================================================
 # ROLLER — Main widget
 # ============================================================================
@@ -667,6 +915,7 @@ class YahtzeeRollerWidget(QWidget):
         self.current_player = ""   # set by prepare_for_player in scorecard mode
         self.on_turn_done  = None   # callable(dice)
         self.score_hint_provider = None   # optional callable(dice) -> (label, pts)
+        self.frame_stats   = FrameStats(self.TICK_MS)
 
         self._build_ui()
         self._apply_theme()
@@ -743,6 +992,7 @@ class YahtzeeRollerWidget(QWidget):
         self.die_widgets = []
         for i in range(5):
             dw = DieWidget(i)
+            dw.frame_stats = self.frame_stats
             dw.clicked_signal = (lambda idx=i: lambda: self._toggle_hold(idx))()
             self.die_widgets.append(dw)
             dice_row.addWidget(dw)
@@ -852,6 +1102,21 @@ class YahtzeeRollerWidget(QWidget):
         self._pulse_timer.timeout.connect(self._tick_pulse)
         self._pulse_timer.start()
 
+        # Frame-time HUD (F3), CSV export of its histograms (Shift+F3)
+        self.frame_hud = QLabel(self)
+        self.frame_hud.setFont(QFont("monospace", 9))
+        self.frame_hud.setStyleSheet(
+            "color: #e5e7eb; background: rgba(0,0,0,0.75); border-radius: 6px; padding: 6px;"
+        )
+        self.frame_hud.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.frame_hud.move(8, 8)
+        self.frame_hud.hide()
+        self._hud_timer = QTimer(self)
+        self._hud_timer.setInterval(250)
+        self._hud_timer.timeout.connect(self._refresh_frame_hud)
+        QShortcut(QKeySequence("F3"), self, self.toggle_frame_hud)
+        QShortcut(QKeySequence("Shift+F3"), self, self.export_frame_stats)
+
     # --------------------------------------------------------------- theme --
     def _apply_theme(self):
         th  = _ROLLER_THEMES[self.current_theme]
@@ -911,6 +1176,9 @@ class YahtzeeRollerWidget(QWidget):
     # on_theme_changed is set by the scorecard; default is a no-op
     on_theme_changed = lambda self, name: None
 
+    # on_roll_event is set by the scorecard; default is a no-op
+    on_roll_event = lambda self, kind, fields: None
+
     # --------------------------------------------------------------- dice ---
     def _update_dice_display(self):
         accent  = _ROLLER_THEMES[self.current_theme]["accent"]
@@ -931,6 +1199,8 @@ class YahtzeeRollerWidget(QWidget):
             return
         self.held[i] = not self.held[i]
         self._update_dice_display()
+        if callable(self.on_roll_event):
+            self.on_roll_event("hold", {"held": list(self.held)})
 
     def _roll_free_dice(self):
         for i in range(5):
@@ -953,6 +1223,7 @@ class YahtzeeRollerWidget(QWidget):
     def _update_animation(self):
         now        = time.perf_counter()
         elapsed_ms = (now - self.start_time) * 1000
+        self.frame_stats.tick("charge" if self.state == "CHARGING" else "roll", now)
 
         if self.state == "CHARGING":
             t = min(elapsed_ms / self.CHARGE_DURATION, 1.0)
@@ -1104,6 +1375,11 @@ class YahtzeeRollerWidget(QWidget):
         self.rolls_left -= 1
         self._update_dice_display()
         self._update_roll_pips()
+        if callable(self.on_roll_event):
+            self.on_roll_event("roll", {
+                "dice": list(self.dice), "held": list(self.held),
+                "rolls_left": self.rolls_left,
+            })
 
         # Keep repainting for the landing bounce duration
         self._bounce_timer.start(self.TICK_MS)
@@ -1141,6 +1417,7 @@ class YahtzeeRollerWidget(QWidget):
         """Drives landing bounce, snap tween, and held pulse repaints after roll ends."""
         now      = time.perf_counter()
         all_done = True
+        self.frame_stats.tick("bounce", now)
 
         for dw in self.die_widgets:
             needs_update = False
@@ -1172,6 +1449,7 @@ class YahtzeeRollerWidget(QWidget):
 
         if all_done:
             self._bounce_timer.stop()
+            self.frame_stats.stop()
 
     def _tick_pulse(self):
         """Keeps held dice pulsing between rolls."""
@@ -1220,6 +1498,7 @@ class YahtzeeRollerWidget(QWidget):
     def _new_round(self):
         self.timer.stop()
         self._bounce_timer.stop()
+        self.frame_stats.stop()
         self._pulse_timer.start()  # keep pulsing for any held dice
         self.dice       = [random.randint(1, 6) for _ in range(5)]
         self.held       = [False] * 5
@@ -1240,6 +1519,29 @@ class YahtzeeRollerWidget(QWidget):
             self._update_dice_display()
         self._update_roll_pips()
 
+    # ------------------------------------------------------------ frame HUD --
+    def toggle_frame_hud(self):
+        if self.frame_hud.isVisible():
+            self._hud_timer.stop()
+            self.frame_hud.hide()
+            return
+        self._refresh_frame_hud()
+        self.frame_hud.show()
+        self.frame_hud.raise_()
+        self._hud_timer.start()
+
+    def _refresh_frame_hud(self):
+        self.frame_hud.setText("\n".join(
+            self.frame_stats.summary_lines() + ["F3 hide · Shift+F3 export CSV"]))
+        self.frame_hud.adjustSize()
+
+    def export_frame_stats(self, path: str = None) -> str:
+        """Write the frame / paint histograms to CSV (default scores/frames-<time>.csv)."""
+        path = path or score_path(f"frames-{datetime.now():%Y%m%d-%H%M%S}.csv")
+        self.frame_stats.write_csv(path)
+        self.status_label.setText(f"Frame stats saved to {path}")
+        return path
+
     # --------------------------------- scorecard integration ----------------
     def _confirm_dice(self):
         # Record history if the player finishes early (rolls_left > 0)
@@ -1355,6 +1657,8 @@ class PlayerSetupDialog(QDialog):
         self.setWindowTitle("Yahtzii Registration")
         self.setFixedSize(420, 650)
         self.player_inputs   = []
+        self._rating_labels  = []
+        self._ratings        = None     # until the score store has loaded
         self._selected_theme = initial_theme if initial_theme in _ROLLER_THEMES else "Classic"
         self._theme_btns     = {}
         layout = QVBoxLayout(self)
@@ -1386,8 +1690,7 @@ class PlayerSetupDialog(QDialog):
         btn_layout.addWidget(self.rem_btn)
         layout.addLayout(btn_layout)
 
-        for name in (prefill or [""]):
-            self.add_player_slot(name if name else "")
+        self._fill_slots(prefill)
 
         # ── Digital Roller ───────────────────────────────────────────────
         self.roller_frame = QFrame()
@@ -1448,6 +1751,34 @@ class PlayerSetupDialog(QDialog):
         layout.addWidget(self.next_btn)
 
         self._apply_theme(self._selected_theme)
+        score_store().when_loaded(self._ratings_loaded)
+
+    def reset(self, prefill=None, initial_theme="Classic"):
+        """Reuse this dialog for another registration instead of building a new one."""
+        while self.player_inputs:
+            label, entry = self.player_inputs.pop()
+            label.deleteLater()
+            entry.deleteLater()
+            self._rating_labels.pop().deleteLater()
+        while self.input_layout.count():
+            row = self.input_layout.takeAt(0).layout()
+            if row is not None:
+                row.deleteLater()
+        self._fill_slots(prefill)
+        self.use_roller_chk.setChecked(False)
+        self.colored_dice_chk.setChecked(False)
+        self._pick_theme(initial_theme if initial_theme in _ROLLER_THEMES else "Classic")
+        score_store().when_loaded(self._ratings_loaded)
+
+    def _ratings_loaded(self, store):
+        self._ratings = store.ratings
+        for (_, entry), rating in zip(self.player_inputs, self._rating_labels):
+            name = entry.text().strip()
+            rating.setText(rating_text(self._ratings, name) if name else "")
+
+    def _fill_slots(self, prefill):
+        for name in (prefill or [""]):
+            self.add_player_slot(name if name else "")
 
     def _pick_theme(self, name: str):
         self._selected_theme = name
@@ -1543,10 +1874,18 @@ class PlayerSetupDialog(QDialog):
         label = QLabel(f"Player {len(self.player_inputs) + 1}:")
         entry = QLineEdit()
         entry.setText(name)
+        rating = QLabel(rating_text(self._ratings, name.strip()) if name.strip() else "")
+        rating.setFixedWidth(64)
+        rating.setStyleSheet("color: #FBBF24; font-size: 11px;")
+        entry.textChanged.connect(
+            lambda text, lbl=rating: lbl.setText(
+                rating_text(self._ratings, text.strip()) if text.strip() else ""))
         row.addWidget(label)
         row.addWidget(entry)
+        row.addWidget(rating)
         self.input_layout.addLayout(row)
         self.player_inputs.append((label, entry))
+        self._rating_labels.append(rating)
 
     def remove_player_slot(self, checked=False):
         if len(self.player_inputs) <= 1:
@@ -1555,6 +1894,7 @@ class PlayerSetupDialog(QDialog):
         label, entry = self.player_inputs.pop()
         label.deleteLater()
         entry.deleteLater()
+        self._rating_labels.pop().deleteLater()
 
     def get_players(self):
         return [entry.text().strip() for _, entry in self.player_inputs if entry.text().strip()]
@@ -1574,15 +1914,6 @@ class RollOffDialog(QDialog):
         self.setWindowTitle("Roll-Off for Order")
         self.setMinimumWidth(620)
 
-        self.names             = names
-        self.player_scores     = {name: [] for name in names}
-        self.to_roll           = list(names)
-        self.sorted_names      = list(names)
-        self.animation_counter = 0
-        self._reveal_queue     = []
-        self._final_rolls      = {}
-        self._order_score      = {}
-
         outer = QVBoxLayout(self)
         outer.setSpacing(12)
         outer.setContentsMargins(20, 20, 20, 20)
@@ -1598,9 +1929,11 @@ class RollOffDialog(QDialog):
         self.info_lbl.setStyleSheet("color: #94A3B8; font-size: 11px;")
         outer.addWidget(self.info_lbl)
 
-        self.cards        = {}
-        self.dice_labels  = {}
-        self.score_labels = {}
+        self.cards         = {}
+        self.dice_labels   = {}
+        self.score_labels  = {}
+        self.rating_labels = {}
+        self._ratings      = None     # until the score store has loaded
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -1611,9 +1944,6 @@ class RollOffDialog(QDialog):
         scroll.setWidget(card_container)
         outer.addWidget(scroll)
 
-        for name in names:
-            self._build_card(name)
-
         self.btn_roll = QPushButton("🎲 Roll for All Players")
         self.btn_roll.setStyleSheet(accent_btn_style())
         self.btn_roll.clicked.connect(self.start_animation)
@@ -1626,7 +1956,49 @@ class RollOffDialog(QDialog):
 
         self.shake_timer  = QTimer(); self.shake_timer.timeout.connect(self._shake_tick)
         self.reveal_timer = QTimer(); self.reveal_timer.timeout.connect(self._reveal_next)
+        self.reset(names)
+
+    def reset(self, names):
+        """
+        Start a fresh roll-off for `names`, reusing this dialog.  Cards are
+        kept by player name, so returning players cost no rebuild.
+        """
+        self.shake_timer.stop()
+        self.reveal_timer.stop()
+        self.names             = names
+        self.player_scores     = {name: [] for name in names}
+        self.to_roll           = list(names)
+        self.sorted_names      = list(names)
+        self.animation_counter = 0
+        self._reveal_queue     = []
+        self._final_rolls      = {}
+        self._order_score      = {}
+
+        for name, card in self.cards.items():
+            self.card_layout.removeWidget(card)
+            card.setVisible(name in names)
+        for name in names:
+            if name not in self.cards:
+                self._build_card(name)
+            else:
+                self.card_layout.addWidget(self.cards[name])
+                for d in self.dice_labels[name]:
+                    d.load(QByteArray(_load_die_svg(1, "#1E2740")))
+                self.score_labels[name].setText("—")
+                self.rating_labels[name].setText(rating_text(self._ratings, name))
+                self._set_card_state(name, "idle")
+
+        self.info_lbl.setText("Roll to determine play order — highest total goes first.")
+        self.info_lbl.setStyleSheet("color: #94A3B8; font-size: 11px;")
+        self.btn_roll.setText("🎲 Roll for All Players")
+        self.btn_roll.setEnabled(True)
         self.adjustSize()
+        score_store().when_loaded(self._ratings_loaded)
+
+    def _ratings_loaded(self, store):
+        self._ratings = store.ratings
+        for name in self.names:
+            self.rating_labels[name].setText(rating_text(self._ratings, name))
 
     def _build_card(self, name):
         card = QWidget()
@@ -1637,10 +2009,16 @@ class RollOffDialog(QDialog):
         row.setContentsMargins(12, 10, 12, 10)
         row.setSpacing(14)
 
+        name_col = QVBoxLayout()
+        name_col.setSpacing(0)
         name_lbl = QLabel(name)
         name_lbl.setFont(QFont("Arial", 12, QFont.Weight.Bold))
         name_lbl.setFixedWidth(120)
-        row.addWidget(name_lbl)
+        name_col.addWidget(name_lbl)
+        rating_lbl = QLabel(rating_text(self._ratings, name))
+        rating_lbl.setStyleSheet("color: #FBBF24; font-size: 10px; border: none; padding: 0;")
+        name_col.addWidget(rating_lbl)
+        row.addLayout(name_col)
 
         dice_row = QHBoxLayout()
         dice_row.setSpacing(0)
@@ -1666,9 +2044,10 @@ class RollOffDialog(QDialog):
         row.addWidget(score_lbl)
 
         self.card_layout.addWidget(card)
-        self.cards[name]        = card
-        self.dice_labels[name]  = dice_widgets
-        self.score_labels[name] = score_lbl
+        self.cards[name]         = card
+        self.dice_labels[name]   = dice_widgets
+        self.score_labels[name]  = score_lbl
+        self.rating_labels[name] = rating_lbl
 
     def _set_card_state(self, name, state):
         styles = {
@@ -1784,22 +2163,35 @@ class ScoreBreakdownChart(QWidget):
     RIGHT_PAD   = 48
     TOP_PAD     = 28
     BOTTOM_PAD  = 16
+    PROJ_HEIGHT = 120
 
-    def __init__(self, player_data: dict, parent=None):
+    def __init__(self, player_data: dict, parent=None, projections=None,
+                 session_averages=None):
         """
         player_data: {player_name: [score_or_None, ...]} aligned to CHART_ROWS.
+        projections: optional {player_name: [projected_final_or_None, ...]}
+                     indexed by categories claimed (0..13); the last entry is
+                     the actual final score.
+        session_averages: optional {player_name: [average, ...]} aligned to
+                     CHART_ROWS, drawn as a tick on each bar.
         """
         super().__init__(parent)
         self._data    = player_data
         self._players = list(player_data.keys())
+        self._projections = projections or {}
+        self._session_avgs = session_averages or {}
         self._max_val = max(
             (v for scores in player_data.values() for v in scores if v is not None),
             default=50
         )
+        self._max_val = max([self._max_val] + [v for avgs in self._session_avgs.values()
+                                               for v in avgs if v is not None])
         n_rows  = len(CHART_ROWS)
         n_players = len(self._players)
         total_h = (self.TOP_PAD + self.BOTTOM_PAD +
                    n_rows * (n_players * self.BAR_HEIGHT + self.ROW_GAP))
+        if self._projections:
+            total_h += 20 + self.PROJ_HEIGHT
         self.setMinimumHeight(total_h)
         self.setMinimumWidth(460)
 
@@ -1813,6 +2205,29 @@ class ScoreBreakdownChart(QWidget):
         ("#FBBF24", "#FDE68A"),   # yellow
     ]
 
+    _row_labels = {}   # (players, device pixel ratio) -> QPixmap of the row-label column
+
+    @classmethod
+    def row_label_pixmap(cls, n_players: int, dpr: float = 1.0) -> QPixmap:
+        """The category labels down the left edge, drawn once per player count."""
+        pix = cls._row_labels.get((n_players, dpr))
+        if pix is None:
+            row_h = n_players * cls.BAR_HEIGHT + cls.ROW_GAP
+            pix   = QPixmap(int(cls.LEFT_PAD * dpr), int(len(CHART_ROWS) * row_h * dpr))
+            pix.setDevicePixelRatio(dpr)
+            pix.fill(Qt.GlobalColor.transparent)
+            p = QPainter(pix)
+            p.setRenderHint(QPainter.RenderHint.Antialiasing)
+            p.setPen(QColor("#94A3B8"))
+            p.setFont(QFont("Arial", 8))
+            for ri, label in enumerate(CHART_LABELS):
+                p.drawText(0, ri * row_h, cls.LEFT_PAD - 4, n_players * cls.BAR_HEIGHT,
+                           Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                           label)
+            p.end()
+            cls._row_labels[(n_players, dpr)] = pix
+        return pix
+
     def paintEvent(self, event):
         p = QPainter(self)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -1852,19 +2267,13 @@ class ScoreBreakdownChart(QWidget):
                    "LOWER")
 
         # ── rows ─────────────────────────────────────────────────────────
-        label_font = QFont("Arial", 8)
         val_font   = QFont("Arial", 7, QFont.Weight.Bold)
 
+        p.drawPixmap(0, self.TOP_PAD, self.row_label_pixmap(n_players, self.devicePixelRatioF()))
+
         for ri, label in enumerate(CHART_LABELS):
             y0 = row_top(ri)
 
-            # Row label
-            p.setPen(QColor("#94A3B8"))
-            p.setFont(label_font)
-            p.drawText(0, y0, self.LEFT_PAD - 4, n_players * self.BAR_HEIGHT,
-                       Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
-                       label)
-
             for pi, player in enumerate(self._players):
                 val = self._data[player][ri]
                 bar_y = y0 + pi * self.BAR_HEIGHT
@@ -1899,6 +2308,15 @@ class ScoreBreakdownChart(QWidget):
                            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
                            str(val))
 
+            # Session average ticks, over the bars
+            for pi, player in enumerate(self._players):
+                avg = self._session_avgs.get(player, [None] * len(CHART_ROWS))[ri]
+                if avg:
+                    bar_y  = y0 + pi * self.BAR_HEIGHT
+                    tick_x = self.LEFT_PAD + int(bar_area_w * avg / max(self._max_val, 1))
+                    p.setPen(QPen(QColor(self._PALETTES[pi % len(self._PALETTES)][1]), 2))
+                    p.drawLine(tick_x, bar_y + 1, tick_x, bar_y + self.BAR_HEIGHT - 1)
+
         # ── player legend ─────────────────────────────────────────────────
         legend_y = self.TOP_PAD + len(CHART_ROWS) * (n_players * self.BAR_HEIGHT + self.ROW_GAP) + 4
         lx = self.LEFT_PAD
@@ -1913,9 +2331,69 @@ class ScoreBreakdownChart(QWidget):
                        Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
                        player)
             lx += 14 + len(player) * 7 + 12
+        if self._session_avgs:
+            p.setPen(QColor("#94A3B8"))
+            p.setFont(QFont("Arial", 8))
+            p.drawText(lx, legend_y, 140, 14,
+                       Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                       "│ session average")
+
+        if self._projections:
+            self._paint_projections(p, legend_y + 20, w)
 
         p.end()
 
+    def _paint_projections(self, p, top, w):
+        """Projected final score after every claim, ending at the actual score."""
+        p.fillRect(0, top, w, self.PROJ_HEIGHT, QColor("#0D1525"))
+        p.setPen(QColor("#94A3B8"))
+        p.setFont(QFont("Arial", 9, QFont.Weight.Bold))
+        p.drawText(0, top, w, 18,
+                   Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter,
+                   "Projected vs Actual")
+
+        values = [v for hist in self._projections.values() for v in hist if v is not None]
+        if not values:
+            return
+        lo, hi  = min(values), max(values)
+        span    = max(hi - lo, 1)
+        plot_y  = top + 22
+        plot_h  = self.PROJ_HEIGHT - 30
+        plot_w  = w - self.LEFT_PAD - self.RIGHT_PAD
+        turns   = len(CHART_ROWS)
+
+        def point(n, v):
+            return QPointF(self.LEFT_PAD + plot_w * n / turns,
+                           plot_y + plot_h * (hi - v) / span)
+
+        p.setPen(QColor("#475569"))
+        p.setFont(QFont("Arial", 7))
+        for v in (hi, lo):
+            y = int(point(0, v).y())
+            p.drawText(0, y - 7, self.LEFT_PAD - 6, 14,
+                       Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                       f"{v:.0f}")
+
+        for pi, player in enumerate(self._players):
+            hist = self._projections.get(player) or []
+            pts  = [point(n, v) for n, v in enumerate(hist) if v is not None]
+            if not pts:
+                continue
+            clr_fill, clr_text = self._PALETTES[pi % len(self._PALETTES)]
+            p.setPen(QPen(QColor(clr_fill), 2))
+            p.setBrush(Qt.BrushStyle.NoBrush)
+            p.drawPolyline(QPolygonF(pts))
+            if hist[-1] is not None:
+                end = pts[-1]
+                p.setPen(Qt.PenStyle.NoPen)
+                p.setBrush(QColor(clr_fill))
+                p.drawEllipse(end, 3, 3)
+                p.setPen(QColor(clr_text))
+                p.setFont(QFont("Arial", 7, QFont.Weight.Bold))
+                p.drawText(int(end.x()) + 5, int(end.y()) - 7, self.RIGHT_PAD, 14,
+                           Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                           f"{hist[-1]:.0f}")
+
 
 class GameOverDialog(QDialog):
     SAME_ORDER = 1
@@ -1924,7 +2402,8 @@ class GameOverDialog(QDialog):
     NEW_GAME   = 3
     PLACE_MEDALS = {1: "🥇", 2: "🥈", 3: "🥉"}
 
-    def __init__(self, scores, parent=None, player_data=None):
+    def __init__(self, scores, parent=None, player_data=None, projections=None,
+                 regret=None, session=None):
         super().__init__(parent)
         self.setWindowTitle("Game Over!")
         self.setMinimumWidth(380)
@@ -1966,6 +2445,14 @@ class GameOverDialog(QDialog):
             row.addWidget(sl)
             layout.addWidget(rw)
 
+        # ── Session standings (from the second game of a run) ────────────
+        if session is not None and session.games > 1:
+            layout.addWidget(self._build_session_panel(session, [n for n, _ in scores]))
+
+        # ── Decision review (digital-roller turns only) ──────────────────
+        if regret is not None and regret.decisions:
+            layout.addWidget(self._build_regret_panel(regret))
+
         # ── Score breakdown chart ────────────────────────────────────────
         if player_data:
             toggle_btn = QPushButton("📊  Show Score Breakdown  ▾")
@@ -1979,7 +2466,10 @@ class GameOverDialog(QDialog):
             scroll = QScrollArea()
             scroll.setWidgetResizable(True)
             scroll.setStyleSheet("QScrollArea { border: 1px solid #1A2540; border-radius: 4px; }")
-            chart = ScoreBreakdownChart(player_data)
+            session_avgs = ({name: session.category_averages(name) for name in player_data}
+                            if session is not None and session.games > 1 else None)
+            chart = ScoreBreakdownChart(player_data, projections=projections,
+                                        session_averages=session_avgs)
             scroll.setWidget(chart)
             scroll.setFixedHeight(min(chart.minimumHeight() + 4, 340))
             scroll.setVisible(False)
@@ -2025,92 +2515,649 @@ class GameOverDialog(QDialog):
 
         self.adjustSize()
 
+    def _build_regret_panel(self, regret):
+        panel = QFrame()
+        panel.setStyleSheet(
+            "QFrame { background-color: #161B27; border: 1px solid #2E3F60; border-radius: 6px; }"
+            "QLabel { border: none; }"
+        )
+        lay = QVBoxLayout(panel)
+        lay.setContentsMargins(12, 8, 12, 8); lay.setSpacing(2)
+        title = QLabel("🔍  Decision Review — expected points given up")
+        title.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        title.setStyleSheet("color: #93C5FD;")
+        lay.addWidget(title)
+        totals = "  ·  ".join(f"{name} {lost:.1f}"
+                              for name, lost in sorted(regret.totals.items(), key=lambda x: x[1]))
+        tl = QLabel(totals)
+        tl.setStyleSheet("color: #CBD5E1; font-size: 11px;")
+        lay.addWidget(tl)
+        for d in regret.worst:
+            if d.regret < 0.5:
+                break
+            dl = QLabel(f"−{d.regret:.1f}  {self._describe_decision(d)}")
+            dl.setStyleSheet("color: #94A3B8; font-size: 10px;")
+            lay.addWidget(dl)
+        return panel
+
+    @staticmethod
+    def _build_session_panel(session, names):
+        panel = QFrame()
+        panel.setStyleSheet(
+            "QFrame { background-color: #161B27; border: 1px solid #2E3F60; border-radius: 6px; }"
+            "QLabel { border: none; }"
+        )
+        lay = QVBoxLayout(panel)
+        lay.setContentsMargins(12, 8, 12, 8); lay.setSpacing(2)
+        title = QLabel(f"📈  This Session — {session.games} games")
+        title.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        title.setStyleSheet("color: #93C5FD;")
+        lay.addWidget(title)
+        multi = len(names) > 1
+        for name in names:
+            agg  = session.players[name]
+            wins = session.wins.get(name, 0)
+            line = f"{name}: avg {agg.mean:.0f}  ·  best {agg.best}"
+            if multi:
+                line = f"{name}: {wins} win{'s' if wins != 1 else ''}  ·  avg {agg.mean:.0f}  ·  best {agg.best}"
+            nl = QLabel(line)
+            nl.setStyleSheet("color: #CBD5E1; font-size: 11px;")
+            lay.addWidget(nl)
+        if multi:
+            pairs = []
+            for i, a in enumerate(names):
+                for b in names[i + 1:]:
+                    wa, wb, d = session.head_to_head(a, b)
+                    pairs.append(f"{a} {wa}–{wb} {b}" + (f" ({d} tied)" if d else ""))
+            hl = QLabel("Head-to-head:  " + "  ·  ".join(pairs))
+            hl.setWordWrap(True)
+            hl.setStyleSheet("color: #94A3B8; font-size: 10px;")
+            lay.addWidget(hl)
+        return panel
+
+    @staticmethod
+    def _describe_decision(d):
+        faces = " ".join(str(f) for f in d.dice)
+        if d.kind == "claim":
+            return (f"{d.player}, turn {d.turn}: [{faces}] scored {ROW_LABELS[d.chosen]}"
+                    f" — {ROW_LABELS[d.best]} was better")
+        kept = " ".join(str(f) for f in d.chosen) or "nothing"
+        best = " ".join(str(f) for f in d.best) or "nothing"
+        return f"{d.player}, turn {d.turn}: [{faces}] kept {kept} — keep {best}"
+
     def _pick(self, choice):
         self.result_choice = choice
         self.accept()
 
 
 # ============================================================================
-# SCORECARD
+# SPECTATOR STREAM — delta-encoded game events over a local socket / named pipe
 # ============================================================================
-class YahtzeeScorecard(QMainWindow):
-    def __init__(self, players, use_digital_roller: bool = False, initial_theme: str = "Classic", colored_dice: bool = True):
-        super().__init__()
+class SpectatorHub:
+    """
+    Publishes game events to any number of local spectators.
 
-        # ── REQUIRED: all theme vars must exist before setup_board() ──
-        self._theme_accent    = CLR_ACCENT
-        self._theme_table_bg  = CLR_TABLE
-        self._theme_active    = CLR_ACTIVE_UNCLAIMED
-        self._theme_unclaimed = CLR_UNCLAIMED
-        self._theme_bg        = CLR_BACKGROUND
-        self._current_theme_name = initial_theme
+    Each event is one JSON line: {"seq": n, "ev": kind, "d": {changed keys}}.
+    The hub keeps the full flattened game state, so only keys whose value
+    changed are sent.  A new subscriber (or one that fell behind) first gets
+    {"seq": n, "ev": "snapshot", "d": {full state}}.
 
-        self.players               = players
-        self.current_turn_index    = 0
-        self.play_again_requested  = False
-        self._is_updating          = False
-        self.joker_active          = False
-        self._correction_pending   = False
-        self._last_unclaimed_name  = ""
-        self._correction_replaced_msg = ""
-        self.use_digital_roller    = use_digital_roller
-        self.colored_dice          = colored_dice
-        self._roller               = None   # YahtzeeRollerWidget, created on demand
-        self._roller_active        = False
-        self._roller_dice          = None   # list[int] once roller confirms, None otherwise
-        self._initial_theme        = initial_theme
+    Every subscriber has a bounded ring buffer.  Writes only go to the socket
+    while its own buffer is below HIGH_WATER, so a slow reader never blocks
+    the GUI; if its ring overflows the queued deltas are replaced with a
+    fresh snapshot.
+    """
 
-        self.setWindowTitle("Yahtzii! Pro Scorecard")
-        self.resize(1100, 900)
-        container = QWidget()
-        self.setCentralWidget(container)
-        layout = QVBoxLayout(container)
-        layout.setSpacing(0)
+    RING_LEN   = 256
+    HIGH_WATER = 64 * 1024
+
+    def __init__(self, name: str = "yahtzii-spectator"):
+        self.name   = name
+        self._state = {}
+        self._seq   = 0
+        self._subs  = {}    # QLocalSocket -> deque of pending lines
+        self._server = QLocalServer()
+        QLocalServer.removeServer(name)   # clear a stale socket from a crash
+        self._server.newConnection.connect(self._accept)
+        if not self._server.listen(name):
+            print(f"Spectator stream unavailable: {self._server.errorString()}",
+                  file=sys.stderr)
+
+    def start_game(self, **fields):
+        """Forget the previous game's state and send everyone a snapshot."""
+        self._state = dict(fields)
+        self._seq  += 1
+        for sock, ring in self._subs.items():
+            ring.clear()
+            ring.append(self._snapshot_line())
+            self._flush(sock)
+
+    def publish(self, kind: str, **fields):
+        delta = {k: v for k, v in fields.items() if self._state.get(k, None) != v}
+        if not delta and kind == "tick":
+            return
+        self._state.update(delta)
+        self._seq += 1
+        if not self._subs:
+            return
+        line = (json.dumps({"seq": self._seq, "ev": kind, "d": delta},
+                           separators=(",", ":")) + "\n").encode()
+        for sock, ring in self._subs.items():
+            if len(ring) >= self.RING_LEN:
+                ring.clear()
+                ring.append(self._snapshot_line())
+            else:
+                ring.append(line)
+            self._flush(sock)
 
-        # Top bar
-        top_bar = QHBoxLayout()
-        top_bar.setContentsMargins(8, 4, 8, 4)
-        self.timer_label = QLabel("⏱  00:00")
-        self.timer_label.setFont(QFont("Arial", 11, QFont.Weight.Bold))
-        self.timer_label.setStyleSheet("color: #94A3B8; padding: 2px 8px;")
-        top_bar.addWidget(self.timer_label)
-        top_bar.addStretch()
-        self.turn_timer_label = QLabel("🎲  00:00")
-        self.turn_timer_label.setFont(QFont("Arial", 11, QFont.Weight.Bold))
-        self.turn_timer_label.setStyleSheet(f"color: {CLR_ACTIVE_TURN}; padding: 2px 8px;")
-        top_bar.addWidget(self.turn_timer_label)
-        layout.addLayout(top_bar)
+    def close(self):
+        for sock in list(self._subs):
+            sock.disconnectFromServer()
+        self._server.close()
 
-        # Banner
-        self.turn_label = QLabel("")
-        self.turn_label.setFont(QFont("Arial", 11, QFont.Weight.Bold))
-        self.turn_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.turn_label.setStyleSheet(f"color: {CLR_ACTIVE_TURN}; padding: 4px;")
-        self.turn_label.setVisible(False)
-        layout.addWidget(self.turn_label)
+    def _snapshot_line(self):
+        return (json.dumps({"seq": self._seq, "ev": "snapshot", "d": self._state},
+                           separators=(",", ":")) + "\n").encode()
 
-        self.table = QTableWidget(len(ROW_LABELS), len(players))
-        self.table.setVerticalHeaderLabels(ROW_LABELS)
-        self.table.setHorizontalHeaderLabels(players)
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.setup_board()
-        layout.addWidget(self.table)
+    def _accept(self):
+        while self._server.hasPendingConnections():
+            sock = self._server.nextPendingConnection()
+            self._subs[sock] = deque([self._snapshot_line()])
+            sock.bytesWritten.connect(lambda _, s=sock: self._flush(s))
+            sock.disconnected.connect(lambda s=sock: self._drop(s))
+            self._flush(sock)
 
-        # Bottom buttons
-        btns = QHBoxLayout()
-        for text, slot in [
-            ("High Scores", self.show_high_scores),
-            ("Reset",       self.reset),
+    def _flush(self, sock):
+        ring = self._subs.get(sock)
+        while ring and sock.bytesToWrite() < self.HIGH_WATER:
+            sock.write(ring.popleft())
+
+    def _drop(self, sock):
+        self._subs.pop(sock, None)
+        sock.deleteLater()
+
+
+# ============================================================================
+# WIN-PROBABILITY ESTIMATOR — Monte Carlo on a worker thread
+# ============================================================================
+class WinProbabilityEstimator:
+    """
+    Estimates each player's chance of winning by playing the rest of the game
+    out with greedy continuations (yahtzii_strategy.win_trial).
+
+    Trials run off the GUI thread in batches of BATCH (asyncio.to_thread on
+    the async bridge); each batch's tally comes back to the GUI thread, and
+    on_update(probabilities, trials) is called after every batch once
+    MIN_TRIALS games have been simulated.  A restart cancels the running
+    estimate; a batch already in flight finishes and is dropped.  MAX_TRIALS
+    caps the work per position.
+    """
+
+    BATCH      = 25
+    MIN_TRIALS = 100
+    MAX_TRIALS = 1000
+
+    def __init__(self, on_update):
+        self.on_update = on_update
+        self._key  = None
+        self._task = None
+
+    def restart(self, states):
+        """Start over for new scorecards; a no-op if nothing changed."""
+        key = tuple(states)
+        if key == self._key:
+            return
+        self.cancel()
+        self._key = key
+        if all(s.claimed == ALL_MASK for s in states):
+            # Nothing left to simulate — the outcome is already decided.
+            self.on_update(win_trial(list(states), random.random), 1)
+        else:
+            self._task = async_bridge().run(self._estimate(list(states)))
+
+    def cancel(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._key = None
+
+    async def _estimate(self, states):
+        rnd    = random.Random().random
+        wins   = [0.0] * len(states)
+        trials = 0
+        while trials < self.MAX_TRIALS:
+            tally = await asyncio.to_thread(win_tally, states, self.BATCH, rnd)
+            wins  = [w + t for w, t in zip(wins, tally)]
+            trials += self.BATCH
+            if trials >= self.MIN_TRIALS:
+                self.on_update([w / trials for w in wins], trials)
+
+
+_projection_warmup = None
+
+def start_projection_warmup():
+    """Build the projection tables on a daemon thread, once per process."""
+    global _projection_warmup
+    if _projection_warmup is None and not projection_ready():
+        _projection_warmup = threading.Thread(
+            target=projection_tables, name="projection-tables", daemon=True)
+        _projection_warmup.start()
+
+
+class IdlePrewarmer(QObject):
+    """
+    Runs optional warm-up steps in idle passes of the event loop (a
+    zero-interval QTimer, at most SLICE_MS of steps per pass), starting once
+    a given widget has painted its first frame.  The first key or mouse press stops it: whatever the
+    remaining steps would have built is then built on demand, as before.
+    on_done runs once the steps finish or are interrupted; timings holds
+    (step, ms) for each step run.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._steps  = []
+        self._after  = None    # widget whose first paint starts the steps
+        self.on_done = None
+        self.timings = []
+        self._timer  = QTimer()
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._step)
+
+    SLICE_MS = 16
+
+    @property
+    def active(self) -> bool:
+        return bool(self._steps) or self._timer.isActive()
+
+    def start(self, steps, after):
+        """steps: [(name, callable), ...], run after `after` first paints."""
+        self.stop()
+        self._steps  = list(steps)
+        self.timings = []
+        self._after  = after
+        after.installEventFilter(self)
+
+    def stop(self):
+        """Drop the remaining steps without running on_done."""
+        self._timer.stop()
+        self._steps = []
+        if self._after is not None:
+            self._after.removeEventFilter(self)
+            self._after = None
+        QApplication.instance().removeEventFilter(self)
+
+    def then(self, callback):
+        """Run callback when warm-up ends (now, if it already has)."""
+        if self.active:
+            self.on_done = callback
+        else:
+            callback()
+
+    def _finish(self):
+        self.stop()
+        done, self.on_done = self.on_done, None
+        if done is not None:
+            done()
+
+    def _step(self):
+        deadline = time.perf_counter() + self.SLICE_MS / 1000
+        while self._steps:
+            name, fn = self._steps.pop(0)
+            t0 = time.perf_counter()
+            fn()
+            t1 = time.perf_counter()
+            self.timings.append((name, (t1 - t0) * 1000))
+            if t1 >= deadline:
+                return
+        self._finish()
+
+    def eventFilter(self, obj, event):
+        kind = event.type()
+        if kind == QEvent.Type.Paint and obj is self._after:
+            self._after.removeEventFilter(self)
+            self._after = None
+            QApplication.instance().installEventFilter(self)   # watch for input from here on
+            self._timer.start()
+        elif kind in (QEvent.Type.MouseButtonPress, QEvent.Type.KeyPress) and self._steps:
+            # Let the click land first; on_done then runs from the event loop.
+            self._timer.stop()
+            self._steps = []
+            QTimer.singleShot(0, self._finish)
+        return False
+
+
+# ============================================================================
+# ASYNCIO BRIDGE — coroutines on the Qt event loop
+# ============================================================================
+class _BridgeLoop(asyncio.SelectorEventLoop):
+    """
+    A SelectorEventLoop that tells its AsyncBridge whenever work is queued:
+    call_soon and call_at (call_later goes through it) from the GUI thread,
+    call_soon_threadsafe (executor results, asyncio.to_thread) from others.
+    """
+
+    def __init__(self, bridge: "AsyncBridge"):
+        self.bridge   = bridge
+        self.selector = selectors.DefaultSelector()
+        super().__init__(self.selector)
+
+    def call_soon(self, callback, *args, context=None):
+        handle = super().call_soon(callback, *args, context=context)
+        self.bridge.wake()
+        return handle
+
+    def call_at(self, when, callback, *args, context=None):
+        handle = super().call_at(when, callback, *args, context=context)
+        self.bridge.wake_at(when)
+        return handle
+
+    def call_soon_threadsafe(self, callback, *args, context=None):
+        handle = super().call_soon_threadsafe(callback, *args, context=context)
+        self.bridge.wake_threadsafe()
+        return handle
+
+
+class AsyncBridge(QObject):
+    """
+    Runs an asyncio event loop inside Qt's, on the GUI thread.
+
+    Nothing blocks waiting for asyncio: a single-shot timer runs one loop
+    iteration (stop() then run_forever(), which the asyncio docs define as
+    one pass) whenever _BridgeLoop reports a ready callback or the next
+    asyncio timer falls due.  Other threads wake it through a socket pair
+    watched by a QSocketNotifier.  Sockets opened by coroutines are polled
+    every IDLE_POLL_MS while any are registered.  Because Qt drives the
+    loop, coroutines keep running inside nested dialog exec() loops too.
+
+    Coroutines may touch widgets freely but must not call exec() on a
+    dialog; await exec_async(dialog) instead.  Qt callbacks that complete a
+    future go through resolve().
+    """
+
+    IDLE_POLL_MS = 10
+
+    def __init__(self):
+        super().__init__()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._pump)
+        self._due = []                    # heap of asyncio timer deadlines
+        self._rsock, self._wsock = socket.socketpair()
+        self._rsock.setblocking(False)
+        self._wsock.setblocking(False)
+        self._notifier = QSocketNotifier(self._rsock.fileno(), QSocketNotifier.Type.Read, self)
+        self._notifier.activated.connect(self._woken)
+        self.loop = _BridgeLoop(self)
+        asyncio.set_event_loop(self.loop)
+
+    def run(self, coro, owner: QWidget = None) -> asyncio.Task:
+        """
+        Schedule coro as a task.  With an owner window, the task is cancelled
+        when that window closes or is destroyed.
+        """
+        task = self.loop.create_task(coro)
+        task.add_done_callback(_report_task_error)
+        if owner is not None:
+            _window_tasks(owner).tasks.add(task)
+        return task
+
+    def resolve(self, fut: asyncio.Future, result=None):
+        if not fut.done():
+            fut.set_result(result)
+
+    def wake(self):
+        self._timer.start(0)
+
+    def wake_at(self, when: float):
+        heapq.heappush(self._due, when)
+        self._arm(math.ceil(max(0.0, when - self.loop.time()) * 1000))
+
+    def wake_threadsafe(self):
+        """Wake the loop from any thread."""
+        try:
+            self._wsock.send(b"\0")
+        except OSError:                   # buffer full: a wake-up is pending anyway
+            pass
+
+    def close(self):
+        """Cancel what is still running and close the loop (at exit)."""
+        self._timer.stop()
+        self._notifier.setEnabled(False)
+        tasks = asyncio.all_tasks(self.loop)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self.loop.close()
+        self._rsock.close()
+        self._wsock.close()
+
+    def _woken(self):
+        try:
+            while self._rsock.recv(4096):
+                pass
+        except OSError:
+            pass
+        self._pump()
+
+    def _arm(self, delay_ms: int):
+        """Fire the pump within delay_ms, keeping an earlier wake-up."""
+        if not self._timer.isActive() or self._timer.remainingTime() > delay_ms:
+            self._timer.start(delay_ms)
+
+    def _pump(self):
+        loop = self.loop
+        if loop.is_closed():
+            return
+        if loop.is_running():          # a coroutine step is inside a nested Qt loop
+            self._arm(self.IDLE_POLL_MS)
+            return
+        self._timer.stop()
+        loop.stop()
+        loop.run_forever()             # exactly one iteration
+        self._schedule()
+
+    def _schedule(self):
+        now = self.loop.time()
+        due = self._due
+        while due and due[0] <= now:
+            heapq.heappop(due)
+        if due:
+            self._arm(math.ceil((due[0] - now) * 1000))
+        if len(self.loop.selector.get_map()) > 1:     # sockets besides the loop's self-pipe
+            self._arm(self.IDLE_POLL_MS)
+
+
+def _report_task_error(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        exc = task.exception()
+        sys.excepthook(type(exc), exc, exc.__traceback__)
+
+
+class _WindowTasks(QObject):
+    """Tasks and close-waiters tied to one window (see AsyncBridge.run)."""
+
+    def __init__(self, window: QWidget):
+        super().__init__(window)
+        self.window  = window
+        self.tasks   = set()
+        self.waiters = []
+        window.installEventFilter(self)
+        tasks = self.tasks
+        window.destroyed.connect(lambda: [t.cancel() for t in tasks])
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Close:
+            # closeEvent may still ignore it; look again once it has run.
+            async_bridge().loop.call_soon(self._closed)
+        return False
+
+    def _closed(self):
+        if self.window.isVisible():
+            return
+        for task in self.tasks:
+            task.cancel()
+        self.tasks.clear()
+        waiters, self.waiters = self.waiters, []
+        for fut in waiters:
+            if not fut.done():
+                fut.set_result(None)
+
+
+def _window_tasks(window: QWidget) -> _WindowTasks:
+    watch = window.findChild(_WindowTasks, options=Qt.FindChildOption.FindDirectChildrenOnly)
+    return watch or _WindowTasks(window)
+
+
+_bridge = None
+
+
+def async_bridge() -> AsyncBridge:
+    """The process-wide bridge, created on first use (needs a QApplication)."""
+    global _bridge
+    if _bridge is None:
+        _bridge = AsyncBridge()
+    return _bridge
+
+
+async def wait_closed(window: QWidget):
+    """Return once window has been closed."""
+    fut = async_bridge().loop.create_future()
+    _window_tasks(window).waiters.append(fut)
+    await fut
+
+
+async def exec_async(dialog: QDialog) -> int:
+    """dialog.exec() without a nested event loop: show it modal and await its result."""
+    bridge = async_bridge()
+    fut    = bridge.loop.create_future()
+
+    def finished(result):
+        bridge.resolve(fut, result)
+
+    dialog.finished.connect(finished)
+    dialog.setWindowModality(Qt.WindowModality.ApplicationModal)
+    dialog.show()
+    try:
+        return await fut
+    except asyncio.CancelledError:
+        dialog.reject()                  # the owner went away: don't leave it up
+        raise
+    finally:
+        dialog.finished.disconnect(finished)
+
+
+async def io_flushed(timeout: float = None) -> bool:
+    """Wait, off the GUI thread, for every queued score / autosave write."""
+    return await asyncio.to_thread(io_worker().flush, timeout)
+
+
+# ============================================================================
+# SCORECARD
+# ============================================================================
+class ResumableElapsedTimer(QElapsedTimer):
+    """QElapsedTimer that can carry on from a saved reading (autosave resume)."""
+
+    offset_ms = 0
+
+    def start(self):
+        self.offset_ms = 0
+        super().start()
+
+    def restart(self):
+        ms = self.elapsed()
+        self.offset_ms = 0
+        super().restart()
+        return ms
+
+    def elapsed(self):
+        return super().elapsed() + self.offset_ms
+
+    def resume_from(self, ms: int):
+        super().start()
+        self.offset_ms = ms
+
+
+class YahtzeeScorecard(QMainWindow):
+    def __init__(self, players, use_digital_roller: bool = False, initial_theme: str = "Classic", colored_dice: bool = True,
+                 spectators: "SpectatorHub | None" = None, session: "SessionStats | None" = None):
+        super().__init__()
+
+        # ── REQUIRED: all theme vars must exist before setup_board() ──
+        self._theme_accent    = CLR_ACCENT
+        self._theme_table_bg  = CLR_TABLE
+        self._theme_active    = CLR_ACTIVE_UNCLAIMED
+        self._theme_unclaimed = CLR_UNCLAIMED
+        self._theme_bg        = CLR_BACKGROUND
+        self._current_theme_name = None   # set by apply_roller_theme
+
+        self._is_updating          = False
+        self._roller               = None   # YahtzeeRollerWidget, created on demand, kept across games
+        self._rules_dialog         = None   # RulesDialog, created on first use
+        self._spectators           = spectators   # SpectatorHub or None
+        self._session              = session      # SessionStats shared across play-again games
+        self._winprob              = None   # WinProbabilityEstimator for multiplayer games
+        self._prewarm              = IdlePrewarmer()
+        self._counters_panel       = None   # DebugCountersPanel, built on first Ctrl+Shift+D
+        start_projection_warmup()
+        self._proj_poll            = QTimer()   # waits for the projection tables
+        self._proj_poll.setInterval(200)
+        self._proj_poll.timeout.connect(self._on_projection_poll)
+        self._refresh_timer        = QTimer()   # flushes update_turn_ui & co. once per pass
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self.flush_refresh)
+
+        self.setWindowTitle("Yahtzii! Pro Scorecard")
+        self.resize(1100, 900)
+        container = QWidget()
+        self.setCentralWidget(container)
+        layout = QVBoxLayout(container)
+        layout.setSpacing(0)
+
+        # Top bar
+        top_bar = QHBoxLayout()
+        top_bar.setContentsMargins(8, 4, 8, 4)
+        self.timer_label = QLabel("⏱  00:00")
+        self.timer_label.setFont(QFont("Arial", 11, QFont.Weight.Bold))
+        self.timer_label.setStyleSheet("color: #94A3B8; padding: 2px 8px;")
+        top_bar.addWidget(self.timer_label)
+        top_bar.addStretch()
+        self.turn_timer_label = QLabel("🎲  00:00")
+        self.turn_timer_label.setFont(QFont("Arial", 11, QFont.Weight.Bold))
+        self.turn_timer_label.setStyleSheet(f"color: {CLR_ACTIVE_TURN}; padding: 2px 8px;")
+        top_bar.addWidget(self.turn_timer_label)
+        layout.addLayout(top_bar)
+
+        # Banner
+        self.turn_label = QLabel("")
+        self.turn_label.setFont(QFont("Arial", 11, QFont.Weight.Bold))
+        self.turn_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.turn_label.setStyleSheet(f"color: {CLR_ACTIVE_TURN}; padding: 4px;")
+        self.turn_label.setVisible(False)
+        layout.addWidget(self.turn_label)
+
+        self.table = QTableWidget(len(ROW_LABELS), 0)
+        self.table.setVerticalHeaderLabels(ROW_LABELS)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.table)
+
+        # Bottom buttons
+        btns = QHBoxLayout()
+        for text, slot in [
+            ("High Scores", self.show_high_scores),
+            ("Reset",       self.reset),
             ("Rules",       self.show_rules),
         ]:
             b = QPushButton(text); b.clicked.connect(slot); btns.addWidget(b)
 
-        if self.use_digital_roller:
-            self.open_roller_btn = QPushButton("🎲 Open Roller")
-            self.open_roller_btn.setStyleSheet(accent_btn_style())
-            self.open_roller_btn.clicked.connect(self._open_roller_for_current_player)
-            btns.addWidget(self.open_roller_btn)
-
+        # Always built so a reused window can switch roller mode; hidden for physical dice
+        self.open_roller_btn = QPushButton("🎲 Open Roller")
+        self.open_roller_btn.setStyleSheet(accent_btn_style())
+        self.open_roller_btn.clicked.connect(self._open_roller_for_current_player)
+        btns.addWidget(self.open_roller_btn)
 
         layout.addLayout(btns)
 
@@ -2133,10 +3180,60 @@ class YahtzeeScorecard(QMainWindow):
         )
         self.setStatusBar(sb_widget)
 
+        self._elapsed      = ResumableElapsedTimer()
+        self._turn_elapsed = ResumableElapsedTimer()
+        self._clock        = QTimer()
+        self._clock.timeout.connect(self._tick_clock)
+
+        counters_key = QShortcut(QKeySequence("Ctrl+Shift+D"), self, self.toggle_counters_panel)
+        counters_key.setContext(Qt.ShortcutContext.ApplicationShortcut)
+
+        self.start_game(players, use_digital_roller, initial_theme, colored_dice)
+
+    def start_game(self, players, use_digital_roller: bool = False, initial_theme: str = "Classic",
+                   colored_dice: bool = True):
+        """
+        Reset this window for a new game in place.  The entry point keeps one
+        scorecard for the whole run and calls this on play-again instead of
+        building a new window; the roller and dialogs it owns are reused too.
+        """
+        self.players               = players
+        self.current_turn_index    = 0
+        self.play_again_requested  = False
+        self.roll_for_order        = False
+        self.new_game              = False
+        self.joker_active          = False
+        self._correction_pending   = False
+        self._last_unclaimed_name  = ""
+        self._correction_replaced_msg = ""
+        self.use_digital_roller    = use_digital_roller
+        self.colored_dice          = colored_dice
+        self._roller_active        = False
+        self._roller_dice          = None   # list[int] once roller confirms, None otherwise
+        self._initial_theme        = initial_theme
+        if self._winprob is not None:
+            self._winprob.cancel()
+        if len(players) > 1:
+            self._winprob = self._winprob or WinProbabilityEstimator(self._on_winprob)
+        else:
+            self._winprob = None
+
+        self.table.setColumnCount(len(players))
+        self.table.setHorizontalHeaderLabels(players)
+        self.setup_board()
+        self.open_roller_btn.setVisible(use_digital_roller)
+        self.open_roller_btn.setEnabled(True)
+        if self._roller is not None:
+            self._roller.colored_dice     = colored_dice
+            self._roller.on_window_hidden = self._on_roller_hidden
+            if self._roller.current_theme != initial_theme:
+                self._roller._set_theme(initial_theme)
+
         self._sb_data = {
             'leader': '', 'scores': '', 'last': '',
             'upper': '', 'upper_color': '#94A3B8',
             'best': '', 'streak': '', 'alltime': '',
+            'winprob': '', 'streak_hot': False,
         }
         self._load_alltime_high()
         self._streak_player  = None
@@ -2144,34 +3241,57 @@ class YahtzeeScorecard(QMainWindow):
         self._last_score_msg = ""
 
         # Apply initial theme immediately so colours are correct from the first frame
-        # Safe defaults — immediately overwritten by apply_roller_theme below
-        self._theme_accent    = CLR_ACCENT
-        self._theme_unclaimed = CLR_UNCLAIMED
-        self._theme_active    = CLR_ACTIVE_UNCLAIMED
-        self._theme_bg        = CLR_BACKGROUND
-        self._theme_table_bg  = CLR_TABLE
         self.apply_roller_theme(self._initial_theme)
 
+        self.table.setEnabled(True)
+        self.turn_label.setVisible(False)
         self.update_turn_ui()
+        if self._spectators is not None:
+            self._spectators.start_game(
+                players=list(self.players), player=self.players[0],
+                totals=[0] * len(self.players), timer=0, turn_timer=0,
+            )
 
-        self._elapsed      = QElapsedTimer(); self._elapsed.start()
-        self._turn_elapsed = QElapsedTimer(); self._turn_elapsed.start()
-        self._clock        = QTimer()
-        self._clock.timeout.connect(self._tick_clock)
+        self._elapsed.start()
+        self._turn_elapsed.start()
         self._clock.start(1000)
+        self._prewarm.start(self._prewarm_steps(), after=self.table.viewport())
+
+    def _prewarm_steps(self):
+        """Idle-time work that makes the first turn and the game-over chart cheap."""
+        steps = []
+        if self.use_digital_roller:
+            steps.append(("dice", prerender_die_faces))
+            if self._roller is None:
+                steps.append(("roller", self._warm_roller))
+        steps.append(("chart", lambda: ScoreBreakdownChart.row_label_pixmap(
+            len(self.players), self.devicePixelRatioF())))
+        return steps
 
     # -------------------------------------------------------- roller glue ---
-    def _open_roller_for_current_player(self):
+    def _ensure_roller(self):
         if self._roller is None:
             self._roller = YahtzeeRollerWidget(scorecard_mode=True)
             self._roller.colored_dice     = self.colored_dice
             self._roller.on_turn_done     = self._on_roller_done
             self._roller.on_window_hidden = self._on_roller_hidden
             self._roller.on_theme_changed = self.apply_roller_theme
+            self._roller.on_roll_event    = self._on_roller_event
             self._roller.score_hint_provider = self._best_open_score_for_dice
             # Sync roller to the theme chosen at registration
             self._roller._set_theme(self._initial_theme)
 
+    def _warm_roller(self):
+        """Build the roller and run its first (hidden) paint so opening it doesn't hitch."""
+        if self._roller is not None and self._roller.isVisible():
+            return
+        self._ensure_roller()
+        self._roller.ensurePolished()
+        self._roller.grab()
+
+    def _open_roller_for_current_player(self):
+        self._ensure_roller()
+
         player_name = self.players[self.current_turn_index]
 
         # Reopen after accidental close: the player already has a confirmed roll
@@ -2231,7 +3351,12 @@ class YahtzeeScorecard(QMainWindow):
             self.open_roller_btn.setEnabled(True)
 
         self._roller_dice = dice   # drive row dimming in update_turn_ui
+        self._show_rolled_banner(dice)
+        self.update_turn_ui()   # re-render table with dimming applied
+        self._autosave()
+        self.flush_refresh()
 
+    def _show_rolled_banner(self, dice: list):
         faces       = "  ".join(str(d) for d in dice)
         player_name = self.players[self.current_turn_index]
         label, pts  = _roller_score(dice)
@@ -2245,7 +3370,16 @@ class YahtzeeScorecard(QMainWindow):
         )
         self.turn_label.setVisible(True)
         self._last_score_msg = f"Rolled: [{faces}] — {label} {pts} pts"
-        self.update_turn_ui()   # re-render table with dimming applied
+
+    def _on_roller_event(self, kind: str, fields: dict):
+        if kind == "roll":
+            self._turn_rolls.append([fields["dice"], fields["held"]])
+        self._publish(kind, **fields)
+
+    def _publish(self, kind: str, **fields):
+        """Forward a game event to the spectator stream, if one is running."""
+        if self._spectators is not None:
+            self._spectators.publish(kind, **fields)
 
     def _on_roller_hidden(self):
         """
@@ -2276,8 +3410,9 @@ class YahtzeeScorecard(QMainWindow):
         the window stylesheet, then triggers a full table repaint.
         """
         th = _ROLLER_THEMES.get(theme_name)
-        if th is None:
-            return
+        if th is None or theme_name == self._current_theme_name:
+            return   # unknown, or already applied (restyling is the costly part of a restart)
+        self._current_theme_name = theme_name
 
         bg     = th["bg"]
         accent = th["accent"]
@@ -2418,9 +3553,13 @@ class YahtzeeScorecard(QMainWindow):
         color = "#F87171" if tms >= 120000 else "#F97316" if tms >= 60000 else CLR_ACTIVE_TURN
         self.turn_timer_label.setStyleSheet(f"color: {color}; padding: 2px 8px;")
         self.turn_timer_label.setText(f"🎲  {tm:02d}:{ts:02d}")
+        self._publish("tick", timer=ms // 1000, turn_timer=tms // 1000)
 
     def closeEvent(self, event):
         if hasattr(self, '_clock'): self._clock.stop()
+        self._prewarm.stop()
+        self._proj_poll.stop()
+        if self._winprob is not None: self._winprob.cancel()
         if hasattr(self, 'loop') and self.loop.isRunning(): self.loop.quit()
         if self._roller:
             # Disconnect the hidden callback so hiding doesn't fire _on_roller_hidden
@@ -2430,13 +3569,36 @@ class YahtzeeScorecard(QMainWindow):
         event.accept()
 
     def show_rules(self):
-        RulesDialog().exec()
+        if self._rules_dialog is None:
+            self._rules_dialog = RulesDialog()
+        self._rules_dialog.open()
+
+    def toggle_counters_panel(self):
+        if self._counters_panel is None:
+            arm_counters()
+            self._counters_panel = DebugCountersPanel(self)
+        self._counters_panel.setVisible(not self._counters_panel.isVisible())
 
     # --------------------------------------------------------- board --------
     def setup_board(self):
+        """
+        Clear every cell for a new game.  Cells that already exist are reset
+        in place (items, ScoreButtons and bonus-cell widgets are reused), so a
+        reset costs the same however many games came before; only columns the
+        table has just grown get new cells.  The table repaints once, at the end.
+        """
+        self._claimed = [0] * self.table.columnCount()   # per-player claim bitmask
+        self._projected    = {}   # column -> (expected final, P(upper bonus))
+        self._proj_history = [{} for _ in range(self.table.columnCount())]
+        self._turn_log     = []   # one record per roller turn (yahtzii_strategy)
+        self._turn_rolls   = []   # [[dice, held], ...] for the turn in progress
+        self.table.setUpdatesEnabled(False)
         self.table.blockSignals(True)
         for r in range(self.table.rowCount()):
             for c in range(self.table.columnCount()):
+                if self.table.item(r, c) is not None:
+                    self._reset_cell(r, c)
+                    continue
                 item = QTableWidgetItem("-")
                 item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
                 item.setData(Qt.ItemDataRole.UserRole, "unclaimed")
@@ -2444,18 +3606,53 @@ class YahtzeeScorecard(QMainWindow):
                     item.setText("0"); item.setFlags(Qt.ItemFlag.ItemIsEnabled)
                     item.setBackground(QColor(self._theme_bg))
                     item.setForeground(QBrush(QColor(self._theme_accent)))
-                elif r in UPPER_SECTION:
-                    self.add_dropdown(r, c, ["-", "0", "1", "2", "3", "4", "5"])
                 elif r == 15:
                     self.setup_yahtzee_bonus_cell(r, c); continue
-                elif r in FIXED_SCORE_ROWS:
-                    self.add_dropdown(r, c, ["-", str(FIXED_SCORE_ROWS[r]), "0"])
-                elif r in [9, 10, 16]:
-                    self.add_dropdown(r, c, ["-", "0"] + [str(i) for i in range(5, 31)])
+                elif self._default_options(r):
+                    self.add_dropdown(r, c, self._default_options(r))
                 else:
                     item.setBackground(QColor(self._theme_unclaimed))
                 self.table.setItem(r, c, item)
         self.table.blockSignals(False)
+        self.table.setUpdatesEnabled(True)
+        if projection_ready():
+            for c in range(self.table.columnCount()):
+                self._update_projection(c)
+        else:
+            self._proj_poll.start()
+
+    @staticmethod
+    def _default_options(r):
+        """A score row's dropdown options before any roll; None for other rows."""
+        if r in UPPER_SECTION:
+            return ["-", "0", "1", "2", "3", "4", "5"]
+        if r in FIXED_SCORE_ROWS:
+            return ["-", str(FIXED_SCORE_ROWS[r]), "0"]
+        if r in (9, 10, 16):
+            return ["-", "0"] + [str(i) for i in range(5, 31)]
+        return None
+
+    def _reset_cell(self, r, c):
+        """Put an existing cell back to its new-game state without replacing it."""
+        item   = self.table.item(r, c)
+        widget = self.table.cellWidget(r, c)
+        item.setToolTip("")
+        if r in CALCULATED_ROWS:
+            item.setText("0")
+            item.setData(Qt.ItemDataRole.UserRole, "unclaimed")
+            item.setBackground(QColor(self._theme_bg))
+            item.setForeground(QBrush(QColor(self._theme_accent)))
+        elif r == 15:
+            item.setText("0")
+            widget.findChild(QLabel).setText("0")
+        else:
+            item.setText("-")
+            item.setData(Qt.ItemDataRole.UserRole, "unclaimed")
+            if isinstance(widget, ScoreButton):
+                widget.addItems(self._default_options(r))
+                widget.setToolTip("")
+            else:
+                item.setBackground(QColor(self._theme_unclaimed))
 
     def setup_yahtzee_bonus_cell(self, r, c):
         container = QWidget()
@@ -2477,32 +3674,38 @@ class YahtzeeScorecard(QMainWindow):
         btn.connect_change(self.handle_dropdown)
         self.table.setCellWidget(r, c, btn)
 
+    def _roller_moves(self, c):
+        """
+        Legal-move lookup for column c's confirmed roller dice, or None when c
+        is not the active column, dice are physical, or no roll is confirmed.
+        """
+        if (c != self.current_turn_index or not self.use_digital_roller
+                or self._roller_dice is None):
+            return None
+        box = self.table.item(14, c).text()
+        return legal_moves(self._roller_dice, self._claimed[c],
+                           int(box) if box.isdigit() else None, self.joker_active)
+
+    def _roller_value(self, moves, r):
+        """What row r scores for the confirmed roll; 0 where Joker priority forbids it."""
+        if self.joker_active and not moves.legal & CATEGORY_BIT[r]:
+            return 0
+        return moves.scores[CATEGORY_INDEX[r]]
+
     def _update_upper_dropdowns(self, c):
         is_active = (c == self.current_turn_index)
+        moves     = self._roller_moves(c)
         for r in UPPER_SECTION:
             combo = self.table.cellWidget(r, c)
             if not combo or not isinstance(combo, ScoreButton): continue
-            if self.table.item(r, c).data(Qt.ItemDataRole.UserRole) == "claimed": continue
+            if self._claimed[c] & CATEGORY_BIT[r]: continue
             self._is_updating = True
             current = combo.currentText(); combo.clear()
-            if (is_active and self.joker_active
-                    and self.use_digital_roller and self._roller_dice is not None):
-                # Joker + digital roller: offer exact count for this face (always 5),
-                # or 0 if it's not the matching face (shouldn't happen per priority,
-                # but guard for completeness)
-                face  = r + 1
-                count = Counter(self._roller_dice)[face]
-                combo.addItems(["-", str(count)] if count > 0 else ["-", "0"])
+            if moves is not None:
+                # Confirmed roll: offer the exact count for this face (0 if none)
+                combo.addItems(["-", str(self._roller_value(moves, r) // (r + 1))])
             elif is_active and self.joker_active:
                 combo.addItems(["-", "5", "0"])
-            elif (is_active and self.use_digital_roller
-                  and self._roller_dice is not None):
-                face  = r + 1
-                count = Counter(self._roller_dice)[face]
-                if count > 0:
-                    combo.addItems(["-", str(count)])
-                else:
-                    combo.addItems(["-", "0"])
             else:
                 combo.addItems(["-", "0", "1", "2", "3", "4", "5"])
             idx = combo.findText(current)
@@ -2514,79 +3717,19 @@ class YahtzeeScorecard(QMainWindow):
         When roller dice are confirmed, restrict rows 9–14 and 16 to only the
         options valid for this roll.  Non-qualifying rows show [-, 0] only
         (red tint applied by the cell loop) so the player can still burn them.
+        Under Joker rules, rows the Joker priority forbids also show [-, 0].
         Restores normal options for physical dice / no roll yet / claimed cell.
         """
-        is_active = (c == self.current_turn_index)
+        moves     = self._roller_moves(c)
         lock_rows = {9, 10, 11, 12, 13, 14, 16}
         for r in lock_rows:
             combo = self.table.cellWidget(r, c)
             if not combo or not isinstance(combo, ScoreButton): continue
-            if self.table.item(r, c).data(Qt.ItemDataRole.UserRole) == "claimed": continue
+            if self._claimed[c] & CATEGORY_BIT[r]: continue
             self._is_updating = True
             current = combo.currentText(); combo.clear()
-            if (is_active and self.use_digital_roller
-                    and self._roller_dice is not None
-                    and self.joker_active):
-                # Joker + digital roller: dice are five-of-a-kind.
-                # Per Joker rules, lower boxes may be used at full value.
-                # Compute which lower boxes are available under Joker priority.
-                total     = sum(self._roller_dice)
-                joker_face = self._roller_dice[0]  # all five are the same
-                # Matching upper box status
-                upper_r   = joker_face - 1   # row index for matching upper
-                upper_claimed = (
-                    self.table.item(upper_r, c).data(Qt.ItemDataRole.UserRole) == "claimed"
-                    if self.table.item(upper_r, c) else False
-                )
-                # Lower boxes are only scoreable if matching upper is already claimed
-                if upper_claimed:
-                    fixed = FIXED_SCORE_ROWS.get(r)
-                    combo.addItems(["-", str(fixed)] if fixed else ["-", str(total)])
-                else:
-                    # Matching upper is open — player must score there first (Joker step 1)
-                    # Lower boxes show 0 only (disabled by Joker dimming in cell loop)
-                    combo.addItems(["-", "0"])
-            elif (is_active and self.use_digital_roller
-                    and self._roller_dice is not None
-                    and not self.joker_active):
-                total     = sum(self._roller_dice)
-                counts    = Counter(self._roller_dice)
-                max_count = max(counts.values())
-                uniq      = sorted(set(self._roller_dice))
-
-                # Full House (row 11): exactly 3+2
-                if r == 11:
-                    vals = sorted(counts.values(), reverse=True)
-                    qualifies = (vals[0] == 3 and len(vals) > 1 and vals[1] == 2)
-
-                # Small Straight (row 12): any 4 consecutive values present
-                elif r == 12:
-                    qualifies = any(
-                        all(s in uniq for s in seq)
-                        for seq in [(1,2,3,4), (2,3,4,5), (3,4,5,6)]
-                    )
-
-                # Large Straight (row 13): all 5 consecutive
-                elif r == 13:
-                    qualifies = uniq in [[1,2,3,4,5], [2,3,4,5,6]]
-
-                # Yahtzii (row 14): five of a kind
-                elif r == 14:
-                    qualifies = (max_count == 5)
-
-                # 3 of a Kind (row 9), 4 of a Kind (row 10), Chance (row 16)
-                elif r == 9:
-                    qualifies = (max_count >= 3)
-                elif r == 10:
-                    qualifies = (max_count >= 4)
-                else:  # row 16 — Chance always qualifies
-                    qualifies = True
-
-                if qualifies:
-                    fixed = FIXED_SCORE_ROWS.get(r)
-                    combo.addItems(["-", str(fixed)] if fixed else ["-", str(total)])
-                else:
-                    combo.addItems(["-", "0"])
+            if moves is not None:
+                combo.addItems(["-", str(self._roller_value(moves, r))])
             else:
                 # Restore defaults per row type
                 if r in FIXED_SCORE_ROWS:
@@ -2624,15 +3767,22 @@ class YahtzeeScorecard(QMainWindow):
                 self._last_unclaimed_name = ROW_LABELS[r]
                 item.setData(Qt.ItemDataRole.UserRole, "unclaimed")
                 item.setText("-")
+                self._claimed[c] &= ~CATEGORY_BIT[r]
                 self._correction_pending = True
+                self._publish("unclaim", **{f"{c}.{r}": None})
                 self.recalc(c); self.update_turn_ui()
+                self._autosave()
             self._is_updating = False
+            self.flush_refresh()
             return
 
+        before  = self._player_state(c)
         old_val = item.text()
         score   = (int(combo.currentText()) * (r + 1) if r in UPPER_SECTION
                    else int(combo.currentText()))
         item.setText(str(score)); item.setData(Qt.ItemDataRole.UserRole, "claimed")
+        self._claimed[c] |= CATEGORY_BIT[r]
+        self._publish("claim", **{f"{c}.{r}": score})
 
         if status == "unclaimed" and self._correction_pending:
             self._correction_pending = False
@@ -2654,6 +3804,12 @@ class YahtzeeScorecard(QMainWindow):
             if self.use_digital_roller and self._roller is not None:
                 self._roller.update_last_history_label(ROW_LABELS[r], score)
             self._update_streak(c, score)
+            if self.use_digital_roller and self._roller_dice is not None and self._turn_rolls:
+                self._turn_log.append({
+                    "player": self.players[c], "state": list(before),
+                    "rolls": self._turn_rolls, "joker": self.joker_active,
+                    "row": r, "score": score,
+                })
             self.recalc(c); self.advance_to_next_player()
         else:
             self._correction_replaced_msg = (
@@ -2663,6 +3819,8 @@ class YahtzeeScorecard(QMainWindow):
             self.recalc(c); self.update_turn_ui()
 
         self._is_updating = False
+        self._autosave()
+        self.flush_refresh()
 
     def increment_yahtzee_bonus(self, c):
         if self.table.item(14, c).text() != "50":
@@ -2676,8 +3834,11 @@ class YahtzeeScorecard(QMainWindow):
         item.setText(str(val))
         self.table.cellWidget(15, c).findChild(QLabel).setText(str(val))
         self._last_score_msg = f"Last score: {self.players[c]} → Yahtzii Bonus  +100 pts"
+        self._publish("claim", **{f"{c}.15": val})
         self.joker_active = True
         self.recalc(c); self.update_turn_ui()
+        self._autosave()
+        self.flush_refresh()
 
     def advance_to_next_player(self):
         self.joker_active             = False
@@ -2685,26 +3846,26 @@ class YahtzeeScorecard(QMainWindow):
         self._last_unclaimed_name     = ""
         self._correction_replaced_msg = ""
         self._roller_dice             = None   # clear roll — next player starts fresh
+        self._turn_rolls              = []
         if hasattr(self, '_turn_elapsed'):
             self._turn_elapsed.restart()
             self.turn_timer_label.setStyleSheet(
                 f"color: {CLR_ACTIVE_TURN}; padding: 2px 8px;"
             )
-        total = len(self.players)
-        for _ in range(total):
-            self.current_turn_index = (self.current_turn_index + 1) % total
-            if self.player_has_turns_left(self.current_turn_index):
-                self.update_turn_ui()
-                if self.use_digital_roller:
-                    self._open_roller_for_current_player()
-                return
+        nxt = next_player_index(self.current_turn_index, len(self.players),
+                                self.player_has_turns_left)
+        if nxt is not None:
+            self.current_turn_index = nxt
+            self._publish("turn", player=self.players[nxt], dice=None,
+                          held=[False] * 5, rolls_left=3)
+            self.update_turn_ui()
+            if self.use_digital_roller:
+                self._open_roller_for_current_player()
+            return
         self.check_game_over()
 
     def player_has_turns_left(self, c):
-        return any(
-            self.table.item(r, c).data(Qt.ItemDataRole.UserRole) == "unclaimed"
-            for r in PRIMARY_CATEGORIES
-        )
+        return self._claimed[c] != ALL_MASK
 
     def recalc(self, c):
         u_sum = sum(int(self.table.item(r, c).text()) for r in range(6)
@@ -2718,60 +3879,33 @@ class YahtzeeScorecard(QMainWindow):
         y_bonus = int(self.table.item(15, c).text()) * 100
         self.table.item(17, c).setText(str(l_sum + y_bonus))
         self.table.item(18, c).setText(str(u_sum + bonus + l_sum + y_bonus))
+        if self._spectators is not None:
+            totals = [int(self.table.item(18, i).text()) for i in range(len(self.players))]
+            self._publish("totals", totals=totals)
+        self._update_projection(c)
+
+    def _update_projection(self, c):
+        """Look up column c's projected final score and Upper-bonus chance."""
+        if not projection_ready():
+            return
+        expected, p_bonus = projection(self._player_state(c))
+        self._projected[c] = (expected, p_bonus)
+        self._proj_history[c][bin(self._claimed[c]).count("1")] = expected
+
+    def _on_projection_poll(self):
+        if not projection_ready():
+            return
+        self._proj_poll.stop()
+        for c in range(len(self.players)):
+            self._update_projection(c)
+        self.update_status_bar()
 
     def _best_open_score_for_dice(self, dice: list):
         """
         Return the highest scoring currently unclaimed scorecard category for
         the active player and the given dice.
         """
-        c      = self.current_turn_index
-        counts = Counter(dice)
-        total  = sum(dice)
-        vals   = sorted(counts.values(), reverse=True)
-        uniq   = sorted(set(dice))
-        max_count = vals[0] if vals else 0
-        candidates = []
-
-        def is_open(row):
-            item = self.table.item(row, c)
-            return item is not None and item.data(Qt.ItemDataRole.UserRole) == "unclaimed"
-
-        def add(row, score, priority):
-            if is_open(row):
-                candidates.append((score, priority, ROW_LABELS[row]))
-
-        # Upper section
-        for row in UPPER_SECTION:
-            face = row + 1
-            add(row, counts[face] * face, 10 + face)
-
-        # Lower section
-        if max_count >= 3:
-            add(9, total, 40)
-
-        if max_count >= 4:
-            add(10, total, 50)
-
-        if max_count == 3 and len(vals) > 1 and vals[1] == 2:
-            add(11, 25, 60)
-
-        if any(all(s in uniq for s in seq) for seq in [(1,2,3,4), (2,3,4,5), (3,4,5,6)]):
-            add(12, 30, 70)
-
-        if uniq in [[1,2,3,4,5], [2,3,4,5,6]]:
-            add(13, 40, 80)
-
-        if max_count == 5:
-            add(14, 50, 90)
-
-        # Chance
-        add(16, total, 30)
-
-        if not candidates:
-            return ("No open scoring fields", 0)
-
-        best_score, _, best_label = max(candidates, key=lambda x: (x[0], x[1]))
-        return (best_label, best_score)
+        return best_hint(dice, self._claimed[self.current_turn_index])
 
     # ------------------------------------------------------ UI updates ------
     def _valid_rows_for_dice(self, dice: list) -> set:
@@ -2781,50 +3915,53 @@ class YahtzeeScorecard(QMainWindow):
         should be dimmed — the player may still score a zero there, but they
         are visually de-emphasised.
         """
-        counts = Counter(dice)
-        total  = sum(dice)
-        vals   = sorted(counts.values(), reverse=True)
-        uniq   = sorted(set(dice))
-        valid  = set()
-
-        # Upper section rows 0-5: valid if at least one die matches face value
-        for r in range(6):
-            face = r + 1
-            if counts[face] > 0:
-                valid.add(r)
-
-        # 3 of a Kind (row 9)
-        if vals[0] >= 3:
-            valid.add(9)
-
-        # 4 of a Kind (row 10)
-        if vals[0] >= 4:
-            valid.add(10)
-
-        # Full House (row 11)
-        if vals[0] == 3 and len(vals) > 1 and vals[1] == 2:
-            valid.add(11)
-
-        # Small Straight (row 12): any 4 sequential values present
-        for seq in [(1,2,3,4), (2,3,4,5), (3,4,5,6)]:
-            if all(s in uniq for s in seq):
-                valid.add(12)
-                break
-
-        # Large Straight (row 13): all 5 sequential
-        if uniq in [[1,2,3,4,5], [2,3,4,5,6]]:
-            valid.add(13)
-
-        # Yahtzii (row 14)
-        if vals[0] == 5:
-            valid.add(14)
-
-        # Chance (row 16) — always valid
-        valid.add(16)
-
-        return valid
+        return set(rows_in(legal_moves(dice, 0).valid))
+
+    # -------------------------------------------------- coalesced refresh ---
+    # One user action can ask for the table and the status bar several
+    # times (recalc, advance, roller open...).  Requests only set bits; the
+    # work runs once, when the action's handler finishes (handle_dropdown,
+    # increment_yahtzee_bonus, _on_roller_done call flush_refresh), and
+    # otherwise from a zero timer or when the window is about to paint.
+    REFRESH_TURN   = 1   # table restyle, dropdowns, banner — implies the status bar
+    REFRESH_STATUS = 2   # status bar figures
+    REFRESH_RENDER = 4   # status bar HTML only
+    _dirty         = 0   # pending REFRESH_* bits (class default: event() runs during __init__)
 
     def update_turn_ui(self):
+        self._request_refresh(self.REFRESH_TURN)
+
+    def update_status_bar(self):
+        self._request_refresh(self.REFRESH_STATUS)
+
+    def _request_refresh(self, what: int):
+        self._dirty |= what
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def flush_refresh(self):
+        """Run the pending refreshes now, each at most once."""
+        dirty, self._dirty = self._dirty, 0
+        self._refresh_timer.stop()
+        if dirty & self.REFRESH_TURN:
+            self._apply_turn_ui()
+        if dirty and hasattr(self, '_sb_data'):
+            if dirty & (self.REFRESH_TURN | self.REFRESH_STATUS):
+                self._apply_status_bar()
+            self._render_status_bar()
+
+    def event(self, e):
+        if self._dirty and e.type() == QEvent.Type.UpdateRequest:
+            self.flush_refresh()          # paint the new state, never the stale one
+        return super().event(e)
+
+    def showEvent(self, event):
+        if self._dirty:
+            self.flush_refresh()
+        super().showEvent(event)
+
+    def _apply_turn_ui(self):
+        COUNTERS.bump("Table restyles")
         curr      = self.current_turn_index
         CLR_PEND  = "#93C5FD"
 
@@ -2835,21 +3972,24 @@ class YahtzeeScorecard(QMainWindow):
                 # Tell the player exactly what they rolled and what the priority is
                 joker_face  = self._roller_dice[0]
                 face_name   = ["Ones","Twos","Threes","Fours","Fives","Sixes"][joker_face - 1]
-                upper_r     = joker_face - 1
-                upper_item  = self.table.item(upper_r, self.current_turn_index)
-                upper_claimed = (upper_item and
-                                 upper_item.data(Qt.ItemDataRole.UserRole) == "claimed")
-                if not upper_claimed:
+                legal       = self._roller_moves(curr).legal
+                if legal & CATEGORY_BIT[joker_face - 1]:
                     joker_msg = (
                         f"🃏 Joker — Five {face_name}!  "
                         f"① {face_name} box is open — you must score there."
                     )
-                else:
+                elif legal & LOWER_MASK:
                     joker_msg = (
                         f"🃏 Joker — Five {face_name}!  "
                         f"① {face_name} already claimed.  "
                         f"② Score any open Lower box at full value."
                     )
+                else:
+                    joker_msg = (
+                        f"🃏 Joker — Five {face_name}!  "
+                        f"① {face_name} and ② all Lower boxes claimed.  "
+                        f"③ Take 0 in any open Upper box."
+                    )
             else:
                 joker_msg = (
                     "🃏 Joker Rules Active  —  "
@@ -2892,29 +4032,17 @@ class YahtzeeScorecard(QMainWindow):
 
         UPPER_TT       = "① Joker: score here first if this matches your five-of-a-kind number."
         LOWER_TT       = "② Joker: score here if your matching Upper box is already claimed."
+        ZERO_UPPER_TT  = "③ Joker: every Lower box is full — take 0 here."
         ROLLER_ZERO_TT = "No score with this roll — select 0 to burn this category."
         JOKER_BLOCKED_TT = "① Joker: your matching Upper box is open — score there first."
 
-        # Pre-compute valid rows for the active player's confirmed roll (if any)
-        roller_valid = (
-            self._valid_rows_for_dice(self._roller_dice)
-            if self.use_digital_roller and self._roller_dice is not None
-            else None
-        )
-
-        # When Joker + roller are both active, determine which rows are
-        # scoreable under Joker priority rules given the specific dice.
-        joker_roller_state = None   # None | "must_upper" | "use_lower"
-        joker_upper_r      = None
-        if (self.joker_active and self.use_digital_roller
-                and self._roller_dice is not None):
-            joker_face    = self._roller_dice[0]
-            joker_upper_r = joker_face - 1
-            upper_item    = self.table.item(joker_upper_r, curr)
-            if upper_item and upper_item.data(Qt.ItemDataRole.UserRole) != "claimed":
-                joker_roller_state = "must_upper"   # step ①: upper box is open
-            else:
-                joker_roller_state = "use_lower"    # step ②: use any lower box
+        # One legal-move lookup for the active player's confirmed roll (if
+        # any): `valid` drives the zero-row tint, and under Joker rules
+        # `legal` is exactly the set of rows the Joker priority allows.
+        moves        = self._roller_moves(curr)
+        roller_valid = moves.valid if moves is not None else None
+        joker_legal  = moves.legal if moves is not None and self.joker_active else None
+        joker_upper_r = self._roller_dice[0] - 1 if joker_legal is not None else None
 
         # Red-tint background for zero-only cells
         CLR_ZERO_BG  = "#2D0F0F"   # dark red background
@@ -2939,24 +4067,15 @@ class YahtzeeScorecard(QMainWindow):
                 joker_blocked  = False
 
                 if is_active and status == "unclaimed":
-                    if joker_roller_state == "must_upper":
-                        # Step ①: only the matching upper row is valid
-                        if r == joker_upper_r:
-                            bg = self._theme_active   # highlight it
-                        elif r in PRIMARY_CATEGORIES:
-                            bg = CLR_DISABLED
-                            joker_blocked = True
-
-                    elif joker_roller_state == "use_lower":
-                        # Step ②: any open lower box is valid; upper is dimmed
-                        if r in LOWER_SECTION_PRIMARY:
-                            bg = self._theme_active
-                        elif r in UPPER_SECTION:
-                            bg = CLR_DISABLED
-                            joker_blocked = True
-                        elif r not in LOWER_SECTION_PRIMARY and r in PRIMARY_CATEGORIES:
-                            bg = CLR_DISABLED
-                            joker_blocked = True
+                    if joker_legal is not None:
+                        # Joker + roller: highlight exactly the rows the Joker
+                        # priority allows (① upper, ② lower, ③ zero in upper)
+                        if r in PRIMARY_CATEGORIES:
+                            if joker_legal & CATEGORY_BIT[r]:
+                                bg = self._theme_active
+                            else:
+                                bg = CLR_DISABLED
+                                joker_blocked = True
 
                     elif self.joker_active:
                         # Plain Joker (no roller dice): existing dim logic
@@ -2965,7 +4084,7 @@ class YahtzeeScorecard(QMainWindow):
 
                     elif roller_valid is not None:
                         # Pure roller (no Joker): red tint for zero-only rows
-                        if r in PRIMARY_CATEGORIES and r not in roller_valid:
+                        if r in PRIMARY_CATEGORIES and not roller_valid & CATEGORY_BIT[r]:
                             bg = CLR_ZERO_BG
                             roller_zero = True
 
@@ -2978,15 +4097,12 @@ class YahtzeeScorecard(QMainWindow):
 
                 # Tooltips
                 if is_active and status == "unclaimed":
-                    if joker_roller_state == "must_upper" and r == joker_upper_r:
-                        tt = UPPER_TT
-                    elif joker_roller_state == "must_upper" and joker_blocked:
-                        tt = JOKER_BLOCKED_TT
-                    elif joker_roller_state == "use_lower" and r in LOWER_SECTION_PRIMARY:
-                        tt = LOWER_TT
-                    elif joker_roller_state == "use_lower" and joker_blocked:
-                        tt = JOKER_BLOCKED_TT
-                    elif self.joker_active and not joker_roller_state:
+                    if joker_legal is not None and r in PRIMARY_CATEGORIES:
+                        tt = (JOKER_BLOCKED_TT if joker_blocked
+                              else UPPER_TT if r == joker_upper_r
+                              else ZERO_UPPER_TT if r in UPPER_SECTION
+                              else LOWER_TT)
+                    elif self.joker_active and joker_legal is None:
                         tt = (UPPER_TT if r in UPPER_SECTION
                               else LOWER_TT if r in LOWER_SECTION_PRIMARY else "")
                     elif roller_zero:
@@ -3011,8 +4127,6 @@ class YahtzeeScorecard(QMainWindow):
                     widget.apply_cell_style(bg, txt)
                     widget.setEnabled(is_active and not joker_blocked)
 
-        self.update_status_bar()
-
     def update_yahtzee_bonus_state(self, c):
         widget = self.table.cellWidget(15, c)
         if not widget: return
@@ -3024,32 +4138,31 @@ class YahtzeeScorecard(QMainWindow):
 
     # -------------------------------------------------- status bar ----------
     def _load_alltime_high(self):
+        score_store().when_loaded(self._show_alltime_high)
+
+    def _show_alltime_high(self, store):
         high_str = "🏅 Best: —"
         low_str  = "🪦 Worst: —"
 
         try:
-            if os.path.exists("yahtzee_highscores.json"):
-                with open("yahtzee_highscores.json") as f:
-                    data = json.load(f)
-                if data:
-                    t = data[0]
-                    high_str = f"🏅 Best: {t['name']} {t['score']} pts ({t['date']})"
+            if store.high:
+                t = store.high[0]
+                high_str = f"🏅 Best: {t['name']} {t['score']} pts ({t['date']})"
         except Exception:
             pass
 
         try:
-            if os.path.exists("yahtzee_lowscores.json"):
-                with open("yahtzee_lowscores.json") as f:
-                    data = json.load(f)
-                if data:
-                    b = data[0]
-                    low_str = f"🪦 Worst: {b['name']} {b['score']} pts ({b['date']})"
+            if store.low:
+                b = store.low[0]
+                low_str = f"🪦 Worst: {b['name']} {b['score']} pts ({b['date']})"
         except Exception:
             pass
 
         self._sb_data['alltime'] = f"{high_str}  |  {low_str}"
+        self._request_refresh(self.REFRESH_RENDER)
 
     def _render_status_bar(self):
+        COUNTERS.bump("Status bar renders")
         d = self._sb_data
         def c3(text, color, align="left", bold=False):
             w = "font-weight:bold;" if bold else ""
@@ -3066,30 +4179,37 @@ class YahtzeeScorecard(QMainWindow):
             + c3(d['last'],   CLR_CLAIMED_TEXT, "right")
             + "</tr></table>"
         )
+        # A live win-probability estimate replaces the "trails by" text,
+        # but an active scoring streak still takes the slot.
+        streak = d['winprob'] if d['winprob'] and not d['streak_hot'] else d['streak']
         self._sb_row2.setText(
             "<table width='100%' cellspacing='0' cellpadding='0'><tr>"
             + c4(d['upper'],   d['upper_color'], "left")
-            + c4(d['streak'],  "#F97316",        "center")
+            + c4(streak,       "#F97316",        "center")
             + c4(d['best'],    CLR_CLAIMED_TEXT, "center")
             + c4(d['alltime'], "#94A3B8",        "right")
             + "</tr></table>"
         )
 
-    def update_status_bar(self):
-        if not hasattr(self, '_sb_data'): return
+    def _apply_status_bar(self):
         totals = [int(self.table.item(18, c).text()) for c in range(len(self.players))]
         curr   = self.current_turn_index
         solo   = (len(self.players) == 1)
         d      = self._sb_data
 
+        proj   = self._projected
+
+        def projected(c):
+            return f" → ~{proj[c][0]:.0f}" if c in proj and self.player_has_turns_left(c) else ""
+
         if solo:
             d['leader'] = f"🎲 {self.players[0]}  —  {totals[0]} pts"
-            d['scores'] = ""
+            d['scores'] = f"📈 Projected: ~{proj[0][0]:.0f} pts" if projected(0) else ""
         else:
             best_c = totals.index(max(totals))
             d['leader'] = f"🏆 {self.players[best_c]} leading ({totals[best_c]} pts)"
             d['scores'] = "  ".join(
-                f"{self.players[c]}: {totals[c]}" for c in range(len(self.players))
+                f"{self.players[c]}: {totals[c]}{projected(c)}" for c in range(len(self.players))
             )
 
         d['last'] = getattr(self, '_last_score_msg', "")
@@ -3102,6 +4222,8 @@ class YahtzeeScorecard(QMainWindow):
         else:
             d['upper']       = f"Upper: {self.players[curr]} {u_sum}/63 — {63 - u_sum} needed"
             d['upper_color'] = '#94A3B8'
+            if curr in proj:
+                d['upper'] += f" ({proj[curr][1]:.0%} bonus)"
 
         best_score, best_who, best_cat = 0, "", ""
         for c in range(len(self.players)):
@@ -3124,6 +4246,7 @@ class YahtzeeScorecard(QMainWindow):
             d['streak'] = f"📋 {remaining} categor{'y' if remaining == 1 else 'ies'} left"
         else:
             sp, sn = self._streak_player, self._streak_count
+            d['streak_hot'] = bool(sp and sn >= 2)
             if sp and sn >= 2:
                 d['streak'] = f"{'🔥' * min(sn, 3)} {sp}: {sn}-turn streak"
             else:
@@ -3136,7 +4259,25 @@ class YahtzeeScorecard(QMainWindow):
                                    f"📊 {self.players[si]} trails {self.players[li]} by {gap} pts")
                 else:
                     d['streak'] = ""
-        self._render_status_bar()
+            if self._winprob is not None:
+                self._winprob.restart([self._player_state(c) for c in range(len(self.players))])
+
+    def _player_state(self, c) -> PlayerState:
+        """Column c's card, reduced to what matters for the rest of the game."""
+        box = self.table.item(14, c).text()
+        return PlayerState(
+            self._claimed[c],
+            int(self.table.item(6, c).text()),
+            int(self.table.item(17, c).text()),
+            int(box) if box.isdigit() else None,
+        )
+
+    def _on_winprob(self, probs, trials):
+        ranked = sorted(zip(self.players, probs), key=lambda x: x[1], reverse=True)
+        shown  = "  ·  ".join(f"{name} {p:.0%}" for name, p in ranked[:3])
+        more   = "  …" if len(ranked) > 3 else ""
+        self._sb_data['winprob'] = f"📊 Win: {shown}{more}"
+        self._request_refresh(self.REFRESH_RENDER)
 
     # ------------------------------------------------ game over / save ------
     def check_game_over(self):
@@ -3147,9 +4288,18 @@ class YahtzeeScorecard(QMainWindow):
              for i in range(len(self.players))],
             key=lambda x: x[1], reverse=True
         )
+        self._clear_autosave()
+        self._publish("game_over", ranking=scores)
         self.save_high_score(scores[0][0], scores[0][1])
         for name, score in scores:
             self.save_low_score(name, score)
+        self.record_player_stats()
+        if len(scores) > 1:
+            self.record_ratings(scores)
+        self.save_game_record()
+        if self._session is not None:
+            self._session.record(scores, {name: self._final_card(c)
+                                          for c, name in enumerate(self.players)})
 
         # Build per-category breakdown for the chart, keyed by player name
         player_data = {}
@@ -3166,7 +4316,24 @@ class YahtzeeScorecard(QMainWindow):
                     cat_scores.append(None)
             player_data[player] = cat_scores
 
-        dlg    = GameOverDialog(scores, self, player_data=player_data); dlg.exec()
+        projections = {
+            player: [self._proj_history[i].get(n) for n in range(len(PRIMARY_CATEGORIES) + 1)]
+            for i, player in enumerate(self.players)
+        } if self._projected else None
+
+        regret = (regret_report(self._turn_log)
+                  if self._turn_log and projection_ready() else None)
+
+        dlg = GameOverDialog(scores, self, player_data=player_data,
+                             projections=projections, regret=regret, session=self._session)
+        async_bridge().run(self._game_over(dlg), owner=self)
+
+    async def _game_over(self, dlg):
+        """Await the game-over choice, then close the board for run_app to act on."""
+        try:
+            await exec_async(dlg)
+        finally:
+            dlg.deleteLater()
         choice = dlg.result_choice
         self.play_again_requested = choice in (
             GameOverDialog.SAME_ORDER, GameOverDialog.ROLL_ORDER, GameOverDialog.NEW_GAME
@@ -3175,59 +4342,133 @@ class YahtzeeScorecard(QMainWindow):
         self.new_game       = (choice == GameOverDialog.NEW_GAME)
         self.close()
 
+    # ------------------------------------------------------------ autosave --
+    def _snapshot(self) -> dict:
+        """Everything needed to resume this game, as plain JSON-ready data."""
+        return {
+            "version": 1, "saved": datetime.now().strftime("%Y-%m-%d %H:%M"),
+            "players": list(self.players), "digital": self.use_digital_roller,
+            "theme": self._current_theme_name, "colored_dice": self.colored_dice,
+            "turn": self.current_turn_index,
+            "cards": [self._final_card(c) for c in range(len(self.players))],
+            "joker": self.joker_active, "dice": self._roller_dice,
+            "correction": [self._correction_pending, self._last_unclaimed_name],
+            "clock_ms": [self._elapsed.elapsed(), self._turn_elapsed.elapsed()],
+            "streak": [self._streak_player, self._streak_count],
+            "last_msg": self._last_score_msg,
+            "turn_log": list(self._turn_log), "turn_rolls": list(self._turn_rolls),
+            "proj_history": [dict(h) for h in self._proj_history],
+        }
+
+    def _autosave(self):
+        """
+        Hand a snapshot to the I/O worker, which writes it atomically off the
+        GUI thread; a newer snapshot replaces one still waiting to be written.
+        """
+        if not any(self.player_has_turns_left(c) for c in range(len(self.players))):
+            return   # finished — check_game_over has cleared the file
+        path, snap = score_path(AUTOSAVE_FILE), self._snapshot()
+        io_worker().submit(path, lambda: write_json_atomic(path, snap))
+
+    def _clear_autosave(self):
+        path = score_path(AUTOSAVE_FILE)
+        io_worker().submit(path, lambda: remove_file(path))
+
+    def restore_snapshot(self, snap: dict):
+        """Put a board fresh from start_game() back into an autosaved state."""
+        self._is_updating = True
+        self.table.setUpdatesEnabled(False)
+        for c, card in enumerate(snap["cards"]):
+            for key, v in card.items():
+                r, item = int(key), self.table.item(int(key), c)
+                item.setText(str(v))
+                if r == 15:
+                    self.table.cellWidget(r, c).findChild(QLabel).setText(str(v))
+                    continue
+                item.setData(Qt.ItemDataRole.UserRole, "claimed")
+                self._claimed[c] |= CATEGORY_BIT[r]
+                btn = self.table.cellWidget(r, c)
+                btn.setCurrentIndex(btn.findText(str(v // (r + 1) if r in UPPER_SECTION else v)))
+            self.recalc(c)
+        self.table.setUpdatesEnabled(True)
+        self._is_updating = False
+
+        self.current_turn_index = snap["turn"]
+        self.joker_active       = snap["joker"]
+        self._correction_pending, self._last_unclaimed_name = snap["correction"]
+        self._streak_player, self._streak_count = snap["streak"]
+        self._last_score_msg = snap["last_msg"]
+        self._turn_log       = snap["turn_log"]
+        self._turn_rolls     = snap["turn_rolls"]
+        self._proj_history   = [{int(n): e for n, e in h.items()} for h in snap["proj_history"]]
+        self._elapsed.resume_from(snap["clock_ms"][0])
+        self._turn_elapsed.resume_from(snap["clock_ms"][1])
+        if snap["dice"] is not None:
+            self._roller_dice = snap["dice"]
+            self._show_rolled_banner(self._roller_dice)
+        self.update_turn_ui()
+        if self._spectators is not None:
+            self._spectators.start_game(
+                players=list(self.players), player=self.players[self.current_turn_index],
+                totals=[int(self.table.item(18, c).text()) for c in range(len(self.players))],
+                timer=snap["clock_ms"][0] // 1000, turn_timer=snap["clock_ms"][1] // 1000,
+            )
+
     def save_high_score(self, name, score):
-        filename    = score_path("yahtzee_highscores.json")
-        scores_data = []
-        if os.path.exists(filename):
-            try:
-                with open(filename) as f: scores_data = json.load(f)
-            except json.JSONDecodeError: pass
-        scores_data.append({
-            "name": name, "score": score,
-            "date": datetime.now().strftime("%Y-%m-%d")
-        })
-        scores_data = sorted(scores_data, key=lambda x: x["score"], reverse=True)[:10]
-        with open(filename, "w") as f:
-            json.dump(scores_data, f, indent=4)
+        score_store().add_score("high", name, score)
         self._load_alltime_high()
 
+    def _final_card(self, c) -> dict:
+        """Column c as {row: score} for claimed rows, plus the bonus count in row 15."""
+        card = {r: int(self.table.item(r, c).text()) for r in PRIMARY_CATEGORIES
+                if self.table.item(r, c).data(Qt.ItemDataRole.UserRole) == "claimed"}
+        card[15] = int(self.table.item(15, c).text())
+        return card
+
+    def record_player_stats(self):
+        """Fold this game into the running per-player stats (O(1) per player)."""
+        score_store().record_cards((name, self._final_card(c)) for c, name in enumerate(self.players))
+
+    def record_ratings(self, ranking):
+        """Incremental rating update from the ranked (name, score) list."""
+        score_store().rate(ranking)
+
+    def save_game_record(self):
+        """Queue the finished game for the archive (see write_game_record)."""
+        cards = [{str(r): v for r, v in self._final_card(c).items()}
+                 for c in range(len(self.players))]
+        now  = datetime.now()
+        game = {"date": now.strftime("%Y-%m-%d %H:%M"), "players": list(self.players),
+                "cards": cards, "turns": self._turn_log}
+        score_store().record_game(game, now)
+
     def save_low_score(self, name, score):
-        filename    = score_path("yahtzee_lowscores.json")
-        scores_data = []
-        if os.path.exists(filename):
-            try:
-                with open(filename) as f: scores_data = json.load(f)
-            except json.JSONDecodeError: pass
-        scores_data.append({
-            "name": name, "score": score,
-            "date": datetime.now().strftime("%Y-%m-%d")
-        })
-        scores_data = sorted(scores_data, key=lambda x: x["score"])[:10]
-        with open(filename, "w") as f:
-            json.dump(scores_data, f, indent=4)
+        score_store().add_score("low", name, score)
         self._load_alltime_high()
 
     def show_high_scores(self):
+        score_store().when_loaded(self._open_high_scores)
+
+    def _open_high_scores(self, store):
         dialog = QDialog(self)
         dialog.setWindowTitle("🏆 Hall of Fame  &  🪦 Hall of Shame")
-        dialog.resize(700, 430)
+        dialog.resize(820, 640)
         dialog.setStyleSheet(DARK_STYLESHEET)
         main_layout = QVBoxLayout(dialog)
         tables_row  = QHBoxLayout()
 
-        def make_table_panel(filename, label):
+        def make_table_panel(data, label):
             panel = QVBoxLayout()
             title = QLabel(label)
             title.setAlignment(Qt.AlignmentFlag.AlignCenter)
             title.setStyleSheet("font-size: 14px; font-weight: bold; padding: 4px;")
             panel.addWidget(title)
-            if not os.path.exists(filename):
+            if not data:
                 msg = QLabel("No scores recorded yet.")
                 msg.setAlignment(Qt.AlignmentFlag.AlignCenter)
                 panel.addWidget(msg)
             else:
                 try:
-                    with open(filename) as f: data = json.load(f)
                     tbl = QTableWidget(len(data), 4)
                     tbl.setHorizontalHeaderLabels(["Rank", "Player", "Score", "Date"])
                     tbl.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
@@ -3243,24 +4484,65 @@ class YahtzeeScorecard(QMainWindow):
                     panel.addWidget(QLabel(f"Error: {e}"))
             return panel
 
-        tables_row.addLayout(make_table_panel(score_path("yahtzee_highscores.json"), "🏆 Top Scores"))
+        tables_row.addLayout(make_table_panel(store.high, "🏆 Top Scores"))
 
         divider = QFrame()
         divider.setFrameShape(QFrame.Shape.VLine)
         divider.setStyleSheet("color: #2E3F60;")
         tables_row.addWidget(divider)
 
-        tables_row.addLayout(make_table_panel(score_path("yahtzee_lowscores.json"), "🪦 Hall of Shame"))
+        tables_row.addLayout(make_table_panel(store.low, "🪦 Hall of Shame"))
 
         main_layout.addLayout(tables_row)
+        main_layout.addWidget(self._build_stats_panel(store.book))
 
         close_btn = QPushButton("Close")
         close_btn.clicked.connect(dialog.close)
         main_layout.addWidget(close_btn)
-        dialog.exec()
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.open()
+
+    def _build_stats_panel(self, book):
+        """Lifetime per-player stats from the running aggregates."""
+        panel = QWidget()
+        lay   = QVBoxLayout(panel); lay.setContentsMargins(0, 6, 0, 0)
+        title = QLabel("📈 Player Stats")
+        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title.setStyleSheet("font-size: 14px; font-weight: bold; padding: 4px;")
+        lay.addWidget(title)
+        if not book:
+            msg = QLabel("No games recorded yet.")
+            msg.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            lay.addWidget(msg)
+            return panel
+
+        def fmt(v):
+            return "—" if v is None else f"{v:.0f}"
+
+        headers = ["Player", "Games", "Mean", "Median", "P25–P75", "P90",
+                   "Best", "Worst", "Yahtziis", "Bonus %"]
+        ranked  = sorted(book.players.items(), key=lambda x: (-x[1].games, x[0]))
+        tbl = QTableWidget(len(ranked), len(headers))
+        tbl.setHorizontalHeaderLabels(headers)
+        tbl.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        tbl.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        tbl.verticalHeader().setVisible(False)
+        for r, (name, a) in enumerate(ranked):
+            cells = [
+                name, str(a.games), f"{a.mean:.1f}", fmt(a.percentile(50)),
+                f"{fmt(a.percentile(25))}–{fmt(a.percentile(75))}", fmt(a.percentile(90)),
+                fmt(a.best), fmt(a.worst), str(a.yahtziis), f"{a.bonus_rate:.0%}",
+            ]
+            for col, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if col: item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                tbl.setItem(r, col, item)
+        lay.addWidget(tbl)
+        return panel
 
     def reset(self):
         if QMessageBox.question(self, "Reset", "Clear?") == QMessageBox.StandardButton.Yes:
+            self._clear_autosave()
             self.current_turn_index = 0
             self._roller_dice       = None
             self.setup_board()
@@ -3270,92 +4552,425 @@ class YahtzeeScorecard(QMainWindow):
                 f"color: {CLR_ACTIVE_TURN}; padding: 2px 8px;"
             )
             self.update_turn_ui()
+            if self._spectators is not None:
+                self._spectators.start_game(
+                    players=list(self.players), player=self.players[0],
+                    totals=[0] * len(self.players), timer=0, turn_timer=0,
+                )
             if self.use_digital_roller:
                 self._open_roller_for_current_player()
 
 
 # ============================================================================
-# ENTRY POINT
+# STALL WATCHDOG
 # ============================================================================
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    app.setStyleSheet(DARK_STYLESHEET)
+def start_stall_watchdog(threshold_ms: float = 50.0, log_path: str = None) -> StallWatchdog:
+    """
+    Start a StallWatchdog on the GUI thread.  A precise timer beats it every
+    quarter threshold, so any event-loop stall longer than `threshold_ms`
+    gets the GUI thread's Python stack logged (default scores/stalls.log).
+    """
+    dog   = StallWatchdog(threshold_ms, log_path or score_path("stalls.log"))
+    timer = QTimer(QApplication.instance())
+    timer.setTimerType(Qt.TimerType.PreciseTimer)
+    timer.setInterval(max(1, int(threshold_ms * dog.POLL_FRACTION)))
+    timer.timeout.connect(dog.beat)
+    timer.start()
+    dog.start()
+    return dog
+
+
+# ============================================================================
+# DEBUG COUNTERS
+# ============================================================================
+class _CounterHooks(QObject):
+    """
+    App-wide event filter behind the debug panel: counts paint events per
+    widget class and QObject children added / removed (each creation,
+    destruction or reparenting of an object with a parent).
+    """
+
+    def eventFilter(self, obj, event):
+        t = event.type()
+        if t == QEvent.Type.Paint:
+            COUNTERS.bump(f"paint {type(obj).__name__}")
+        elif t == QEvent.Type.ChildAdded:
+            COUNTERS.bump("QObject children added")
+        elif t == QEvent.Type.ChildRemoved:
+            COUNTERS.bump("QObject children removed")
+        return False
+
+
+_counter_hooks = None
+
+
+def arm_counters():
+    """
+    Install the Qt-side counters: the event filter above plus counting
+    wrappers on QWidget.setStyleSheet and QSvgWidget.load.  They cost a
+    Python call per event, so they are only armed once the panel is first
+    opened; every counter restarts from zero at that point.
+    """
+    global _counter_hooks
+    if _counter_hooks is not None:
+        return
+    _counter_hooks = _CounterHooks()
+    QApplication.instance().installEventFilter(_counter_hooks)
+
+    def counting(cls, name, key):
+        orig = getattr(cls, name)
+        def wrapper(self, *args):
+            COUNTERS.bump(key)
+            return orig(self, *args)
+        setattr(cls, name, wrapper)
+
+    counting(QWidget, "setStyleSheet", "setStyleSheet calls")
+    counting(QSvgWidget, "load", "SVG widget loads")
+    COUNTERS.reset()
+
+
+class DebugCountersPanel(QWidget):
+    """Hidden tool window (Ctrl+Shift+D) listing COUNTERS live, with a reset."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.WindowType.Tool)
+        self.setWindowTitle("Debug counters")
+        self.setMinimumWidth(360)
+        layout = QVBoxLayout(self)
+        self.text = QLabel()
+        self.text.setFont(QFont("monospace", 9))
+        self.text.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.text.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        layout.addWidget(self.text, 1)
+        reset_btn = QPushButton("Reset counters")
+        reset_btn.clicked.connect(lambda: (COUNTERS.reset(), self.refresh()))
+        layout.addWidget(reset_btn)
+        self._timer = QTimer(self)
+        self._timer.setInterval(500)
+        self._timer.timeout.connect(self.refresh)
+
+    def refresh(self):
+        self.text.setText("\n".join(COUNTERS.lines()))
+
+    def showEvent(self, event):
+        self.refresh()
+        self._timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
+
+
+# ============================================================================
+# TRACING
+# ============================================================================
+TRACED_METHODS = {
+    "app": {
+        "YahtzeeScorecard": ("flush_refresh", "_apply_turn_ui", "_update_upper_dropdowns",
+                             "_update_lower_dropdowns", "recalc", "_apply_status_bar",
+                             "handle_dropdown", "apply_roller_theme"),
+        "YahtzeeRollerWidget": ("_finish_roll",),
+    },
+    "paint": {
+        "DieWidget": ("paintEvent",),
+        "ScoreBreakdownChart": ("paintEvent",),
+    },
+}
+
+
+def enable_tracing(path: str = None) -> Tracer:
+    """
+    Wrap the TRACED_METHODS in timed spans and write them as Chrome trace
+    JSON (default scores/trace-<time>.json) when the process exits.  Call
+    before the windows are built so signal connections pick up the wrappers.
+    """
+    tracer = Tracer()
+    for cat, classes in TRACED_METHODS.items():
+        for cls_name, names in classes.items():
+            tracer.instrument(globals()[cls_name], *names, cat=cat)
+    path = path or score_path(f"trace-{datetime.now():%Y%m%d-%H%M%S}.json")
+    atexit.register(tracer.write, path)
+    return tracer
+
+
+# ============================================================================
+# PLAY-AGAIN BENCHMARK
+# ============================================================================
+class _FirstPaintProbe(QObject):
+    """Event filter that records when its widget first paints."""
+
+    def __init__(self):
+        super().__init__()
+        self.painted = False
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            self.painted = True
+        return False
+
 
+def _paint_probe(widget) -> _FirstPaintProbe:
+    probe = _FirstPaintProbe()
+    widget.installEventFilter(probe)
+    return probe
+
+
+def _pump_until(done, t0: float, timeout: float = 5.0) -> float:
+    """Process events until done() is true; seconds since t0."""
+    while not done() and time.perf_counter() < t0 + timeout:
+        QApplication.processEvents()
+    return time.perf_counter() - t0
+
+
+def _close_board(board):
+    board.loop = QEventLoop()   # closeEvent looks for it
+    board.close()
+
+
+def _time_to_first_frame(start) -> float:
+    """
+    Call start(), which shows a scorecard and returns it, then pump events
+    until its table paints.  Painting only happens in the event loop, so the
+    probe can be installed after start() returns.
+    """
+    t0    = time.perf_counter()
+    board = start()
+    probe = _paint_probe(board.table.viewport())
+    dt    = _pump_until(lambda: probe.painted, t0)
+    board.table.viewport().removeEventFilter(probe)
+    _close_board(board)
+    return dt
+
+
+def bench_play_again(rounds: int = 20, players=("Ann", "Bob", "Cy"), roller: bool = True) -> dict:
+    """
+    Time play-again to the first interactive frame, both ways: building a
+    fresh scorecard per game (the old entry point) and resetting one reused
+    window with start_game().  With the roller on, each restart also opens
+    it, as the entry point does.  Returns {mode: [seconds, ...]}.
+    """
+    players = list(players)
+    results = {"rebuild": [], "reuse": []}
+    kept    = YahtzeeScorecard(players, use_digital_roller=roller)
+
+    def rebuild():
+        board = YahtzeeScorecard(players, use_digital_roller=roller)
+        board.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        board.show()
+        if roller:
+            board._open_roller_for_current_player()
+        return board
+
+    def reuse():
+        kept.start_game(players, use_digital_roller=roller)
+        kept.show()
+        if roller:
+            kept._open_roller_for_current_player()
+        return kept
+
+    for _ in range(rounds):
+        results["rebuild"].append(_time_to_first_frame(rebuild))
+        results["reuse"].append(_time_to_first_frame(reuse))
+    return results
+
+
+def bench_first_turn(rounds: int = 10, players=("Ann", "Bob", "Cy")) -> dict:
+    """
+    First-turn latency of a digital-roller game from a cold start (die-face
+    and chart caches cleared): the scorecard's first frame and the roller's
+    first frame, opening the roller straight away with the warm-up left to
+    run afterwards ("at-once", the entry point) or only once the warm-up
+    has finished ("after-warm").
+    Returns {mode: [(board seconds, roller seconds), ...]}.
+    """
+    players = list(players)
+    results = {"at-once": [], "after-warm": []}
+    for _ in range(rounds):
+        for mode, times in results.items():
+            _DIE_FACE_PIXMAPS.clear()
+            ScoreBreakdownChart._row_labels.clear()
+            probes = {}
+
+            t0    = time.perf_counter()
+            board = YahtzeeScorecard(players, use_digital_roller=True)
+            board.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+            probes["board"] = _paint_probe(board.table.viewport())
+            board.show()
+
+            def open_roller():
+                board._open_roller_for_current_player()
+                probes["roller"] = _paint_probe(board._roller)
+
+            if mode == "at-once":
+                open_roller()
+            else:
+                board._prewarm.then(open_roller)
+            board_s  = _pump_until(lambda: probes["board"].painted, t0)
+            roller_s = _pump_until(lambda: "roller" in probes and probes["roller"].painted, t0)
+            times.append((board_s, roller_s))
+            board._roller.removeEventFilter(probes["roller"])
+            _close_board(board)
+    return results
+
+
+def print_first_turn_bench(results: dict):
+    for mode, times in results.items():
+        board  = sorted(b * 1000 for b, _ in times)
+        roller = sorted(r * 1000 for _, r in times)
+        print(f"{mode:<11} n={len(times):<4} board first frame median={board[len(board) // 2]:7.1f} ms"
+              f"   roller ready median={roller[len(roller) // 2]:7.1f} ms")
+
+
+def print_play_again_bench(results: dict):
+    for mode, times in results.items():
+        ms = sorted(t * 1000 for t in times)
+        print(f"{mode:<8} n={len(ms):<4} median={ms[len(ms) // 2]:7.1f} ms  "
+              f"worst={ms[-1]:7.1f} ms")
+
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+async def run_app(spectators=None, session=None) -> int:
+    """
+    The app's whole flow as one coroutine: resume prompt, registration,
+    roll-off and the games, repeating on play-again.  Every window is
+    awaited (exec_async / wait_closed) instead of running its own nested
+    event loop.  Returns the exit code.
+    """
     ordered_names      = None
     prefill_names      = None
     use_roller_carry   = False
     theme_carry        = "Classic"
     colored_dice_carry = True
 
-    while True:
-        # --- Registration ---
-        if ordered_names is None:
-            setup = PlayerSetupDialog(prefill=prefill_names, initial_theme=theme_carry)
-            prefill_names = None
-            if not setup.exec():
-                break
-            names = [
-                i.text().strip() or f"P{idx+1}"
-                for idx, (_, i) in enumerate(setup.player_inputs)
-            ]
-            use_roller_carry   = setup.use_digital_roller_enabled()
-            theme_carry        = setup.selected_theme()
-            colored_dice_carry = setup.colored_dice_enabled()
+    # Offer to resume a game the last run did not finish
+    resume = load_autosave()
+    if resume is not None:
+        ask = QMessageBox(QMessageBox.Icon.Question, "Resume game?",
+                          f"Resume the unfinished game of {', '.join(resume['players'])} "
+                          f"(saved {resume['saved']})?",
+                          QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if await exec_async(ask) == QMessageBox.StandardButton.Yes.value:
+            ordered_names      = resume["players"]
+            use_roller_carry   = resume["digital"]
+            theme_carry        = resume["theme"] or theme_carry
+            colored_dice_carry = resume["colored_dice"]
         else:
-            names = ordered_names
+            autosave = score_path(AUTOSAVE_FILE)
+            io_worker().submit(autosave, lambda: remove_file(autosave))
+            resume = None
 
-        # --- Roll-off (skipped for single player) ---
-        if len(names) > 1:
-            rolloff = RollOffDialog(names)
-            if not rolloff.exec():
-                break
-            ordered_names = rolloff.sorted_names
-        else:
-            ordered_names = names
-
-        # --- Game ---
-        w      = YahtzeeScorecard(ordered_names, use_digital_roller=use_roller_carry, initial_theme=theme_carry, colored_dice=colored_dice_carry)
-        w.loop = QEventLoop()
-        w.show()
-        if use_roller_carry:
-            w._open_roller_for_current_player()
-        w.loop.exec()
-
-        if not getattr(w, 'play_again_requested', False):
-            sys.exit(0)
-
-        if getattr(w, 'new_game', False):
-            prefill_names      = ordered_names
-            ordered_names      = None
-            use_roller_carry   = False   # let them choose again at registration
-            colored_dice_carry = True
-            # theme_carry preserved so registration pre-selects the last theme
-            continue
-
-        if not getattr(w, 'roll_for_order', False) or len(ordered_names) == 1:
-            # Same Order — skip registration and rolloff entirely
-            w2_names = ordered_names
+    try:
+        # Windows are built once and reset in place for every later game
+        setup   = None   # PlayerSetupDialog
+        rolloff = None   # RollOffDialog
+        w       = None   # YahtzeeScorecard
+
+        while True:
+            # --- Registration ---
+            if ordered_names is None:
+                if setup is None:
+                    setup = PlayerSetupDialog(prefill=prefill_names, initial_theme=theme_carry)
+                else:
+                    setup.reset(prefill=prefill_names, initial_theme=theme_carry)
+                prefill_names = None
+                if not await exec_async(setup):
+                    break
+                names = [
+                    i.text().strip() or f"P{idx+1}"
+                    for idx, (_, i) in enumerate(setup.player_inputs)
+                ]
+                use_roller_carry   = setup.use_digital_roller_enabled()
+                theme_carry        = setup.selected_theme()
+                colored_dice_carry = setup.colored_dice_enabled()
+            else:
+                names = ordered_names
+
+            # --- Roll-off (skipped for single player and for a resumed game) ---
+            if len(names) > 1 and resume is None:
+                if rolloff is None:
+                    rolloff = RollOffDialog(names)
+                else:
+                    rolloff.reset(names)
+                if not await exec_async(rolloff):
+                    break
+                ordered_names = rolloff.sorted_names
+            else:
+                ordered_names = names
+
+            # --- Game(s) — Same Order repeats without registration or roll-off ---
             while True:
-                w2      = YahtzeeScorecard(w2_names, use_digital_roller=use_roller_carry, initial_theme=theme_carry, colored_dice=colored_dice_carry)
-                w2.loop = QEventLoop()
-                w2.show()
-                if use_roller_carry:
-                    w2._open_roller_for_current_player()
-                w2.loop.exec()
-
-                if not getattr(w2, 'play_again_requested', False):
-                    sys.exit(0)
-                if getattr(w2, 'new_game', False):
-                    prefill_names      = w2_names
+                if w is None:
+                    w = YahtzeeScorecard(ordered_names, use_digital_roller=use_roller_carry, initial_theme=theme_carry, colored_dice=colored_dice_carry, spectators=spectators, session=session)
+                else:
+                    w.start_game(ordered_names, use_digital_roller=use_roller_carry,
+                                 initial_theme=theme_carry, colored_dice=colored_dice_carry)
+                if resume is not None:
+                    w.restore_snapshot(resume)
+                    resume = None
+                w.show()
+                if use_roller_carry and w._roller_dice is None:
+                    w._open_roller_for_current_player()
+                await wait_closed(w)
+
+                if not w.play_again_requested:
+                    return 0
+                if w.new_game:
+                    prefill_names      = ordered_names
                     ordered_names      = None
-                    use_roller_carry   = False
+                    use_roller_carry   = False   # let them choose again at registration
                     colored_dice_carry = True
+                    # theme_carry preserved so registration pre-selects the last theme
                     break
-                if getattr(w2, 'roll_for_order', False):
-                    ordered_names = w2_names
-                    break
+                if w.roll_for_order and len(ordered_names) > 1:
+                    break   # ordered_names is set, outer loop goes back to roll-off
                 # else same order again — keep inner loop running
+    finally:
+        await io_flushed(5.0)   # the last game's scores are on disk before exit
+    return 0
+
 
-        # Roll for Order path: ordered_names is set, outer loop goes back to rolloff
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    score_store()                  # starts reading the score files while the UI builds
+    app.setStyleSheet(DARK_STYLESHEET)
 
-    sys.exit(0)
+    ap = argparse.ArgumentParser(description="Yahtzii Pro scorecard")
+    ap.add_argument("--spectate", nargs="?", const="yahtzii-spectator", default=None,
+                    metavar="NAME",
+                    help="stream game events to local spectators on socket / pipe NAME")
+    ap.add_argument("--bench-play-again", type=int, default=0, metavar="N",
+                    help="time N play-again restarts to the first painted frame, then exit")
+    ap.add_argument("--bench-first-turn", type=int, default=0, metavar="N",
+                    help="time N cold first turns with and without idle prewarming, then exit")
+    ap.add_argument("--watchdog", nargs="?", type=float, const=50.0, default=None, metavar="MS",
+                    help="log the GUI thread's stack to scores/stalls.log whenever the event "
+                         "loop stalls longer than MS (default 50)")
+    ap.add_argument("--trace", nargs="?", const="", default=None, metavar="PATH",
+                    help="record Chrome trace spans of the hot paths and write them to PATH "
+                         "(default scores/trace-<time>.json) on exit")
+    cli, _ = ap.parse_known_args(app.arguments()[1:])
+    if cli.trace is not None:
+        enable_tracing(cli.trace or None)
+    if cli.bench_play_again:
+        print_play_again_bench(bench_play_again(cli.bench_play_again))
+    if cli.bench_first_turn:
+        print_first_turn_bench(bench_first_turn(cli.bench_first_turn))
+    if cli.bench_play_again or cli.bench_first_turn:
+        sys.exit(0)
+    if cli.watchdog:
+        start_stall_watchdog(cli.watchdog)
+    spectators = SpectatorHub(cli.spectate) if cli.spectate else None
+    session    = SessionStats()   # lives for the whole run, across play-again games
+
+    # Qt runs one event loop for the whole session; the flow above decides when it ends
+    app.setQuitOnLastWindowClosed(False)
+    bridge = async_bridge()
+    flow   = bridge.run(run_app(spectators, session))
+    flow.add_done_callback(
+        lambda t: app.exit(1 if t.cancelled() or t.exception() else t.result()))
+    code = app.exec()
+    bridge.close()
+    sys.exit(code)
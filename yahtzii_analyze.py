@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+yahtzii_analyze.py — Parallel analysis of recorded Yahtzii games.
+
+Reads every recorded game under a directory — *.json (one game per file),
+*.jsonl (one game per line) or a yahtzii_archive.GameArchive — and reports
+per-player averages, category hit rates, Yahtzii frequency, Upper-bonus
+rate and decision regret.
+
+Files (or archive chunks) are handed to a process pool in batches.  Each
+worker folds its batch into a small Partial; partials are merged with
+associative reducers as they arrive, so memory stays flat however large
+the archive grows.  Totals come from yahtzii_rules.card_totals — the
+scorecard's own rules.
+
+Run:  python yahtzii_analyze.py scores/games [--workers 8] [--json]
+      python yahtzii_analyze.py scores/archive             # columnar archive
+      python yahtzii_analyze.py /tmp/sim --simulate 5000   # write greedy games first
+      python yahtzii_analyze.py /tmp/arc --simulate 100000 --archive --compress zlib
+      python yahtzii_analyze.py scores/archive --ratings scores/ratings.json   # rebuild ratings
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from multiprocessing import Pool
+
+from yahtzii_rules import PRIMARY_CATEGORIES, ROW_LABELS, YAHTZII_ROW, YAHTZII_BONUS_ROW, card_totals
+from yahtzii_stats import EloRatings, game_ranking
+from yahtzii_strategy import analyze_turns, projection_tables, simulate_game
+
+
+# ============================================================================
+# ASSOCIATIVE REDUCERS
+# ============================================================================
+class PlayerStats:
+    """Running totals for one player; merge() is associative and commutative."""
+
+    __slots__ = ("games", "score_sum", "best", "worst", "hits", "yahtziis",
+                 "bonuses", "regret", "decisions")
+
+    def __init__(self):
+        self.games     = 0
+        self.score_sum = 0
+        self.best      = None
+        self.worst     = None
+        self.hits      = [0] * len(PRIMARY_CATEGORIES)   # games scoring > 0
+        self.yahtziis  = 0                               # 50s plus bonus Yahtziis
+        self.bonuses   = 0                               # Upper bonuses earned
+        self.regret    = 0.0
+        self.decisions = 0
+
+    def add_card(self, card: dict):
+        totals = card_totals(card)
+        score  = totals[18]
+        self.games     += 1
+        self.score_sum += score
+        self.best  = score if self.best is None else max(self.best, score)
+        self.worst = score if self.worst is None else min(self.worst, score)
+        for i, row in enumerate(PRIMARY_CATEGORIES):
+            if (card.get(row) or 0) > 0:
+                self.hits[i] += 1
+        self.yahtziis += (card.get(YAHTZII_ROW) == 50) + (card.get(YAHTZII_BONUS_ROW) or 0)
+        self.bonuses  += totals[7] > 0
+
+    def merge(self, other: "PlayerStats") -> "PlayerStats":
+        self.games     += other.games
+        self.score_sum += other.score_sum
+        for attr, pick in (("best", max), ("worst", min)):
+            a, b = getattr(self, attr), getattr(other, attr)
+            setattr(self, attr, b if a is None else a if b is None else pick(a, b))
+        self.hits      = [a + b for a, b in zip(self.hits, other.hits)]
+        self.yahtziis  += other.yahtziis
+        self.bonuses   += other.bonuses
+        self.regret    += other.regret
+        self.decisions += other.decisions
+        return self
+
+    def summary(self) -> dict:
+        g = self.games or 1
+        return {
+            "games":       self.games,
+            "average":     round(self.score_sum / g, 1),
+            "best":        self.best,
+            "worst":       self.worst,
+            "yahtzii_per_game": round(self.yahtziis / g, 3),
+            "upper_bonus_rate": round(self.bonuses / g, 3),
+            "regret_per_game":  round(self.regret / g, 1) if self.decisions else None,
+            "hit_rates":   {ROW_LABELS[r]: round(h / g, 3)
+                            for r, h in zip(PRIMARY_CATEGORIES, self.hits)},
+        }
+
+
+class Partial:
+    """{player: PlayerStats} plus file counters for one batch."""
+
+    __slots__ = ("players", "games", "errors")
+
+    def __init__(self):
+        self.players = {}
+        self.games   = 0
+        self.errors  = 0
+
+    def add_game(self, game: dict):
+        for name, card in zip(game["players"], game["cards"]):
+            card = {int(row): score for row, score in card.items()}
+            self.players.setdefault(name, PlayerStats()).add_card(card)
+        for d in analyze_turns(game.get("turns") or ()):
+            stats = self.players.setdefault(d.player, PlayerStats())
+            stats.regret    += d.regret
+            stats.decisions += 1
+        self.games += 1
+
+    def merge(self, other: "Partial") -> "Partial":
+        for name, stats in other.players.items():
+            if name in self.players:
+                self.players[name].merge(stats)
+            else:
+                self.players[name] = stats
+        self.games  += other.games
+        self.errors += other.errors
+        return self
+
+
+# ============================================================================
+# WORKERS
+# ============================================================================
+def iter_games(path):
+    """Games in one file: a single JSON document, or JSON lines."""
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield json.load(f)
+
+
+def analyze_batch(paths) -> Partial:
+    part = Partial()
+    for path in paths:
+        try:
+            for game in iter_games(path):
+                part.add_game(game)
+        except (OSError, ValueError, KeyError, TypeError):
+            part.errors += 1
+    return part
+
+
+def iter_batches(root, size):
+    batch = []
+    for dirpath, _, files in os.walk(root):
+        for name in files:
+            if name.endswith((".json", ".jsonl")):
+                batch.append(os.path.join(dirpath, name))
+                if len(batch) >= size:
+                    yield batch
+                    batch = []
+    if batch:
+        yield batch
+
+
+def analyze_chunk(task) -> Partial:
+    """One archive chunk, loaded in the worker (memory-mapped unless compressed)."""
+    from yahtzii_archive import GameArchive
+    root, meta = task
+    archive = GameArchive(root)
+    part = Partial()
+    for game in archive.iter_games(archive.chunk(meta)):
+        part.add_game(game)
+    return part
+
+
+def _is_archive(root) -> bool:
+    return os.path.isfile(os.path.join(root, "manifest.json"))
+
+
+def analyze(root, workers=None, batch_size=64) -> Partial:
+    if _is_archive(root):
+        from yahtzii_archive import GameArchive
+        func  = analyze_chunk
+        tasks = [(root, meta) for meta in GameArchive(root).chunk_metas()]
+    else:
+        func, tasks = analyze_batch, iter_batches(root, batch_size)
+    total = Partial()
+    if workers == 1:
+        for task in tasks:
+            total.merge(func(task))
+        return total
+    # Each worker builds the regret tables once, up front.
+    with Pool(workers, initializer=projection_tables) as pool:
+        for part in pool.imap_unordered(func, tasks):
+            total.merge(part)
+    return total
+
+
+def iter_rankings(root):
+    """[(name, score)] per game, oldest first, for a batch rating replay."""
+    if _is_archive(root):
+        from yahtzii_archive import GameArchive
+        yield from GameArchive(root).iter_rankings()
+        return
+    dated = []
+    for batch in iter_batches(root, 256):
+        for path in batch:
+            try:
+                for game in iter_games(path):
+                    dated.append((game.get("date", ""), path, game_ranking(game)))
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+    dated.sort(key=lambda x: x[:2])
+    for _, _, ranking in dated:
+        yield ranking
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+def simulate(root, games, players, seed, archive=False, compression=None):
+    os.makedirs(root, exist_ok=True)
+    rnd   = random.Random(seed).random
+    names = [f"Bot{i + 1}" for i in range(players)]
+    date  = time.strftime("%Y-%m-%d %H:%M")
+    if archive:
+        from yahtzii_archive import GameArchive
+        GameArchive(root).append((simulate_game(names, rnd, date) for _ in range(games)),
+                                 compression)
+        return
+    for n in range(games):
+        with open(os.path.join(root, f"sim-{n:07d}.json"), "w", encoding="utf-8") as f:
+            json.dump(simulate_game(names, rnd, date), f, separators=(",", ":"))
+
+
+def print_report(total: Partial, wall: float):
+    print(f"games={total.games}  unreadable files={total.errors}  wall={wall:.2f}s  "
+          f"games/s={total.games / wall if wall else 0:.0f}")
+    print(f"{'player':<16}{'games':>7}{'avg':>8}{'best':>6}{'worst':>6}"
+          f"{'Y/game':>8}{'bonus%':>8}{'regret':>8}")
+    for name, stats in sorted(total.players.items()):
+        s = stats.summary()
+        regret = f"{s['regret_per_game']:.1f}" if s["regret_per_game"] is not None else "—"
+        print(f"{name:<16}{s['games']:>7}{s['average']:>8.1f}{s['best']:>6}{s['worst']:>6}"
+              f"{s['yahtzii_per_game']:>8.3f}{s['upper_bonus_rate']:>8.1%}{regret:>8}")
+    print()
+    print("category hit rates")
+    for name, stats in sorted(total.players.items()):
+        rates = stats.summary()["hit_rates"]
+        print(f"  {name}: " + "  ".join(f"{label} {rate:.0%}" for label, rate in rates.items()))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Analyze recorded Yahtzii games in parallel")
+    ap.add_argument("root", help="directory of recorded games (searched recursively)")
+    ap.add_argument("--workers", type=int, default=None,
+                    help="worker processes (default: one per CPU; 1 = no pool)")
+    ap.add_argument("--batch", type=int, default=64, help="files per worker task")
+    ap.add_argument("--json", action="store_true", help="print the report as JSON")
+    ap.add_argument("--simulate", type=int, default=0, metavar="N",
+                    help="first write N greedy games into ROOT")
+    ap.add_argument("--players", type=int, default=2, help="players per simulated game")
+    ap.add_argument("--archive", action="store_true",
+                    help="simulate into a columnar archive instead of JSON files (needs NumPy)")
+    ap.add_argument("--compress", choices=["zlib", "lzma"], default=None,
+                    help="compress simulated archive chunks")
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--ratings", metavar="PATH", default=None,
+                    help="replay every game into fresh player ratings, save them to PATH "
+                         "(e.g. scores/ratings.json) and print the leaderboard")
+    args = ap.parse_args(argv)
+
+    if args.simulate:
+        simulate(args.root, args.simulate, args.players, args.seed,
+                 args.archive, args.compress)
+
+    if args.ratings:
+        t0  = time.perf_counter()
+        elo = EloRatings.replay(iter_rankings(args.root), args.ratings)
+        elo.save()
+        print(f"rated {sum(elo.games.values())} player-games in "
+              f"{time.perf_counter() - t0:.2f}s -> {args.ratings}")
+        for name, rating, games in elo.leaderboard():
+            print(f"  {name:<16}{rating:>7.0f}{games:>7}")
+        return 0
+
+    t0    = time.perf_counter()
+    total = analyze(args.root, args.workers, args.batch)
+    wall  = time.perf_counter() - t0
+    if args.json:
+        json.dump({"games": total.games, "errors": total.errors,
+                   "players": {n: s.summary() for n, s in total.players.items()}},
+                  sys.stdout, indent=2)
+        print()
+    else:
+        print_report(total, wall)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
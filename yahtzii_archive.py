@@ -0,0 +1,366 @@
+"""
+yahtzii_archive.py — Columnar game archive built from NumPy structured arrays.
+
+Layout (one directory):
+
+    manifest.json          chunk list, player-name table, next game id
+    chunk-000000/
+        games.npy          one row per game                      GAME_DTYPE
+        scores.npy         one row per (game, seat); 13-column
+                           per-category score matrix in 'cats'   SCORE_DTYPE
+        turns.npy          one row per roller turn: dice, holds,
+                           state before the claim, the claim     TURN_DTYPE
+        by_player.npy      scores rows ordered by player id (index)
+        by_date.npy        games rows ordered by date (index)
+
+Chunks are immutable once written: append() builds a new chunk in a temp
+directory, renames it into place and then swaps the manifest, so a crash
+never leaves a half-written chunk in the archive.  Uncompressed chunks are
+memory-mapped (zero-copy reads); chunks written with compression="zlib" or
+"lzma" store each table as .npy.zlib / .npy.xz and are decompressed on load.
+Many small chunks (the scorecard appends one game at a time) are merged by
+compact().
+
+Games go in and come out as the recorded-game dicts described in
+yahtzii_strategy (RECORDED GAMES), so the analyzer treats an archive and a
+directory of JSON files the same way.
+"""
+
+import io
+import json
+import lzma
+import os
+import shutil
+import zlib
+from collections import namedtuple
+from itertools import product
+
+import numpy as np
+
+from yahtzii_rules import PRIMARY_CATEGORIES, YAHTZII_BONUS_ROW, card_totals
+
+GAME_DTYPE = np.dtype([
+    ("game",       "<i8"),
+    ("date",       "<M8[m]"),
+    ("players",    "u1"),
+    ("turn_start", "<i8"),          # first row in this chunk's turns table
+    ("turns",      "<u2"),
+])
+SCORE_DTYPE = np.dtype([
+    ("game",          "<i8"),
+    ("seat",          "u1"),
+    ("player",        "<u4"),       # index into the manifest's name table
+    ("total",         "<i4"),
+    ("cats",          "<i2", (len(PRIMARY_CATEGORIES),)),   # -1 = never claimed
+    ("yahtzii_bonus", "u1"),
+    ("upper_bonus",   "?"),
+])
+TURN_DTYPE = np.dtype([
+    ("game",        "<i8"),
+    ("seat",        "u1"),
+    ("rolls",       "u1"),
+    ("dice",        "u1", (3, 5)),  # dice after each roll (0 = not rolled)
+    ("held",        "u1", (3,)),    # hold bitmask used for each roll
+    ("joker",       "?"),
+    ("row",         "u1"),
+    ("score",       "<i2"),
+    ("claimed",     "<u2"),         # PlayerState before the claim
+    ("upper_sum",   "u1"),
+    ("other",       "<i4"),
+    ("yahtzii_box", "i1"),          # -1 = open
+])
+
+TABLES      = ("games", "scores", "turns", "by_player", "by_date")
+SUFFIXES    = {None: ".npy", "zlib": ".npy.zlib", "lzma": ".npy.xz"}
+CHUNK_GAMES = 4096          # append() splits larger batches into chunks this big
+SMALL_CHUNK = 256           # chunks below this many games are merged by compact()
+COMPACT_AFTER = 32          # ... once there are this many of them
+
+Chunk = namedtuple("Chunk", "name games scores turns by_player by_date")
+
+_HOLD_BITS = {h: sum(1 << i for i, b in enumerate(h) if b)
+              for h in product((False, True), repeat=5)}
+
+
+class GameArchive:
+    """A directory of immutable column chunks plus a JSON manifest."""
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self._manifest = self._read_manifest()
+        self._name_ids = {n: i for i, n in enumerate(self._manifest["names"])}
+
+    # ------------------------------------------------------------ manifest --
+    @staticmethod
+    def is_archive(path: str) -> bool:
+        return os.path.isfile(os.path.join(path, "manifest.json"))
+
+    def _read_manifest(self):
+        try:
+            with open(os.path.join(self.root, "manifest.json"), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"version": 1, "next_game": 0, "next_chunk": 0, "names": [], "chunks": []}
+
+    def _write_manifest(self):
+        path = os.path.join(self.root, "manifest.json")
+        tmp  = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._manifest, f, indent=1)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    @property
+    def names(self) -> list:
+        return self._manifest["names"]
+
+    def __len__(self):
+        return sum(c["games"] for c in self._manifest["chunks"])
+
+    def chunk_metas(self) -> list:
+        """Manifest entries for every chunk, oldest first (see chunk())."""
+        return list(self._manifest["chunks"])
+
+    # -------------------------------------------------------------- append --
+    def append(self, games, compression=None) -> list:
+        """
+        Append recorded-game dicts in chunks of CHUNK_GAMES; returns the new
+        chunk names.  `compression` is None, "zlib" or "lzma".
+        """
+        if compression not in SUFFIXES:
+            raise ValueError(f"unknown compression {compression!r}")
+        written, batch = [], []
+        for game in games:
+            batch.append(game)
+            if len(batch) >= CHUNK_GAMES:
+                written.append(self._write_chunk(batch, compression))
+                batch = []
+        if batch:
+            written.append(self._write_chunk(batch, compression))
+        small = [c for c in self._manifest["chunks"] if c["games"] < SMALL_CHUNK]
+        if len(small) >= COMPACT_AFTER:
+            self.compact()
+        return written
+
+    def _player_id(self, name: str) -> int:
+        pid = self._name_ids.get(name)
+        if pid is None:
+            pid = self._name_ids[name] = len(self._manifest["names"])
+            self._manifest["names"].append(name)
+        return pid
+
+    def _columns(self, batch):
+        """Recorded-game dicts -> (games, scores, turns) structured arrays."""
+        games, scores, turns = [], [], []
+        nat = np.datetime64("NaT")
+        for game in batch:
+            gid = self._manifest["next_game"]
+            self._manifest["next_game"] += 1
+            seat_of = {}
+            for seat, (name, card) in enumerate(zip(game["players"], game["cards"])):
+                card   = {int(r): v for r, v in card.items()}
+                totals = card_totals(card)
+                scores.append((gid, seat, self._player_id(name), totals[18],
+                               [card.get(r, -1) for r in PRIMARY_CATEGORIES],
+                               card.get(YAHTZII_BONUS_ROW, 0), totals[7] > 0))
+                seat_of[name] = seat
+            log  = game.get("turns") or ()
+            date = np.datetime64(game["date"].replace(" ", "T"), "m") if game.get("date") else nat
+            games.append((gid, date, len(game["players"]), len(turns), len(log)))
+            for rec in log:
+                rolls = rec["rolls"][:3]
+                dice  = [r[0] for r in rolls] + [[0] * 5] * (3 - len(rolls))
+                held  = [_HOLD_BITS[tuple(r[1])] for r in rolls]
+                claimed, upper_sum, other, box = rec["state"]
+                turns.append((gid, seat_of.get(rec["player"], 0), len(rolls), dice,
+                              held + [0] * (3 - len(held)), rec["joker"], rec["row"],
+                              rec["score"], claimed, upper_sum, other,
+                              -1 if box is None else box))
+        return (np.array(games, GAME_DTYPE), np.array(scores, SCORE_DTYPE),
+                np.array(turns, TURN_DTYPE))
+
+    def _write_chunk(self, batch, compression) -> str:
+        games, scores, turns = self._columns(batch)
+        name = f"chunk-{self._manifest['next_chunk']:06d}"
+        self._manifest["next_chunk"] += 1
+        self._store(name, games, scores, turns, compression)
+        dates = games["date"][~np.isnat(games["date"])]
+        self._manifest["chunks"].append({
+            "name": name, "games": len(games), "scores": len(scores), "turns": len(turns),
+            "compression": compression,
+            "first_game": int(games["game"][0]), "last_game": int(games["game"][-1]),
+            "date_min": str(dates.min()) if len(dates) else None,
+            "date_max": str(dates.max()) if len(dates) else None,
+            "players": sorted({int(p) for p in np.unique(scores["player"])}),
+        })
+        self._write_manifest()
+        return name
+
+    def _store(self, name, games, scores, turns, compression):
+        """Write one chunk into a temp directory and rename it into place."""
+        final = os.path.join(self.root, name)
+        tmp   = final + ".tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        tables = {
+            "games": games, "scores": scores, "turns": turns,
+            "by_player": np.argsort(scores["player"], kind="stable").astype("<u4"),
+            "by_date":   np.argsort(games["date"], kind="stable").astype("<u4"),
+        }
+        for table, arr in tables.items():
+            path = os.path.join(tmp, table + SUFFIXES[compression])
+            if compression is None:
+                np.save(path, arr)
+                continue
+            buf = io.BytesIO()
+            np.save(buf, arr)
+            raw = buf.getvalue()
+            with open(path, "wb") as f:
+                f.write(zlib.compress(raw, 6) if compression == "zlib" else lzma.compress(raw))
+        os.rename(tmp, final)
+
+    # ---------------------------------------------------------------- read --
+    def _load(self, chunk_name, table, compression):
+        path = os.path.join(self.root, chunk_name, table + SUFFIXES[compression])
+        if compression is None:
+            return np.load(path, mmap_mode="r")
+        with open(path, "rb") as f:
+            data = f.read()
+        raw = zlib.decompress(data) if compression == "zlib" else lzma.decompress(data)
+        return np.load(io.BytesIO(raw))
+
+    def chunk(self, meta) -> Chunk:
+        return Chunk(meta["name"], *(self._load(meta["name"], t, meta["compression"]) for t in TABLES))
+
+    def chunks(self):
+        """Yield every Chunk (memory-mapped unless compressed), oldest first."""
+        for meta in self.chunk_metas():
+            yield self.chunk(meta)
+
+    def player_scores(self, name: str):
+        """Yield SCORE_DTYPE rows for `name`, chunk by chunk, via the player index."""
+        pid = self._name_ids.get(name)
+        if pid is None:
+            return
+        for meta in self._manifest["chunks"]:
+            if pid not in meta["players"]:
+                continue
+            c    = self.chunk(meta)
+            keys = c.scores["player"][c.by_player]
+            lo, hi = np.searchsorted(keys, [pid, pid + 1])
+            if hi > lo:
+                yield c.scores[np.sort(c.by_player[lo:hi])]
+
+    def games_between(self, start, end):
+        """Yield GAME_DTYPE rows dated in [start, end), chunk by chunk, via the date index."""
+        start, end = np.datetime64(start, "m"), np.datetime64(end, "m")
+        for meta in self._manifest["chunks"]:
+            if meta["date_max"] is None or meta["date_max"] < str(start) or meta["date_min"] >= str(end):
+                continue
+            c    = self.chunk(meta)
+            keys = c.games["date"][c.by_date]
+            lo, hi = np.searchsorted(keys, [start, end])
+            if hi > lo:
+                yield c.games[np.sort(c.by_date[lo:hi])]
+
+    def iter_rankings(self):
+        """[(name, total)] per game, oldest first — reads only the scores tables."""
+        names = self.names
+        for c in self.chunks():
+            scores = c.scores
+            bounds = np.flatnonzero(np.diff(scores["game"])) + 1
+            players, totals = scores["player"].tolist(), scores["total"].tolist()
+            start = 0
+            for end in bounds.tolist() + [len(scores)]:
+                yield [(names[p], t) for p, t in zip(players[start:end], totals[start:end])]
+                start = end
+
+    def iter_games(self, chunk: Chunk = None):
+        """Rebuild recorded-game dicts, from one chunk or the whole archive."""
+        for c in ([chunk] if chunk is not None else self.chunks()):
+            yield from chunk_games(c, self.names)
+
+    # ------------------------------------------------------------- compact --
+    def compact(self, compression="keep"):
+        """
+        Merge runs of adjacent small chunks, each run only until it holds
+        SMALL_CHUNK games, so a full merged chunk is never rewritten again.
+        By default every run keeps its chunks' compression (a run never mixes
+        two); pass None, "zlib" or "lzma" to rewrite them all that way.
+        """
+        if compression != "keep" and compression not in SUFFIXES:
+            raise ValueError(f"unknown compression {compression!r}")
+        metas, runs, run = self._manifest["chunks"], [], []
+        for meta in metas:
+            if run and (meta["games"] >= SMALL_CHUNK or compression == "keep"
+                        and meta["compression"] != run[0]["compression"]):
+                runs.append(run)
+                run = []
+            if meta["games"] < SMALL_CHUNK:
+                run.append(meta)
+                if sum(m["games"] for m in run) >= SMALL_CHUNK:
+                    runs.append(run)
+                    run = []
+        runs.append(run)
+        for run in runs:
+            if len(run) < 2:
+                continue
+            packing = run[0]["compression"] if compression == "keep" else compression
+            parts = [self.chunk(m) for m in run]
+            offset, games = 0, []
+            for p in parts:                      # re-base each part's turn offsets
+                g = np.array(p.games)
+                g["turn_start"] += offset
+                offset += len(p.turns)
+                games.append(g)
+            games  = np.concatenate(games)
+            scores = np.concatenate([p.scores for p in parts])
+            turns  = np.concatenate([p.turns for p in parts])
+            del parts
+            name = f"chunk-{self._manifest['next_chunk']:06d}"
+            self._manifest["next_chunk"] += 1
+            self._store(name, games, scores, turns, packing)
+            dates = [m[k] for m in run for k in ("date_min", "date_max") if m[k]]
+            merged = {
+                "name": name, "games": len(games), "scores": len(scores), "turns": len(turns),
+                "compression": packing,
+                "first_game": run[0]["first_game"], "last_game": run[-1]["last_game"],
+                "date_min": min(dates) if dates else None,
+                "date_max": max(dates) if dates else None,
+                "players": sorted({p for m in run for p in m["players"]}),
+            }
+            i = metas.index(run[0])
+            metas[i:i + len(run)] = [merged]
+            self._write_manifest()
+            for m in run:
+                shutil.rmtree(os.path.join(self.root, m["name"]), ignore_errors=True)
+
+
+def chunk_games(c: Chunk, names):
+    """Recorded-game dicts for the games in one Chunk."""
+    scores, turns = c.scores, c.turns
+    # Scores rows are written game by game, so each game's seats are contiguous.
+    starts = np.searchsorted(scores["game"], c.games["game"])
+    for g, s0 in zip(c.games, starts):
+        seats   = scores[s0:s0 + g["players"]]
+        players = [names[p] for p in seats["player"]]
+        cards   = []
+        for row in seats:
+            card = {str(r): int(v) for r, v in zip(PRIMARY_CATEGORIES, row["cats"]) if v >= 0}
+            card[str(YAHTZII_BONUS_ROW)] = int(row["yahtzii_bonus"])
+            cards.append(card)
+        log = []
+        for t in turns[g["turn_start"]:g["turn_start"] + g["turns"]]:
+            n = int(t["rolls"])
+            log.append({
+                "player": players[t["seat"]],
+                "state": [int(t["claimed"]), int(t["upper_sum"]), int(t["other"]),
+                          None if t["yahtzii_box"] < 0 else int(t["yahtzii_box"])],
+                "rolls": [[t["dice"][k].tolist(), [bool(t["held"][k] >> i & 1) for i in range(5)]]
+                          for k in range(n)],
+                "joker": bool(t["joker"]), "row": int(t["row"]), "score": int(t["score"]),
+            })
+        date = "" if np.isnat(g["date"]) else str(g["date"]).replace("T", " ")
+        yield {"date": date, "players": players, "cards": cards, "turns": log}
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+yahtzii_bench.py — Microbenchmarks for scoring, rules and persistence.
+
+Each benchmark runs a calibrated batch of operations per round (about
+20 ms, as timeit.autorange does) and reports the median, best and 95th
+percentile time per operation.  Benchmarks that change the score boards
+reload them from large files before every round, outside the timed part.
+Score saves only update the app's in-memory cache on the GUI thread; the
+file writes they queue are timed separately, flushed through the I/O worker.
+
+Results can be saved as JSON together with the machine they ran on and
+compared against an earlier run: any benchmark whose median is slower than
+the baseline by more than --threshold is a regression and fails the run.
+Scorecard benchmarks drive a real YahtzeeScorecard offscreen; without
+PyQt6 they are skipped.  Score files are written to a temporary directory.
+
+Run:  python yahtzii_bench.py [--save bench.json] [--baseline old.json --threshold 0.15]
+      python yahtzii_bench.py --filter score --entries 200000
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from yahtzii_rules import ALL_MASK, CATEGORY_BIT, PRIMARY_CATEGORIES, joker_rows, legal_moves, roller_score
+
+
+BENCHES = []   # (name, needs the scorecard, factory, fixed batch size or None)
+
+
+def bench(name, scorecard=False, number=None):
+    """Register factory(ctx) -> run(n) [, setup]; number fixes the batch size."""
+    def register(factory):
+        BENCHES.append((name, scorecard, factory, number))
+        return factory
+    return register
+
+
+# ============================================================================
+# CONTEXT
+# ============================================================================
+class Context:
+    """Shared fixtures: random rolls, a temp working directory, the scorecard."""
+
+    def __init__(self, entries, seed):
+        rnd = random.Random(seed)
+        self.rnd     = rnd
+        self.rolls   = [[rnd.randint(1, 6) for _ in range(5)] for _ in range(1024)]
+        self.masks   = [rnd.getrandbits(16) & ALL_MASK for _ in range(1024)]
+        self.entries = entries
+        self.workdir = tempfile.mkdtemp(prefix="yahtzii-bench-")
+        os.chdir(self.workdir)
+        self.app     = None
+        self.board   = None
+        self.yz      = None
+        self._files  = {}
+
+    def scorecard(self):
+        """A two-player YahtzeeScorecard offscreen, or None without PyQt6."""
+        if self.board is None:
+            os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+            try:
+                from PyQt6.QtWidgets import QApplication
+            except ImportError:
+                return None
+            self.app = QApplication.instance() or QApplication(sys.argv[:1])
+            import yahtzii as yz
+            from yahtzii_strategy import projection_tables
+            self.app.setStyleSheet(yz.DARK_STYLESHEET)
+            projection_tables()           # recalc looks projections up, as in real play
+            self.yz    = yz
+            self.board = yz.YahtzeeScorecard(["Ann", "Bob"])
+        return self.board
+
+    def score_file_text(self, reverse):
+        """A JSON score list with `entries` rows, formatted as the app writes it."""
+        if reverse not in self._files:
+            rnd  = random.Random(reverse)
+            rows = [{"name": f"P{i % 97}", "score": rnd.randint(0, 1575), "date": "2024-01-01"}
+                    for i in range(self.entries)]
+            rows.sort(key=lambda x: x["score"], reverse=reverse)
+            self._files[reverse] = json.dumps(rows, indent=4)
+        return self._files[reverse]
+
+    def seed_boards(self):
+        """Reload the app's score cache from large score files, as at startup."""
+        from yahtzii_io import io_worker
+        io_worker().flush()           # a queued top-10 write would replace the files
+        yz = self.yz
+        for reverse, filename in ((True, yz.HIGH_SCORES_FILE), (False, yz.LOW_SCORES_FILE)):
+            with open(yz.score_path(filename), "w") as f:
+                f.write(self.score_file_text(reverse))
+        yz.score_store().wait()._load()
+
+
+# ============================================================================
+# RULES
+# ============================================================================
+@bench("rules.roller_score")
+def _roller_score(ctx):
+    rolls = ctx.rolls
+    def run(n):
+        for i in range(n):
+            roller_score(rolls[i & 1023])
+    return run
+
+
+@bench("rules.legal_moves")
+def _legal_moves(ctx):
+    rolls, masks = ctx.rolls, ctx.masks
+    def run(n):
+        for i in range(n):
+            legal_moves(rolls[i & 1023], masks[i & 1023])
+    return run
+
+
+@bench("rules.joker_rows")
+def _joker_rows(ctx):
+    yahtziis = [[f] * 5 for f in range(1, 7)]
+    opens    = [[r for r in PRIMARY_CATEGORIES if not m & CATEGORY_BIT[r]] for m in ctx.masks]
+    def run(n):
+        for i in range(n):
+            joker_rows(yahtziis[i % 6], opens[i & 1023])
+    return run
+
+
+# ============================================================================
+# SCORECARD
+# ============================================================================
+@bench("scorecard._best_open_score_for_dice", scorecard=True)
+def _best_open(ctx):
+    board, rolls = ctx.scorecard(), ctx.rolls
+    def run(n):
+        for i in range(n):
+            board._best_open_score_for_dice(rolls[i & 1023])
+    return run
+
+
+@bench("scorecard._valid_rows_for_dice", scorecard=True)
+def _valid_rows(ctx):
+    board, rolls = ctx.scorecard(), ctx.rolls
+    def run(n):
+        for i in range(n):
+            board._valid_rows_for_dice(rolls[i & 1023])
+    return run
+
+
+@bench("scorecard.recalc", scorecard=True)
+def _recalc(ctx):
+    board = ctx.scorecard()
+    for r, v in ((0, 3), (2, 9), (4, 15), (9, 22), (11, 25), (16, 19)):
+        board.table.item(r, 0).setText(str(v))
+    def run(n):
+        for _ in range(n):
+            board.recalc(0)
+    return run
+
+
+@bench("scorecard.joker_options", scorecard=True)
+def _joker_options(ctx):
+    """Both dropdown refreshes for a confirmed five-of-a-kind under Joker rules."""
+    board = ctx.scorecard()
+    def setup():
+        board.use_digital_roller = True
+        board.joker_active       = True
+        board._roller_dice       = [4] * 5
+        board.table.item(14, 0).setText("50")
+    def run(n):
+        for _ in range(n):
+            board._update_upper_dropdowns(0)
+            board._update_lower_dropdowns(0)
+    return run, setup
+
+
+@bench("scorecard.save_high_score", scorecard=True, number=1)
+def _save_high(ctx):
+    board = ctx.scorecard()
+    def run(n):
+        for _ in range(n):
+            board.save_high_score("Ann", 321)
+    return run, ctx.seed_boards
+
+
+@bench("scorecard.save_low_score", scorecard=True, number=1)
+def _save_low(ctx):
+    board = ctx.scorecard()
+    def run(n):
+        for _ in range(n):
+            board.save_low_score("Ann", 12)
+    return run, ctx.seed_boards
+
+
+@bench("scorecard._load_alltime_high", scorecard=True)
+def _load_alltime(ctx):
+    board = ctx.scorecard()
+    ctx.seed_boards()
+    def run(n):
+        for _ in range(n):
+            board._load_alltime_high()
+    return run
+
+
+@bench("io.score_writes", scorecard=True, number=1)
+def _score_writes(ctx):
+    """Both top-10 boards written behind by the I/O worker, waited for."""
+    board = ctx.scorecard()
+    from yahtzii_io import io_worker
+    def run(n):
+        for _ in range(n):
+            board.save_high_score("Ann", 321)
+            board.save_low_score("Ann", 12)
+            io_worker().flush()
+    return run, ctx.seed_boards
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+def calibrate(run, target=0.02):
+    """Smallest power-of-two batch that takes at least `target` seconds."""
+    n = 1
+    while True:
+        t0 = time.perf_counter()
+        run(n)
+        if time.perf_counter() - t0 >= target or n >= 1 << 20:
+            return n
+        n *= 2
+
+
+def measure(run, setup, number, rounds):
+    if setup is not None:
+        setup()
+    n = number or calibrate(run)
+    per_op = []
+    for _ in range(rounds):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        run(n)
+        per_op.append((time.perf_counter() - t0) / n * 1e6)
+    per_op.sort()
+    return {"median_us": per_op[len(per_op) // 2], "min_us": per_op[0],
+            "p95_us": per_op[min(len(per_op) - 1, int(0.95 * len(per_op)))],
+            "batch": n, "rounds": rounds}
+
+
+def machine_metadata() -> dict:
+    meta = {
+        "date":           datetime.now().isoformat(timespec="seconds"),
+        "python":         platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform":       platform.platform(),
+        "machine":        platform.machine(),
+        "processor":      platform.processor(),
+        "cpus":           os.cpu_count(),
+    }
+    try:
+        from PyQt6.QtCore import PYQT_VERSION_STR, QT_VERSION_STR
+        meta["pyqt"], meta["qt"] = PYQT_VERSION_STR, QT_VERSION_STR
+    except ImportError:
+        pass
+    try:
+        meta["commit"] = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        pass
+    return meta
+
+
+def compare(results, baseline, threshold) -> list:
+    """[(name, change)] for benchmarks slower than the baseline by more than threshold."""
+    slower = []
+    for name, res in results.items():
+        old = baseline.get(name)
+        if old:
+            change = res["median_us"] / old["median_us"] - 1
+            res["vs_baseline"] = round(change, 4)
+            if change > threshold:
+                slower.append((name, change))
+    return slower
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Microbenchmarks for Yahtzii scoring, rules and persistence")
+    ap.add_argument("--rounds", type=int, default=15, help="timed rounds per benchmark")
+    ap.add_argument("--entries", type=int, default=100_000,
+                    help="rows in the large high / low score files")
+    ap.add_argument("--filter", default=None, help="only benchmarks whose name contains this")
+    ap.add_argument("--save", metavar="PATH", default=None, help="write results as JSON")
+    ap.add_argument("--baseline", metavar="PATH", default=None,
+                    help="earlier --save output to compare against")
+    ap.add_argument("--threshold", type=float, default=0.10,
+                    help="allowed slow-down of a median vs the baseline (0.10 = 10%%)")
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args(argv)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    save = os.path.abspath(args.save) if args.save else None
+
+    ctx     = Context(args.entries, args.seed)
+    results = {}
+    print(f"{'benchmark':<40}{'median':>12}{'min':>12}{'p95':>12}{'batch':>9}{'vs base':>9}")
+    for name, scorecard, factory, number in BENCHES:
+        if args.filter and args.filter not in name:
+            continue
+        if scorecard and ctx.scorecard() is None:
+            print(f"{name:<40}  skipped (PyQt6 not installed)")
+            continue
+        made = factory(ctx)
+        run, setup = made if isinstance(made, tuple) else (made, None)
+        res = results[name] = measure(run, setup, number, args.rounds)
+        old = baseline.get(name) if baseline else None
+        vs  = f"{res['median_us'] / old['median_us'] - 1:+.0%}" if old else ""
+        print(f"{name:<40}{res['median_us']:>10.2f}us{res['min_us']:>10.2f}us"
+              f"{res['p95_us']:>10.2f}us{res['batch']:>9}{vs:>9}")
+
+    slower = compare(results, baseline, args.threshold) if baseline else []
+    if save:
+        with open(save, "w", encoding="utf-8") as f:
+            json.dump({"meta": machine_metadata(), "entries": args.entries,
+                       "results": results}, f, indent=2)
+        print(f"results -> {save}")
+    for name, change in slower:
+        print(f"REGRESSION: {name} is {change:+.0%} vs baseline (allowed {args.threshold:+.0%})")
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+yahtzii_io.py — Qt-free background file I/O for the app.
+
+IOWorker runs file jobs on one daemon thread so the GUI thread never waits
+on the disk.  Jobs are keyed by the file they write: a job submitted while
+another for the same key is still queued replaces it (write-behind), so
+only the latest snapshot of a file is ever written however fast they come.
+Jobs for different keys run in submission order.
+
+write_json_atomic() writes a temp file, fsyncs it and renames it over the
+target, so a crash leaves either the old file or the new one, never half.
+"""
+
+import atexit
+import json
+import os
+import threading
+from collections import OrderedDict
+
+
+def write_json_atomic(path: str, data, indent: int = None):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=indent, separators=None if indent else (",", ":"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def read_json(path: str, default=None):
+    """The parsed file, or `default` when it is missing or unreadable."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def remove_file(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class IOWorker:
+    """One daemon thread draining a keyed, coalescing job queue."""
+
+    def __init__(self, name: str = "yahtzii-io"):
+        self.errors  = 0
+        self.last_error = None
+        self._cond   = threading.Condition()
+        self._jobs   = OrderedDict()     # key -> callable, oldest first
+        self._busy   = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, key, job):
+        """Queue job() under key, replacing a queued job with the same key."""
+        with self._cond:
+            self._jobs.pop(key, None)
+            self._jobs[key] = job
+            self._cond.notify_all()
+
+    def pending(self, key) -> bool:
+        with self._cond:
+            return key in self._jobs
+
+    def flush(self, timeout: float = None) -> bool:
+        """Wait until every queued job has run; False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._jobs and not self._busy, timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._jobs)
+                _, job = self._jobs.popitem(last=False)
+                self._busy = True
+            try:
+                job()
+            except Exception as e:       # a failed write must not kill the worker
+                self.errors    += 1
+                self.last_error = e
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+
+_worker = None
+
+
+def io_worker() -> IOWorker:
+    """The process-wide worker, started on first use and flushed at exit."""
+    global _worker
+    if _worker is None:
+        _worker = IOWorker()
+        atexit.register(_worker.flush, 5.0)
+    return _worker
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+yahtzii_leakcheck.py — Widget and memory leak check for the scorecard.
+
+Plays scripted turns through the real YahtzeeScorecard offscreen: every
+score is picked through a ScoreButton's popup menu, game-over dialogs
+answer "Same Order", and the same window is reused for the next game, as
+the app's entry point does.  After the warm-up games it samples the live
+widget count (shared ScoreButton menus excluded) and tracemalloc's Python
+heap once per game, and fails if either has grown past its allowance.
+
+Score files are written to a temporary directory, never to ./scores.
+With --watchdog MS the run also logs the GUI thread's stack for every
+event-loop stall longer than MS, to find what freezes big games.
+
+Run:  python yahtzii_leakcheck.py --turns 2000 [--players 3] [--roller]
+      python yahtzii_leakcheck.py --turns 400 --players 8 --watchdog 50 --stall-log stalls.log
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEvent, QTimer, Qt
+from PyQt6.QtGui import QKeyEvent
+from PyQt6.QtWidgets import QApplication, QDialog, QMenu, QMessageBox
+
+from yahtzii_rules import CATEGORY_BIT, PRIMARY_CATEGORIES, legal_moves
+
+
+class Responder:
+    """Answers whatever popup or modal dialog is open, from a fast timer."""
+
+    def __init__(self, yz, rnd):
+        self.yz     = yz
+        self.rnd    = rnd
+        self._timer = QTimer()
+        self._timer.setInterval(1)
+        self._timer.timeout.connect(self._answer)
+        self._timer.start()
+
+    def stop(self):
+        self._timer.stop()
+
+    def _answer(self):
+        popup = QApplication.activePopupWidget()
+        if isinstance(popup, QMenu):
+            scores = [a for a in popup.actions() if a.data() != "-"]
+            if scores:
+                popup.setActiveAction(self.rnd.choice(scores))
+                QApplication.sendEvent(popup, QKeyEvent(QEvent.Type.KeyPress, Qt.Key.Key_Return,
+                                                        Qt.KeyboardModifier.NoModifier))
+            else:
+                popup.close()
+            return
+        modal = QApplication.activeModalWidget()
+        if isinstance(modal, self.yz.GameOverDialog):
+            modal._pick(self.yz.GameOverDialog.SAME_ORDER)
+        elif isinstance(modal, (QMessageBox, QDialog)):
+            modal.accept()
+
+
+def play_turn(yz, board, rnd):
+    """One turn: roll with the digital roller if it is on, then claim through a menu."""
+    c = board.current_turn_index
+    if board.use_digital_roller:
+        board._open_roller_for_current_player()
+        roller = board._roller
+        for _ in range(3):
+            roller.dice = [d if h else rnd.randint(1, 6) for d, h in zip(roller.dice, roller.held)]
+            roller._finish_roll()
+            for i in range(5):
+                if rnd.random() < 0.4:
+                    roller._toggle_hold(i)
+        roller._confirm_dice()
+        box   = board.table.item(14, c).text()
+        moves = legal_moves(board._roller_dice, board._claimed[c],
+                            int(box) if box.isdigit() else None, board.joker_active)
+        rows  = [r for r in PRIMARY_CATEGORIES if moves.legal & CATEGORY_BIT[r]]
+    else:
+        rows = [r for r in PRIMARY_CATEGORIES
+                if board.table.item(r, c).data(Qt.ItemDataRole.UserRole) != "claimed"]
+    button = board.table.cellWidget(rnd.choice(rows), c)
+    button.click()      # opens the shared menu; the Responder picks a score
+    QApplication.processEvents()
+    while board.isVisible() and not any(board.player_has_turns_left(p)
+                                        for p in range(len(board.players))):
+        QApplication.processEvents()   # game over: wait for the Responder to answer the dialog
+
+
+def live_widgets(yz) -> int:
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    return len(QApplication.allWidgets()) - len(yz.ScoreButton._menus)
+
+
+def run(args) -> int:
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    import yahtzii as yz
+    app.setStyleSheet(yz.DARK_STYLESHEET)
+    rnd = random.Random(args.seed)
+    stall_log = os.path.abspath(args.stall_log)
+    os.chdir(tempfile.mkdtemp(prefix="yahtzii-leakcheck-"))
+    responder = Responder(yz, rnd)
+    dog = yz.start_stall_watchdog(args.watchdog, stall_log) if args.watchdog else None
+
+    players = [f"P{i + 1}" for i in range(args.players)]
+    board   = yz.YahtzeeScorecard(players, use_digital_roller=args.roller)
+    board.loop = yz.QEventLoop()     # closeEvent looks for it
+    board.show()
+
+    tracemalloc.start()
+    samples = []    # (turns played, live widgets, traced bytes)
+    turns = games = 0
+    t0 = time.perf_counter()
+    while turns < args.turns:
+        play_turn(yz, board, rnd)
+        turns += 1
+        if board.play_again_requested:
+            games += 1
+            board.start_game(players, use_digital_roller=args.roller)
+            board.show()
+            if games >= args.warmup:
+                gc.collect()
+                samples.append((turns, live_widgets(yz), tracemalloc.get_traced_memory()[0]))
+    wall = time.perf_counter() - t0
+    responder.stop()
+    if dog is not None:
+        dog.stop()
+        print(f"stalls over {args.watchdog:.0f} ms: {dog.stalls}  (stacks in {stall_log})")
+
+    print(f"turns={turns} games={games} wall={wall:.1f}s  turns/s={turns / wall:.0f}  "
+          f"shared menus={len(yz.ScoreButton._menus)}")
+    if len(samples) < 2:
+        print("not enough games after warm-up to compare; raise --turns")
+        return 2
+    (t_a, w_a, m_a), (t_b, w_b, m_b) = samples[0], samples[-1]
+    print(f"widgets  {w_a} -> {w_b}   ({w_b - w_a:+d} over {t_b - t_a} turns)")
+    print(f"py heap  {m_a / 1024:.0f} KB -> {m_b / 1024:.0f} KB   ({(m_b - m_a) / 1024:+.0f} KB)")
+    failed = False
+    if w_b - w_a > args.max_widgets:
+        print(f"LEAK: live widgets grew by {w_b - w_a} (allowed {args.max_widgets})")
+        failed = True
+    if (m_b - m_a) / 1024 > args.max_kb:
+        print(f"LEAK: Python heap grew by {(m_b - m_a) / 1024:.0f} KB (allowed {args.max_kb} KB)")
+        failed = True
+    print("FAIL" if failed else "OK: flat")
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Check the scorecard for widget and memory leaks")
+    ap.add_argument("--turns", type=int, default=2000, help="scripted turns to play")
+    ap.add_argument("--players", type=int, default=2, help="players per game (1–8)")
+    ap.add_argument("--roller", action="store_true", help="roll with the digital roller")
+    ap.add_argument("--warmup", type=int, default=2, help="games played before sampling")
+    ap.add_argument("--max-widgets", type=int, default=0,
+                    help="allowed growth in live widgets after warm-up")
+    ap.add_argument("--max-kb", type=int, default=256,
+                    help="allowed growth in the Python heap after warm-up, in KB")
+    ap.add_argument("--watchdog", type=float, default=0, metavar="MS",
+                    help="log the GUI thread's stack for event-loop stalls longer than MS")
+    ap.add_argument("--stall-log", default="stalls.log", help="where --watchdog writes stacks")
+    ap.add_argument("--seed", type=int, default=None)
+    args = ap.parse_args(argv)
+    return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
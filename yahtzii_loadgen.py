@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+yahtzii_loadgen.py — Load generator for yahtzii_server.py.
+
+Opens one TCP connection per table, creates the table and plays it to the
+end with simple greedy bots (hold the most common face, claim the best
+legal row).  Reports throughput and request latency percentiles.
+
+Run:  python yahtzii_loadgen.py --tables 300 --players 4 [--port 8765]
+      python yahtzii_loadgen.py --tables 300 --spawn     # start an in-process server
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import Counter
+
+from yahtzii_rules import row_score
+
+
+class Bot:
+    """Drives one table over one connection."""
+
+    def __init__(self, reader, writer, players, latencies):
+        self.reader    = reader
+        self.writer    = writer
+        self.players   = players
+        self.latencies = latencies
+        self._next_id  = 0
+
+    async def request(self, **msg):
+        self._next_id += 1
+        msg["id"] = self._next_id
+        t0 = time.perf_counter()
+        self.writer.write(json.dumps(msg, separators=(",", ":")).encode() + b"\n")
+        await self.writer.drain()
+        # Broadcast events may arrive ahead of the reply; keep the latest state.
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                raise ConnectionError("server closed the connection")
+            reply = json.loads(line)
+            if "event" in reply:
+                self.state = reply["state"]
+                continue
+            if reply.get("id") == self._next_id:
+                self.latencies.append(time.perf_counter() - t0)
+                if not reply.get("ok"):
+                    raise RuntimeError(reply.get("error"))
+                if "state" in reply:
+                    self.state = reply["state"]
+                return reply
+
+    async def play(self):
+        reply = await self.request(op="create", players=self.players)
+        table = reply["table"]
+        while not self.state["finished"]:
+            player = self.state["current"]
+            held   = None
+            for _ in range(3):
+                await self.request(op="roll", table=table, player=player, held=held)
+                dice = self.state["dice"]
+                face, n = Counter(dice).most_common(1)[0]
+                if n == 5:
+                    break
+                held = [d == face for d in dice]
+            dice, joker = self.state["dice"], self.state["joker"]
+            best = max(self.state["legal"], key=lambda r: row_score(r, dice, joker=joker))
+            await self.request(op="claim", table=table, player=player, row=best)
+        await self.request(op="leave", table=table)
+
+
+async def run(args):
+    server_task = None
+    if args.spawn:
+        from yahtzii_server import TableServer
+        server = TableServer(max_tables=max(args.tables, 1000), seed=args.seed)
+        server_task = asyncio.ensure_future(server.serve(args.host, args.port, None))
+        await asyncio.sleep(0.2)
+
+    latencies = []
+    players   = [f"P{i + 1}" for i in range(args.players)]
+    sem       = asyncio.Semaphore(args.concurrency or args.tables)
+    failures  = 0
+
+    async def one_table():
+        nonlocal failures
+        async with sem:
+            reader, writer = await asyncio.open_connection(args.host, args.port, limit=1 << 20)
+            try:
+                await Bot(reader, writer, players, latencies).play()
+            except Exception as e:
+                failures += 1
+                print(f"table failed: {e}", file=sys.stderr)
+            finally:
+                writer.close()
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one_table() for _ in range(args.tables)))
+    wall = time.perf_counter() - t0
+
+    if server_task is not None:
+        server_task.cancel()
+
+    latencies.sort()
+
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000 if latencies else 0.0
+
+    games = args.tables - failures
+    print(f"tables={args.tables} players={args.players} failed={failures}")
+    print(f"wall={wall:.2f}s  games/s={games / wall:.1f}  requests/s={len(latencies) / wall:.0f}")
+    print(f"latency ms  p50={pct(0.50):.2f}  p95={pct(0.95):.2f}  p99={pct(0.99):.2f}  "
+          f"max={pct(1.0):.2f}")
+    return 1 if failures else 0
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark the Yahtzii table server")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--tables", type=int, default=200, help="games to play")
+    ap.add_argument("--players", type=int, default=4, help="players per table (1–8)")
+    ap.add_argument("--concurrency", type=int, default=0,
+                    help="max tables in flight (0 = all at once)")
+    ap.add_argument("--spawn", action="store_true",
+                    help="run a server in this process instead of connecting to one")
+    ap.add_argument("--seed", type=int, default=None)
+    args = ap.parse_args(argv)
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
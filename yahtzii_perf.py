@@ -0,0 +1,279 @@
+"""
+yahtzii_perf.py — Qt-free performance instrumentation for the app.
+
+FrameStats records the digital roller's frame intervals and die paint
+times into fixed-width histograms, one per animation phase (charge, roll,
+bounce).  Recording is O(1) — a subtraction and a list increment — so it
+stays on all the time; percentiles are only computed when somebody looks.
+
+StallWatchdog watches the GUI thread from a daemon thread and logs its
+Python stack whenever the event loop stops turning for too long.
+
+Tracer records opt-in spans around chosen methods and writes them as
+Chrome trace JSON.  COUNTERS holds the live hot-path counts shown in the
+scorecard's debug panel.
+"""
+
+import csv
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+
+
+class FrameHistogram:
+    """Counts of durations in BUCKET_MS-wide buckets; the last bucket is overflow."""
+
+    BUCKET_MS = 0.1
+    BUCKETS   = 1000         # 0–100 ms, then everything slower
+
+    __slots__ = ("counts", "total", "max_ms")
+
+    def __init__(self):
+        self.counts = [0] * (self.BUCKETS + 1)
+        self.total  = 0
+        self.max_ms = 0.0
+
+    def add(self, ms: float):
+        b = int(ms / self.BUCKET_MS)
+        self.counts[b if b < self.BUCKETS else self.BUCKETS] += 1
+        self.total += 1
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def quantile(self, q: float):
+        """Upper edge of the bucket holding rank q (0..1), or None when empty."""
+        if not self.total:
+            return None
+        target = q * (self.total - 1)
+        seen   = 0
+        for b, n in enumerate(self.counts):
+            seen += n
+            if seen > target:
+                return self.max_ms if b == self.BUCKETS else min((b + 1) * self.BUCKET_MS,
+                                                                 self.max_ms)
+        return self.max_ms
+
+
+class FrameStats:
+    """
+    Per-phase frame-interval and paint-time histograms for one roller.
+
+    tick(phase) is called once per animation timer tick; the interval since
+    the previous tick of the same run is recorded, and an interval longer
+    than DROP_FACTOR × budget counts the ticks it swallowed as dropped.
+    stop() ends a run so the idle gap before the next one is not counted.
+    """
+
+    PHASES      = ("charge", "roll", "bounce")
+    DROP_FACTOR = 1.5
+
+    def __init__(self, budget_ms: float):
+        self.budget_ms = budget_ms
+        self.reset()
+
+    def reset(self):
+        self.frames  = {ph: FrameHistogram() for ph in self.PHASES}
+        self.paints  = {ph: FrameHistogram() for ph in self.PHASES + ("idle",)}
+        self.dropped = dict.fromkeys(self.PHASES, 0)
+        self.phase   = None
+        self._last   = None
+        self._recent = deque(maxlen=60)      # tick timestamps for the live rate
+
+    def tick(self, phase: str, now: float = None):
+        now = time.perf_counter() if now is None else now
+        if phase == self.phase and self._last is not None:
+            ms = (now - self._last) * 1000
+            self.frames[phase].add(ms)
+            if ms > self.budget_ms * self.DROP_FACTOR:
+                self.dropped[phase] += int(ms / self.budget_ms + 0.5) - 1
+        self.phase = phase
+        self._last = now
+        self._recent.append(now)
+
+    def stop(self):
+        self.phase = None
+        self._last = None
+
+    def paint(self, seconds: float):
+        self.paints[self.phase or "idle"].add(seconds * 1000)
+
+    def fps(self, now: float = None) -> float:
+        """Tick rate over the last ~60 ticks; 0 once the animation has been still for 0.5 s."""
+        now = time.perf_counter() if now is None else now
+        r = self._recent
+        if len(r) < 2 or now - r[-1] > 0.5:
+            return 0.0
+        return (len(r) - 1) / (r[-1] - r[0])
+
+    def summary_lines(self) -> list:
+        """Text rows for the HUD: one per phase, frame and paint percentiles."""
+        def fmt(v):
+            return "  —  " if v is None else f"{v:5.1f}"
+        lines = [f"budget {self.budget_ms:.0f} ms   fps {self.fps():5.1f}",
+                 "phase    n   p50   p95   p99  drop  paint p95"]
+        for ph in self.PHASES:
+            h = self.frames[ph]
+            lines.append(f"{ph:<6}{h.total:>5} {fmt(h.quantile(0.5))} {fmt(h.quantile(0.95))} "
+                         f"{fmt(h.quantile(0.99))} {self.dropped[ph]:>5}  "
+                         f"{fmt(self.paints[ph].quantile(0.95))}")
+        return lines
+
+    def write_csv(self, path: str):
+        """Every non-empty bucket as phase,kind,lo_ms,hi_ms,count (kind = frame | paint)."""
+        width = FrameHistogram.BUCKET_MS
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(["phase", "kind", "lo_ms", "hi_ms", "count"])
+            for kind, hists in (("frame", self.frames), ("paint", self.paints)):
+                for ph, h in hists.items():
+                    for b, n in enumerate(h.counts):
+                        if n:
+                            hi = "" if b == FrameHistogram.BUCKETS else f"{(b + 1) * width:.1f}"
+                            w.writerow([ph, kind, f"{b * width:.1f}", hi, n])
+            for ph in self.PHASES:
+                w.writerow([ph, "dropped", "", "", self.dropped[ph]])
+
+
+class StallWatchdog:
+    """
+    Detects a stalled GUI thread and logs its Python stack.
+
+    The GUI thread calls beat() from a short repeating timer.  A daemon
+    thread checks the time since the last beat every POLL_FRACTION of the
+    threshold; once it passes `threshold_ms` it grabs the GUI thread's frame
+    from sys._current_frames() and appends the stack to the log, again for
+    every further threshold the stall lasts (up to MAX_SAMPLES), and logs
+    the stall's total length once beats resume.
+    """
+
+    POLL_FRACTION = 0.25
+    MAX_SAMPLES   = 5
+
+    def __init__(self, threshold_ms: float = 50.0, log_path: str = "stalls.log",
+                 thread_id: int = None):
+        self.threshold = threshold_ms / 1000
+        self.log_path  = log_path
+        self.thread_id = threading.get_ident() if thread_id is None else thread_id
+        self.stalls    = 0
+        self._last     = time.perf_counter()
+        self._stop     = threading.Event()
+        self._thread   = None
+
+    def beat(self):
+        self._last = time.perf_counter()
+
+    def start(self):
+        self._last   = time.perf_counter()
+        self._thread = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _watch(self):
+        poll = self.threshold * self.POLL_FRACTION
+        stalled_since = None      # the last beat before the current stall
+        samples = 0
+        while not self._stop.wait(poll):
+            last = self._last
+            gap  = time.perf_counter() - last
+            if stalled_since is not None and last != stalled_since:
+                self._log(f"stall ended after {(last - stalled_since) * 1000:.0f} ms")
+                stalled_since, samples = None, 0
+            if gap < self.threshold * (samples + 1) or samples >= self.MAX_SAMPLES:
+                continue
+            if stalled_since is None:
+                stalled_since = last
+                self.stalls  += 1
+            samples += 1
+            frame = sys._current_frames().get(self.thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else "  (no frame)\n"
+            self._log(f"GUI thread stalled {gap * 1000:.0f} ms (sample {samples}):\n{stack}")
+
+    def _log(self, text: str):
+        stamp = datetime.now().isoformat(sep=" ", timespec="milliseconds")
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(f"[{stamp}] {text.rstrip()}\n")
+
+
+class Tracer:
+    """
+    Timed spans in Chrome trace-event format (chrome://tracing, Perfetto).
+
+    Nothing is traced until instrument() swaps a class's methods for timing
+    wrappers, so an untraced build runs the original functions with no
+    per-call check at all.  Events past MAX_EVENTS are counted, not kept.
+    """
+
+    MAX_EVENTS = 1_000_000
+
+    def __init__(self):
+        self.events  = []
+        self.dropped = 0
+        self._t0     = time.perf_counter()
+        self._pid    = os.getpid()
+
+    def record(self, name: str, cat: str, start: float, end: float):
+        if len(self.events) >= self.MAX_EVENTS:
+            self.dropped += 1
+            return
+        self.events.append({"name": name, "cat": cat, "ph": "X", "pid": self._pid,
+                            "tid": threading.get_ident(),
+                            "ts": (start - self._t0) * 1e6, "dur": (end - start) * 1e6})
+
+    def wrap(self, func, name: str, cat: str = "app"):
+        record, clock = self.record, time.perf_counter
+
+        @functools.wraps(func)
+        def traced(*args, **kwargs):
+            t0 = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, cat, t0, clock())
+        return traced
+
+    def instrument(self, cls, *names, cat: str = "app"):
+        """Replace cls.<name> for each name with a traced wrapper (once)."""
+        for name in names:
+            func = cls.__dict__[name]
+            if not hasattr(func, "__wrapped__"):
+                setattr(cls, name, self.wrap(func, f"{cls.__name__}.{name}", cat))
+
+    def write(self, path: str):
+        meta = [{"name": "thread_name", "ph": "M", "pid": self._pid, "tid": t.ident,
+                 "args": {"name": t.name}} for t in threading.enumerate()]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": meta + self.events, "displayTimeUnit": "ms",
+                       "otherData": {"dropped_events": self.dropped}}, f)
+
+
+class Counters:
+    """Named event counters for the debug panel; bump() is one dict update."""
+
+    def __init__(self):
+        self.reset()
+
+    def bump(self, key: str, n: int = 1):
+        self.counts[key] = self.counts.get(key, 0) + n
+
+    def reset(self):
+        self.counts = {}
+        self.since  = time.perf_counter()
+
+    def lines(self) -> list:
+        """'key  count' rows sorted by key, headed by the time since the last reset."""
+        width = max((len(k) for k in self.counts), default=0)
+        head  = f"since reset: {time.perf_counter() - self.since:.1f} s"
+        return [head] + [f"{k:<{width}}  {n:>9,}" for k, n in sorted(self.counts.items())]
+
+
+COUNTERS = Counters()   # process-wide; the app's hot paths bump these
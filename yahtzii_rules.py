@@ -0,0 +1,217 @@
+"""
+yahtzii_rules.py — Qt-free Yahtzii scoring rules shared by the scorecard,
+the table server and any offline tooling.
+
+Nothing in here may import PyQt6: the server and the benchmark / analysis
+scripts run headless.
+"""
+
+from collections import Counter, namedtuple
+from itertools import combinations_with_replacement
+
+# ============================================================================
+# SCORECARD CONSTANTS
+# ============================================================================
+UPPER_SECTION        = [0, 1, 2, 3, 4, 5]
+LOWER_SECTION_PRIMARY= [9, 10, 11, 12, 13, 16]
+FIXED_SCORE_ROWS     = {11: 25, 12: 30, 13: 40, 14: 50}
+CALCULATED_ROWS      = [6, 7, 8, 17, 18]
+PRIMARY_CATEGORIES   = [0, 1, 2, 3, 4, 5, 9, 10, 11, 12, 13, 14, 16]
+
+ROW_LABELS = (
+    ["Ones", "Twos", "Threes", "Fours", "Fives", "Sixes"] +
+    ["Sum", "Bonus (35)", "Total Upper"] +
+    ["3 of a Kind", "4 of a Kind", "Full House", "Small Straight",
+     "Large Straight", "Yahtzii", "Yahtzii Bonus (Count)", "Chance"] +
+    ["Total Lower", "GRAND TOTAL"]
+)
+
+YAHTZII_ROW       = 14
+YAHTZII_BONUS_ROW = 15
+UPPER_BONUS       = 35
+UPPER_BONUS_AT    = 63
+
+SMALL_STRAIGHTS = [(1, 2, 3, 4), (2, 3, 4, 5), (3, 4, 5, 6)]
+LARGE_STRAIGHTS = [[1, 2, 3, 4, 5], [2, 3, 4, 5, 6]]
+
+
+# ============================================================================
+# SCORING
+# ============================================================================
+def row_score(row: int, dice, joker: bool = False) -> int:
+    """
+    Score `dice` in scorecard row `row` exactly as the digital roller does.
+
+    With `joker` set the fixed lower rows (Full House, Small/Large Straight)
+    score full value regardless of the dice pattern.
+    """
+    counts = Counter(dice)
+    total  = sum(dice)
+    if row in UPPER_SECTION:
+        return counts[row + 1] * (row + 1)
+    vals      = sorted(counts.values(), reverse=True)
+    max_count = vals[0] if vals else 0
+    uniq      = sorted(set(dice))
+    if row == 9:
+        return total if max_count >= 3 else 0
+    if row == 10:
+        return total if max_count >= 4 else 0
+    if row == 16:
+        return total
+    if joker and row in (11, 12, 13):
+        return FIXED_SCORE_ROWS[row]
+    if row == 11:
+        return 25 if max_count == 3 and len(vals) > 1 and vals[1] == 2 else 0
+    if row == 12:
+        return 30 if any(all(s in uniq for s in seq) for seq in SMALL_STRAIGHTS) else 0
+    if row == 13:
+        return 40 if uniq in LARGE_STRAIGHTS else 0
+    if row == YAHTZII_ROW:
+        return 50 if max_count == 5 else 0
+    raise ValueError(f"row {row} is not a scoring category")
+
+
+def roller_score(dice):
+    """
+    Return the highest actual scorecard field available for this roll.
+
+    This intentionally uses only real scorecard categories:
+    Upper section, 3/4 of a Kind, Full House, Small/Large Straight,
+    Yahtzii, and Chance.
+    """
+    return best_hint(dice, 0)
+
+
+def joker_rows(dice, open_rows) -> list:
+    """
+    Rows a bonus Yahtzii may be scored in, in Joker priority order:
+    ① the matching Upper box if open, ② otherwise any open Lower box,
+    ③ otherwise any open Upper box (for 0).
+    """
+    claim_mask = ALL_MASK & ~sum(CATEGORY_BIT[r] for r in open_rows)
+    return rows_in(legal_moves(dice, claim_mask, joker=True).legal)
+
+
+def card_totals(card: dict) -> dict:
+    """
+    Compute the calculated rows (6, 7, 8, 17, 18) for a {row: score} card
+    holding claimed primary categories plus the Yahtzii bonus count in row 15.
+    """
+    u_sum = sum(card.get(r) or 0 for r in UPPER_SECTION)
+    bonus = UPPER_BONUS if u_sum >= UPPER_BONUS_AT else 0
+    l_sum = sum(card.get(r) or 0 for r in [9, 10, 11, 12, 13, 14, 16])
+    y_bonus = (card.get(YAHTZII_BONUS_ROW) or 0) * 100
+    return {
+        6: u_sum, 7: bonus, 8: u_sum + bonus,
+        17: l_sum + y_bonus, 18: u_sum + bonus + l_sum + y_bonus,
+    }
+
+
+# ============================================================================
+# LEGAL-MOVE ENGINE — precomputed, shared by the scorecard, server and tools
+# ============================================================================
+# Category bit i is PRIMARY_CATEGORIES[i]; a claim mask has a bit set for
+# every category the player has already filled.
+CATEGORY_COUNT = len(PRIMARY_CATEGORIES)
+CATEGORY_BIT   = {row: 1 << i for i, row in enumerate(PRIMARY_CATEGORIES)}
+CATEGORY_INDEX = {row: i for i, row in enumerate(PRIMARY_CATEGORIES)}
+ALL_MASK       = (1 << CATEGORY_COUNT) - 1
+UPPER_MASK     = sum(CATEGORY_BIT[r] for r in UPPER_SECTION)
+LOWER_MASK     = sum(CATEGORY_BIT[r] for r in LOWER_SECTION_PRIMARY)
+
+Moves = namedtuple("Moves", "legal scores valid bonus")
+Moves.__doc__ = """
+legal   bitmask of categories that may be claimed now
+scores  13-tuple of what each category would score (aligned to PRIMARY_CATEGORIES)
+valid   bitmask of categories that score more than zero with these dice
+bonus   True when these dice earn a +100 Yahtzii bonus
+"""
+
+
+def _build_dice_table():
+    table = {}
+    for key in combinations_with_replacement(range(1, 7), 5):
+        scores = tuple(row_score(r, key) for r in PRIMARY_CATEGORIES)
+        joker  = tuple(row_score(r, key, joker=True) for r in PRIMARY_CATEGORIES)
+        valid  = sum(1 << i for i, s in enumerate(scores) if s > 0)
+        table[key] = (scores, joker, valid)
+    return table
+
+
+def _build_joker_table():
+    """JOKER_TABLE[face - 1][open_mask] -> legal mask under Joker priority."""
+    table = []
+    for face in range(1, 7):
+        upper_bit = CATEGORY_BIT[face - 1]
+        row = []
+        for open_mask in range(ALL_MASK + 1):
+            if open_mask & upper_bit:
+                row.append(upper_bit)                    # ① matching Upper box
+            elif open_mask & LOWER_MASK:
+                row.append(open_mask & LOWER_MASK)       # ② any open Lower box
+            else:
+                row.append(open_mask & UPPER_MASK)       # ③ 0 in any Upper box
+        table.append(row)
+    return table
+
+
+DICE_TABLE  = _build_dice_table()    # sorted dice -> (scores, joker scores, valid mask)
+JOKER_TABLE = _build_joker_table()
+
+
+def legal_moves(dice, claim_mask: int, yahtzii_box=None, joker: bool = False) -> Moves:
+    """
+    All legal (category, score) moves for one player, by table lookup.
+
+    `yahtzii_box` is the Yahtzii row's value (None while open, 50 or 0 once
+    claimed).  `joker` is set once a bonus Yahtzii has been taken this turn.
+    """
+    key = tuple(sorted(dice))
+    scores, joker_scores, valid = DICE_TABLE[key]
+    open_mask = ALL_MASK & ~claim_mask
+    bonus = key[0] == key[4] and yahtzii_box == 50
+    if joker:
+        return Moves(JOKER_TABLE[key[0] - 1][open_mask], joker_scores, valid, bonus)
+    return Moves(open_mask, scores, valid, bonus)
+
+
+def rows_in(mask: int) -> list:
+    """Scorecard rows whose category bit is set in `mask`."""
+    return [r for r in PRIMARY_CATEGORIES if mask & CATEGORY_BIT[r]]
+
+
+# Tie-break priority for score hints: more specific fields win ties.
+HINT_PRIORITY = {0: 11, 1: 12, 2: 13, 3: 14, 4: 15, 5: 16,
+                 9: 40, 10: 50, 11: 60, 12: 70, 13: 80, 14: 90, 16: 30}
+_ALWAYS_HINTED = UPPER_MASK | CATEGORY_BIT[16]
+
+
+def best_hint(dice, claim_mask: int = 0):
+    """
+    (label, score) of the best open category for `dice`.  Upper rows and
+    Chance are always candidates; other lower rows only when they qualify.
+    """
+    moves = legal_moves(dice, claim_mask)
+    cand  = moves.legal & (moves.valid | _ALWAYS_HINTED)
+    if not cand:
+        return ("No open scoring fields", 0)
+    best = max(rows_in(cand),
+               key=lambda r: (moves.scores[CATEGORY_INDEX[r]], HINT_PRIORITY[r]))
+    return (ROW_LABELS[best], moves.scores[CATEGORY_INDEX[best]])
+
+
+# ============================================================================
+# TURN ORDER
+# ============================================================================
+def next_player_index(current: int, total: int, has_turns_left):
+    """
+    Index of the next player who still has open categories, starting after
+    `current` and wrapping around (the current player is checked last).
+    Returns None when nobody has a turn left — the game is over.
+    """
+    idx = current
+    for _ in range(total):
+        idx = (idx + 1) % total
+        if has_turns_left(idx):
+            return idx
+    return None
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+yahtzii_scenarios.py — End-to-end GUI scenario benchmarks, offscreen.
+
+Each scenario drives a real YahtzeeScorecard (and its YahtzeeRollerWidget)
+through the controls a player uses — Open Roller, ROLL, the dice, Done,
+the score menus, theme buttons, Reset and play-again — and reports:
+
+  * wall time per operation (turn, theme switch, reset), mean and p95
+  * event-loop latency: how late a 5 ms precise probe timer fires
+  * peak RSS of the process
+
+Every scenario runs in its own child process so peak RSS is its own.  The
+roller's charge and roll animations run at --anim-scale of their real
+length (default 0.1) so a full 8-player game takes about a minute; use
+--anim-scale 1 for real-time numbers.  Score files go to a temp directory.
+
+Run:  python yahtzii_scenarios.py [--json results.json] [--only themes]
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    import resource
+except ImportError:      # not on Windows
+    resource = None
+
+SCENARIOS = ("roller-8p", "physical-1p", "themes", "reset-play-again")
+
+
+# ============================================================================
+# PROBES
+# ============================================================================
+class LoopLatency:
+    """A precise 5 ms timer; records how late each tick fires, in ms."""
+
+    INTERVAL_MS = 5
+
+    def __init__(self):
+        from PyQt6.QtCore import QTimer, Qt
+        self.late  = []
+        self._last = time.perf_counter()
+        self._timer = QTimer()
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(self.INTERVAL_MS)
+        self._timer.timeout.connect(self._tick)
+        self._timer.start()
+
+    def _tick(self):
+        now = time.perf_counter()
+        self.late.append(max(0.0, (now - self._last) * 1000 - self.INTERVAL_MS))
+        self._last = now
+
+    def stop(self):
+        self._timer.stop()
+
+
+def pctl(values, q):
+    if not values:
+        return None
+    s = sorted(values)
+    return s[min(len(s) - 1, int(q * len(s)))]
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    # ru_maxrss is KB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+# ============================================================================
+# DRIVER
+# ============================================================================
+class Driver:
+    """Owns the app, the responder and the scorecard for one scenario."""
+
+    def __init__(self, seed, anim_scale):
+        from PyQt6.QtWidgets import QApplication
+        self.app = QApplication.instance() or QApplication(sys.argv[:1])
+        import yahtzii as yz
+        from yahtzii_leakcheck import Responder
+        self.yz  = yz
+        self.app.setStyleSheet(yz.DARK_STYLESHEET)
+        self.rnd = random.Random(seed)
+        self.anim_scale = anim_scale
+        os.chdir(tempfile.mkdtemp(prefix="yahtzii-scenario-"))
+
+        class ScenarioResponder(Responder):
+            """Also says Yes to the Reset confirmation."""
+            def _answer(self):
+                from PyQt6.QtWidgets import QMessageBox
+                modal = QApplication.activeModalWidget()
+                if isinstance(modal, QMessageBox):
+                    yes = modal.button(QMessageBox.StandardButton.Yes)
+                    if yes is not None:
+                        yes.click()
+                        return
+                super()._answer()
+
+        self.responder = ScenarioResponder(yz, self.rnd)
+        self.latency   = LoopLatency()
+        self.board     = None
+
+    def wait(self, done, timeout=30.0):
+        """Run the event loop (not a busy spin) until done() holds."""
+        from PyQt6.QtCore import QEventLoop, QTimer
+        deadline = time.perf_counter() + timeout
+        loop = QEventLoop()
+        while not done():
+            if time.perf_counter() > deadline:
+                raise TimeoutError("scenario step did not finish")
+            QTimer.singleShot(1, loop.quit)
+            loop.exec()
+
+    def open_board(self, players, roller):
+        yz = self.yz
+        if self.board is None:
+            self.board = yz.YahtzeeScorecard(players, use_digital_roller=roller)
+        else:
+            self.board.start_game(players, use_digital_roller=roller)
+        self.board.loop = yz.QEventLoop()   # closeEvent looks for it
+        self.board.show()
+        return self.board
+
+    def first_paint(self, widget):
+        probe = self.yz._paint_probe(widget)
+        self.wait(lambda: probe.painted)
+        widget.removeEventFilter(probe)
+
+    # ------------------------------------------------------------ turns ----
+    def claim(self, rows):
+        """Click a random one of `rows` in the active column; the responder picks the score."""
+        board = self.board
+        c     = board.current_turn_index
+        cell  = board.table.cellWidget(self.rnd.choice(rows), c)
+        self.wait(cell.isEnabled)      # a click on a still-locked column is dropped
+        cell.click()
+
+    def open_rows(self):
+        from PyQt6.QtCore import Qt
+        board, c = self.board, self.board.current_turn_index
+        return [r for r in self.yz.PRIMARY_CATEGORIES
+                if board.table.item(r, c).data(Qt.ItemDataRole.UserRole) != "claimed"]
+
+    def physical_turn(self):
+        self.claim(self.open_rows())
+
+    def roller_turn(self):
+        from PyQt6.QtCore import Qt
+        from PyQt6.QtTest import QTest
+        board = self.board
+        self.wait(lambda: board._roller is not None and board._roller.isVisible())
+        roller = board._roller
+        if roller.CHARGE_DURATION == type(roller).CHARGE_DURATION:
+            for attr in ("CHARGE_DURATION", "ROLL_DURATION_MIN", "ROLL_DURATION_MAX"):
+                setattr(roller, attr, max(1, int(getattr(type(roller), attr) * self.anim_scale)))
+        for n in range(self.rnd.randint(1, 3)):
+            left = roller.rolls_left
+            roller.roll_button.click()
+            self.wait(lambda: roller.state == "IDLE" and roller.rolls_left == left - 1)
+            if n < 2:
+                for dw in roller.die_widgets:
+                    if self.rnd.random() < 0.3:
+                        QTest.mouseClick(dw, Qt.MouseButton.LeftButton)
+        roller.use_dice_btn.click()
+        c     = board.current_turn_index
+        box   = board.table.item(14, c).text()
+        moves = self.yz.legal_moves(board._roller_dice, board._claimed[c],
+                                    int(box) if box.isdigit() else None, board.joker_active)
+        self.claim([r for r in self.yz.PRIMARY_CATEGORIES if moves.legal & self.yz.CATEGORY_BIT[r]])
+
+    def play_game(self, turn):
+        """Play turns until game over; seconds per turn."""
+        board, times = self.board, []
+        while not board.play_again_requested:
+            t0 = time.perf_counter()
+            before = (board.current_turn_index, bin(board._claimed[board.current_turn_index]))
+            turn()
+            c = before[0]
+            self.wait(lambda: board.play_again_requested
+                      or bin(board._claimed[c]) != before[1])
+            if not any(board.player_has_turns_left(p) for p in range(len(board.players))):
+                self.wait(lambda: board.play_again_requested)   # game-over dialog answered
+            times.append(time.perf_counter() - t0)
+        return times
+
+
+# ============================================================================
+# SCENARIOS
+# ============================================================================
+def scenario_roller_8p(d, args):
+    board = d.open_board([f"P{i + 1}" for i in range(8)], roller=True)
+    d.first_paint(board.table.viewport())
+    board.open_roller_btn.click()
+    return "turn", d.play_game(d.roller_turn)
+
+
+def scenario_physical_1p(d, args):
+    board = d.open_board(["Solo"], roller=False)
+    d.first_paint(board.table.viewport())
+    return "turn", d.play_game(d.physical_turn)
+
+
+def scenario_themes(d, args):
+    board = d.open_board(["Ann", "Bob"], roller=True)
+    d.first_paint(board.table.viewport())
+    board.open_roller_btn.click()
+    d.wait(lambda: board._roller is not None and board._roller.isVisible())
+    roller = board._roller
+    names  = list(roller.theme_buttons)
+    times  = []
+    for i in range(args.switches):
+        name = names[(names.index(roller.current_theme) + 1 + i % 3) % len(names)]
+        probes = [d.yz._paint_probe(w) for w in (board.table.viewport(), roller)]
+        t0 = time.perf_counter()
+        roller.theme_buttons[name].click()
+        d.wait(lambda: all(p.painted for p in probes))
+        times.append(time.perf_counter() - t0)
+        board.table.viewport().removeEventFilter(probes[0])
+        roller.removeEventFilter(probes[1])
+    return "switch", times
+
+
+def scenario_reset_play_again(d, args):
+    players = ["Ann", "Bob", "Cy"]
+    times   = []
+    board   = d.open_board(players, roller=False)
+    d.first_paint(board.table.viewport())
+    for i in range(args.cycles):
+        for _ in range(2):
+            before = bin(board._claimed[board.current_turn_index])
+            c = board.current_turn_index
+            d.physical_turn()
+            d.wait(lambda: bin(board._claimed[c]) != before)
+        t0 = time.perf_counter()
+        if i % 2:
+            board.reset()                        # Reset button; the responder says Yes
+        else:
+            d.open_board(players, roller=False)  # Play Again, same order
+        d.first_paint(board.table.viewport())
+        times.append(time.perf_counter() - t0)
+    return "reset", times
+
+
+RUNNERS = {
+    "roller-8p":        scenario_roller_8p,
+    "physical-1p":      scenario_physical_1p,
+    "themes":           scenario_themes,
+    "reset-play-again": scenario_reset_play_again,
+}
+
+
+def run_one(name, args) -> dict:
+    d  = Driver(args.seed, args.anim_scale)
+    t0 = time.perf_counter()
+    unit, times = RUNNERS[name](d, args)
+    wall = time.perf_counter() - t0
+    d.latency.stop()
+    d.responder.stop()
+    late = d.latency.late
+    return {
+        "scenario": name, "unit": unit, "ops": len(times), "wall_s": round(wall, 3),
+        "op_mean_ms": round(sum(times) / len(times) * 1000, 2) if times else None,
+        "op_p95_ms":  round(pctl(times, 0.95) * 1000, 2) if times else None,
+        "loop_p50_ms": round(pctl(late, 0.50), 2) if late else None,
+        "loop_p95_ms": round(pctl(late, 0.95), 2) if late else None,
+        "loop_max_ms": round(max(late), 2) if late else None,
+        "peak_rss_mb": round(peak_rss_mb(), 1) if resource else None,
+        "anim_scale": args.anim_scale,
+    }
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+def print_table(rows):
+    def f(v, spec):
+        return "—" if v is None else format(v, spec)
+    print(f"{'scenario':<18}{'ops':>6}{'wall s':>9}{'ms/op':>10}{'p95':>10}"
+          f"{'loop p50':>10}{'p95':>8}{'max':>9}{'RSS MB':>9}")
+    for r in rows:
+        print(f"{r['scenario']:<18}{r['ops']:>6}{r['wall_s']:>9.1f}{f(r['op_mean_ms'], '.1f'):>10}"
+              f"{f(r['op_p95_ms'], '.1f'):>10}{f(r['loop_p50_ms'], '.2f'):>10}"
+              f"{f(r['loop_p95_ms'], '.2f'):>8}{f(r['loop_max_ms'], '.1f'):>9}"
+              f"{f(r['peak_rss_mb'], '.0f'):>9}")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Offscreen end-to-end GUI scenario benchmarks")
+    ap.add_argument("--only", action="append", choices=SCENARIOS,
+                    help="run just this scenario (repeatable)")
+    ap.add_argument("--anim-scale", type=float, default=0.1,
+                    help="roller charge / roll animation length vs real (1 = real time)")
+    ap.add_argument("--switches", type=int, default=50, help="theme switches in 'themes'")
+    ap.add_argument("--cycles", type=int, default=20, help="resets / play-agains in 'reset-play-again'")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--json", metavar="PATH", default=None, help="write results and machine metadata")
+    ap.add_argument("--run-one", choices=SCENARIOS, help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.run_one:
+        print(json.dumps(run_one(args.run_one, args)))
+        return 0
+
+    rows = []
+    for name in args.only or SCENARIOS:
+        cmd = [sys.executable, os.path.abspath(__file__), "--run-one", name,
+               "--anim-scale", str(args.anim_scale), "--switches", str(args.switches),
+               "--cycles", str(args.cycles), "--seed", str(args.seed)]
+        proc = subprocess.run(cmd, capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)))
+        if proc.returncode != 0:
+            print(f"{name}: failed\n{proc.stderr[-2000:]}", file=sys.stderr)
+            return 1
+        rows.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    print_table(rows)
+    if args.json:
+        from yahtzii_bench import machine_metadata
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"meta": machine_metadata(), "scenarios": rows}, f, indent=2)
+        print(f"results -> {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,520 @@
+#!/usr/bin/env python3
+"""
+yahtzii_server.py — Local asyncio table server for multiplayer Yahtzii.
+
+Hosts many concurrent tables in one process.  The server owns the dice:
+clients only say which dice they hold and which row they claim, and every
+score is computed here with the same rules as the scorecard
+(yahtzii_rules).  Turn order follows the scorecard's advance_to_next_player.
+
+Protocol: one JSON object per message.
+  TCP        newline-delimited JSON           (--port, default 8765)
+  WebSocket  one text frame per JSON object   (--ws-port, default 8766)
+
+Requests (an optional "id" is echoed back in the reply):
+  {"op": "create", "players": ["Ann", "Bob"]}
+  {"op": "join",   "table": "t1"}
+  {"op": "leave",  "table": "t1"}
+  {"op": "roll",   "table": "t1", "player": "Ann", "held": [0,1,0,0,1]}
+  {"op": "claim",  "table": "t1", "player": "Ann", "row": 9}
+  {"op": "state",  "table": "t1"}
+  {"op": "stats"}
+
+Every accepted roll / claim is also broadcast to the table's subscribers as
+{"event": "roll" | "claim" | "game_over", "table": ..., "state": {...}}.
+
+Run:  python yahtzii_server.py [--host 127.0.0.1] [--port 8765] [--ws-port 8766]
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import itertools
+import json
+import os
+import random
+import struct
+import sys
+import time
+from collections import deque
+
+from yahtzii_rules import (
+    ROW_LABELS, YAHTZII_ROW, YAHTZII_BONUS_ROW, ALL_MASK, CATEGORY_BIT,
+    CATEGORY_INDEX, legal_moves, rows_in, card_totals, next_player_index,
+)
+
+MAX_PLAYERS      = 8
+MAX_SUBSCRIBERS  = 16     # per table
+HISTORY_LEN      = 16     # recent moves kept per table
+SEND_QUEUE_LEN   = 256    # per connection; a client that falls this far behind is dropped
+MAX_LINE_BYTES   = 4096
+MAX_NAME_LEN     = 24
+
+
+class RuleError(Exception):
+    """A request that is well-formed but not allowed by the rules."""
+
+
+# ============================================================================
+# TABLE — authoritative game state for one game
+# ============================================================================
+class Table:
+    """
+    One game.  Memory is bounded: cards are fixed-size dicts, the move
+    history is a ring buffer and the subscriber set is capped.
+    """
+
+    __slots__ = ("table_id", "players", "cards", "claimed", "current", "dice", "held",
+                 "rolls_left", "joker", "finished", "history", "subscribers",
+                 "rng", "created", "touched")
+
+    def __init__(self, table_id: str, players, rng: random.Random):
+        self.table_id    = table_id
+        self.players     = list(players)
+        self.cards       = [{YAHTZII_BONUS_ROW: 0} for _ in self.players]
+        self.claimed     = [0] * len(self.players)     # claim bitmask per player
+        self.current     = 0
+        self.dice        = None
+        self.held        = [False] * 5
+        self.rolls_left  = 3
+        self.joker       = False
+        self.finished    = False
+        self.history     = deque(maxlen=HISTORY_LEN)
+        self.subscribers = set()
+        self.rng         = rng
+        self.created     = time.monotonic()
+        self.touched     = self.created
+
+    # ---------------------------------------------------------------- rules --
+    def has_turns_left(self, c):
+        return self.claimed[c] != ALL_MASK
+
+    def moves(self):
+        """Legal-move lookup for the current player and dice."""
+        c = self.current
+        return legal_moves(self.dice, self.claimed[c],
+                           self.cards[c].get(YAHTZII_ROW), self.joker)
+
+    def legal_rows(self):
+        """Rows the current player may claim with the current dice."""
+        if self.dice is None or self.finished:
+            return []
+        return rows_in(self.moves().legal)
+
+    def _check_turn(self, player):
+        if self.finished:
+            raise RuleError("game is over")
+        if player != self.players[self.current]:
+            raise RuleError(f"it is {self.players[self.current]}'s turn")
+
+    def roll(self, player, held=None):
+        self._check_turn(player)
+        if self.rolls_left == 0:
+            raise RuleError("no rolls left")
+        if self.dice is None or held is None:
+            held = [False] * 5
+        if (not isinstance(held, list) or len(held) != 5
+                or any(type(h) not in (bool, int) or h not in (0, 1) for h in held)):
+            raise RuleError("held must list 5 dice as true / false (or 1 / 0)")
+        self.held = [bool(h) for h in held]
+        self.dice = [
+            d if self.dice is not None and h else self.rng.randint(1, 6)
+            for d, h in zip(self.dice or [0] * 5, self.held)
+        ]
+        self.rolls_left -= 1
+        # A bonus Yahtzii (Yahtzii box already holds 50) scores +100 and
+        # switches the turn to Joker rules, exactly like the scorecard's "+".
+        self.joker = self.moves().bonus
+        self.touched = time.monotonic()
+        self.history.append(("roll", self.current, tuple(self.dice)))
+
+    def claim(self, player, row):
+        self._check_turn(player)
+        if self.dice is None:
+            raise RuleError("roll before claiming")
+        if type(row) is not int:             # bool is an int subclass: True would claim row 1
+            raise RuleError("row must be an integer")
+        moves = self.moves()
+        if not moves.legal & CATEGORY_BIT.get(row, 0):
+            raise RuleError(f"{ROW_LABELS[row] if 0 <= row < len(ROW_LABELS) else row} "
+                            f"is not available")
+        card  = self.cards[self.current]
+        score = moves.scores[CATEGORY_INDEX[row]]
+        card[row] = score
+        self.claimed[self.current] |= CATEGORY_BIT[row]
+        if self.joker:
+            card[YAHTZII_BONUS_ROW] += 1
+        self.history.append(("claim", self.current, row, score))
+        self.touched = time.monotonic()
+
+        self.dice       = None
+        self.held       = [False] * 5
+        self.rolls_left = 3
+        self.joker      = False
+        nxt = next_player_index(self.current, len(self.players), self.has_turns_left)
+        if nxt is None:
+            self.finished = True
+        else:
+            self.current = nxt
+        return score
+
+    # ------------------------------------------------------------- snapshot --
+    def snapshot(self) -> dict:
+        return {
+            "table":      self.table_id,
+            "players":    self.players,
+            "current":    self.players[self.current],
+            "dice":       self.dice,
+            "held":       self.held,
+            "rolls_left": self.rolls_left,
+            "joker":      self.joker,
+            "legal":      self.legal_rows(),
+            "finished":   self.finished,
+            "cards": [
+                {str(r): v for r, v in card.items()} for card in self.cards
+            ],
+            "totals": [card_totals(card)[18] for card in self.cards],
+        }
+
+    def ranking(self):
+        return sorted(
+            ((self.players[i], card_totals(card)[18]) for i, card in enumerate(self.cards)),
+            key=lambda x: x[1], reverse=True
+        )
+
+
+# ============================================================================
+# CONNECTIONS
+# ============================================================================
+class Session:
+    """One client connection.  Outbound messages go through a bounded queue."""
+
+    def __init__(self, writer, encode):
+        self.writer  = writer
+        self.encode  = encode           # callable(dict) -> bytes
+        self.queue   = asyncio.Queue(SEND_QUEUE_LEN)
+        self.tables  = set()
+        self.closed  = False
+        self._task   = asyncio.ensure_future(self._drain())
+
+    def send(self, msg: dict):
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait(self.encode(msg))
+        except asyncio.QueueFull:
+            # Slow consumer: never let one client hold up a table.
+            self.close()
+
+    async def _drain(self):
+        try:
+            while True:
+                data = await self.queue.get()
+                if data is None:
+                    break
+                self.writer.write(data)
+                await self.writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self.closed = True
+            self.writer.close()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            self._task.cancel()
+
+
+def _json_line(msg):
+    return json.dumps(msg, separators=(",", ":")).encode() + b"\n"
+
+
+# ============================================================================
+# SERVER
+# ============================================================================
+class TableServer:
+    def __init__(self, max_tables: int = 1000, idle_timeout: float = 600.0,
+                 seed=None):
+        self.max_tables   = max_tables
+        self.idle_timeout = idle_timeout
+        self.tables       = {}
+        self._ids         = itertools.count(1)
+        # Authoritative dice: every table gets its own generator seeded from
+        # the OS (or from --seed for reproducible benchmark runs).
+        self._seed_rng    = random.Random(seed if seed is not None else os.urandom(16))
+        self.stats        = {"connections": 0, "requests": 0, "games_finished": 0,
+                             "errors": 0, "started": time.time()}
+
+    # -------------------------------------------------------------- dispatch --
+    def dispatch(self, session: Session, msg: dict) -> dict:
+        self.stats["requests"] += 1
+        op = msg.get("op")
+        handler = getattr(self, f"_op_{op}", None) if isinstance(op, str) else None
+        if handler is None:
+            raise RuleError(f"unknown op {op!r}")
+        return handler(session, msg)
+
+    def _table(self, msg) -> Table:
+        table_id = msg.get("table")
+        if not isinstance(table_id, str):
+            raise RuleError("table must be a table id string")
+        table = self.tables.get(table_id)
+        if table is None:
+            raise RuleError("no such table")
+        return table
+
+    def _subscribe(self, session, table):
+        if session not in table.subscribers:
+            if len(table.subscribers) >= MAX_SUBSCRIBERS:
+                raise RuleError("table is full")
+            table.subscribers.add(session)
+            session.tables.add(table.table_id)
+
+    def _broadcast(self, table, event, **extra):
+        msg = {"event": event, "table": table.table_id, "state": table.snapshot()}
+        msg.update(extra)
+        for sub in list(table.subscribers):
+            sub.send(msg)
+
+    def _op_create(self, session, msg):
+        players = msg.get("players")
+        if (not isinstance(players, list) or not 1 <= len(players) <= MAX_PLAYERS
+                or not all(isinstance(p, str) and p.strip() for p in players)):
+            raise RuleError(f"players must be 1–{MAX_PLAYERS} names")
+        players = [p.strip()[:MAX_NAME_LEN] for p in players]
+        if len(set(players)) != len(players):
+            raise RuleError("player names must be unique")
+        if len(self.tables) >= self.max_tables:
+            self._reap_idle()
+            if len(self.tables) >= self.max_tables:
+                raise RuleError("server is full")
+        table_id = f"t{next(self._ids)}"
+        table = Table(table_id, players, random.Random(self._seed_rng.getrandbits(64)))
+        self.tables[table_id] = table
+        self._subscribe(session, table)
+        return {"table": table_id, "state": table.snapshot()}
+
+    def _op_join(self, session, msg):
+        table = self._table(msg)
+        self._subscribe(session, table)
+        return {"state": table.snapshot()}
+
+    def _op_leave(self, session, msg):
+        table = self._table(msg)
+        self._unsubscribe(session, table)
+        return {}
+
+    def _op_state(self, session, msg):
+        return {"state": self._table(msg).snapshot()}
+
+    def _op_roll(self, session, msg):
+        table = self._table(msg)
+        table.roll(msg.get("player"), msg.get("held"))
+        self._broadcast(table, "roll")
+        return {}
+
+    def _op_claim(self, session, msg):
+        table = self._table(msg)
+        row   = msg.get("row")
+        score = table.claim(msg.get("player"), row)
+        self._broadcast(table, "claim", row=row, score=score)
+        if table.finished:
+            self.stats["games_finished"] += 1
+            self._broadcast(table, "game_over", ranking=table.ranking())
+        return {"score": score}
+
+    def _op_stats(self, session, msg):
+        return {"stats": dict(self.stats, tables=len(self.tables))}
+
+    # ------------------------------------------------------------ lifecycle --
+    def _unsubscribe(self, session, table):
+        table.subscribers.discard(session)
+        session.tables.discard(table.table_id)
+        if not table.subscribers:
+            self.tables.pop(table.table_id, None)
+
+    def _reap_idle(self):
+        cutoff = time.monotonic() - self.idle_timeout
+        for table_id, table in list(self.tables.items()):
+            if table.finished or table.touched < cutoff:
+                for sub in list(table.subscribers):
+                    sub.tables.discard(table_id)
+                del self.tables[table_id]
+
+    def _drop_session(self, session):
+        for table_id in list(session.tables):
+            table = self.tables.get(table_id)
+            if table is not None:
+                self._unsubscribe(session, table)
+        session.close()
+
+    def _handle_message(self, session, raw):
+        msg = {}
+        try:
+            msg = json.loads(raw)
+            if not isinstance(msg, dict):
+                msg = {}
+                raise RuleError("expected a JSON object")
+            reply = self.dispatch(session, msg)
+            reply["ok"] = True
+        except (RuleError, ValueError) as e:
+            self.stats["errors"] += 1
+            reply = {"ok": False, "error": str(e)}
+        if "id" in msg:
+            reply["id"] = msg["id"]
+        session.send(reply)
+
+    async def handle_tcp(self, reader, writer):
+        self.stats["connections"] += 1
+        session = Session(writer, _json_line)
+        try:
+            while not session.closed:
+                try:
+                    line = await reader.readuntil(b"\n")
+                except asyncio.LimitOverrunError:
+                    break
+                except asyncio.IncompleteReadError:
+                    break
+                if line.strip():
+                    self._handle_message(session, line)
+        except ConnectionError:
+            pass
+        finally:
+            self._drop_session(session)
+
+    async def handle_ws(self, reader, writer):
+        self.stats["connections"] += 1
+        if not await _ws_handshake(reader, writer):
+            writer.close()
+            return
+        session = Session(writer, _ws_text_frame)
+        try:
+            while not session.closed:
+                frame = await _ws_read_frame(reader)
+                if frame is None:
+                    break
+                opcode, payload = frame
+                if opcode == 0x1:
+                    self._handle_message(session, payload)
+                elif opcode == 0x9:
+                    writer.write(_ws_frame(0xA, payload))
+                elif opcode == 0x8:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._drop_session(session)
+
+    async def serve(self, host, port, ws_port=None):
+        servers = [await asyncio.start_server(self.handle_tcp, host, port,
+                                              limit=MAX_LINE_BYTES)]
+        if ws_port:
+            servers.append(await asyncio.start_server(self.handle_ws, host, ws_port))
+        for srv in servers:
+            for sock in srv.sockets:
+                print(f"Yahtzii table server listening on {sock.getsockname()}",
+                      file=sys.stderr)
+
+        async def reaper():
+            while True:
+                await asyncio.sleep(30)
+                self._reap_idle()
+
+        reap_task = asyncio.ensure_future(reaper())
+        try:
+            await asyncio.gather(*(srv.serve_forever() for srv in servers))
+        finally:
+            reap_task.cancel()
+
+
+# ============================================================================
+# MINIMAL WEBSOCKET (RFC 6455) — text frames only, no extensions
+# ============================================================================
+_WS_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+async def _ws_handshake(reader, writer) -> bool:
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+        return False
+    headers = {}
+    for line in head.decode("latin-1").split("\r\n")[1:]:
+        if ":" in line:
+            k, v = line.split(":", 1)
+            headers[k.strip().lower()] = v.strip()
+    key = headers.get("sec-websocket-key")
+    if not key:
+        writer.write(b"HTTP/1.1 400 Bad Request\r\n\r\n")
+        return False
+    accept = base64.b64encode(hashlib.sha1(key.encode() + _WS_GUID).digest())
+    writer.write(b"HTTP/1.1 101 Switching Protocols\r\n"
+                 b"Upgrade: websocket\r\nConnection: Upgrade\r\n"
+                 b"Sec-WebSocket-Accept: " + accept + b"\r\n\r\n")
+    await writer.drain()
+    return True
+
+
+async def _ws_read_frame(reader):
+    hdr = await reader.readexactly(2)
+    opcode = hdr[0] & 0x0F
+    masked = hdr[1] & 0x80
+    length = hdr[1] & 0x7F
+    if length == 126:
+        length, = struct.unpack("!H", await reader.readexactly(2))
+    elif length == 127:
+        length, = struct.unpack("!Q", await reader.readexactly(8))
+    if length > MAX_LINE_BYTES:
+        return None
+    mask    = await reader.readexactly(4) if masked else b"\0\0\0\0"
+    payload = bytearray(await reader.readexactly(length))
+    for i in range(length):
+        payload[i] ^= mask[i % 4]
+    return opcode, bytes(payload)
+
+
+def _ws_frame(opcode, payload: bytes) -> bytes:
+    n = len(payload)
+    if n < 126:
+        hdr = struct.pack("!BB", 0x80 | opcode, n)
+    elif n < 65536:
+        hdr = struct.pack("!BBH", 0x80 | opcode, 126, n)
+    else:
+        hdr = struct.pack("!BBQ", 0x80 | opcode, 127, n)
+    return hdr + payload
+
+
+def _ws_text_frame(msg) -> bytes:
+    return _ws_frame(0x1, json.dumps(msg, separators=(",", ":")).encode())
+
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Local Yahtzii multiplayer table server")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765, help="JSON-lines TCP port")
+    ap.add_argument("--ws-port", type=int, default=8766, help="WebSocket port (0 = off)")
+    ap.add_argument("--max-tables", type=int, default=1000)
+    ap.add_argument("--idle-timeout", type=float, default=600.0,
+                    help="seconds before an untouched table is reclaimed")
+    ap.add_argument("--seed", type=int, default=None,
+                    help="seed the dice for reproducible benchmark runs")
+    args = ap.parse_args(argv)
+
+    server = TableServer(args.max_tables, args.idle_timeout, args.seed)
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.ws_port or None))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""
+yahtzii_stats.py — Qt-free running player statistics.
+
+Every finished game updates each player's PlayerAggregate in O(1): counts,
+a Welford running mean / variance, best and worst, Yahtzii count and
+Upper-bonus count, plus a QuantileSketch for percentiles.  Nothing here
+rescans history; the whole book is a small JSON file however many games
+have been played.
+
+EloRatings rates named players from multiplayer results, incrementally
+after each game or in one batch replay of the whole history.
+SessionStats keeps the same kind of running totals in memory for one run
+of the app.
+"""
+
+import json
+
+from yahtzii_io import write_json_atomic
+from yahtzii_rules import PRIMARY_CATEGORIES, YAHTZII_ROW, YAHTZII_BONUS_ROW, card_totals
+
+
+class QuantileSketch:
+    """
+    Mergeable histogram sketch for integer scores.
+
+    Values are counted in buckets of `width`; once more than MAX_BINS
+    buckets are in use the width doubles and neighbouring buckets merge.
+    Memory stays at MAX_BINS buckets whatever the history length, and a
+    quantile is off by at most width / 2 (exact while width is 1, which
+    covers the full 0–1575 Yahtzii range at the default size).
+    """
+
+    MAX_BINS = 2048
+
+    __slots__ = ("width", "bins", "count")
+
+    def __init__(self, width: int = 1, bins=None, count: int = 0):
+        self.width = width
+        self.bins  = bins or {}       # bucket index -> count
+        self.count = count
+
+    def add(self, value: int, n: int = 1):
+        b = value // self.width
+        self.bins[b] = self.bins.get(b, 0) + n
+        self.count  += n
+        if len(self.bins) > self.MAX_BINS:
+            self._widen()
+
+    def _widen(self):
+        merged = {}
+        for b, n in self.bins.items():
+            merged[b // 2] = merged.get(b // 2, 0) + n
+        self.width *= 2
+        self.bins   = merged
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        while self.width < other.width:
+            self._widen()
+        for b, n in other.bins.items():
+            self.add(b * other.width, n)
+        return self
+
+    def quantile(self, q: float):
+        """Value at rank q (0..1), or None for an empty sketch."""
+        if not self.count:
+            return None
+        target = q * (self.count - 1)
+        seen   = 0
+        for b in sorted(self.bins):
+            seen += self.bins[b]
+            if seen > target:
+                return b * self.width + (self.width - 1) / 2
+        return max(self.bins) * self.width + (self.width - 1) / 2
+
+    def to_json(self) -> dict:
+        return {"width": self.width, "count": self.count,
+                "bins": {str(b): n for b, n in self.bins.items()}}
+
+    @classmethod
+    def from_json(cls, data: dict) -> "QuantileSketch":
+        return cls(data["width"], {int(b): n for b, n in data["bins"].items()}, data["count"])
+
+
+class PlayerAggregate:
+    """One player's lifetime totals, updated in O(1) per game."""
+
+    FIELDS = ("games", "mean", "m2", "best", "worst", "yahtziis", "bonuses")
+
+    __slots__ = FIELDS + ("sketch",)
+
+    def __init__(self):
+        self.games    = 0
+        self.mean     = 0.0
+        self.m2       = 0.0          # Welford: sum of squared deviations
+        self.best     = None
+        self.worst    = None
+        self.yahtziis = 0
+        self.bonuses  = 0
+        self.sketch   = QuantileSketch()
+
+    def add(self, score: int, yahtziis: int = 0, bonus: bool = False):
+        self.games += 1
+        delta       = score - self.mean
+        self.mean  += delta / self.games
+        self.m2    += delta * (score - self.mean)
+        self.best   = score if self.best is None else max(self.best, score)
+        self.worst  = score if self.worst is None else min(self.worst, score)
+        self.yahtziis += yahtziis
+        self.bonuses  += bool(bonus)
+        self.sketch.add(score)
+
+    @property
+    def stdev(self) -> float:
+        return (self.m2 / (self.games - 1)) ** 0.5 if self.games > 1 else 0.0
+
+    @property
+    def bonus_rate(self) -> float:
+        return self.bonuses / self.games if self.games else 0.0
+
+    def percentile(self, p: float):
+        return self.sketch.quantile(p / 100)
+
+    def to_json(self) -> dict:
+        data = {f: getattr(self, f) for f in self.FIELDS}
+        data["sketch"] = self.sketch.to_json()
+        return data
+
+    @classmethod
+    def from_json(cls, data: dict) -> "PlayerAggregate":
+        agg = cls()
+        for f in cls.FIELDS:
+            setattr(agg, f, data[f])
+        agg.sketch = QuantileSketch.from_json(data["sketch"])
+        return agg
+
+
+class StatsBook:
+    """{player name: PlayerAggregate}, persisted as one JSON file."""
+
+    def __init__(self, path: str = None):
+        self.path    = path
+        self.players = {}
+
+    @classmethod
+    def load(cls, path: str) -> "StatsBook":
+        book = cls(path)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            book.players = {n: PlayerAggregate.from_json(a) for n, a in data["players"].items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+        return book
+
+    def to_json(self) -> dict:
+        return {"version": 1, "players": {n: a.to_json() for n, a in self.players.items()}}
+
+    def record_card(self, name: str, card: dict):
+        """Fold one finished {row: score} card (row 15 = bonus count) into `name`."""
+        totals   = card_totals(card)
+        yahtziis = (card.get(YAHTZII_ROW) == 50) + (card.get(YAHTZII_BONUS_ROW) or 0)
+        self.players.setdefault(name, PlayerAggregate()).add(totals[18], yahtziis, totals[7] > 0)
+
+    def record_game(self, game: dict):
+        """Fold in a recorded-game dict (see yahtzii_strategy RECORDED GAMES)."""
+        for name, card in zip(game["players"], game["cards"]):
+            self.record_card(name, {int(r): v for r, v in card.items()})
+
+    def __bool__(self):
+        return bool(self.players)
+
+
+class EloRatings:
+    """
+    Multiplayer Elo.  A game with n players counts as every pair playing
+    once (a tie in score is a draw), with K shared out over the n - 1
+    opponents.  All deltas come from the pre-game ratings, so seating
+    order never matters.
+
+    update() is the incremental path (one finished game); replay() is the
+    batch path, rebuilding every rating from a chronological history.
+    """
+
+    BASE  = 1500.0
+    K     = 32.0
+    SCALE = 400.0
+
+    def __init__(self, path: str = None):
+        self.path    = path
+        self.ratings = {}        # name -> rating
+        self.games   = {}        # name -> rated games played
+
+    def rating(self, name: str):
+        """Current rating, or None for a player with no rated games."""
+        return self.ratings.get(name)
+
+    def update(self, ranking):
+        """Fold in one finished game: [(name, score), ...] in any order."""
+        if len(ranking) < 2:
+            return
+        ratings, base, scale = self.ratings, self.BASE, self.SCALE
+        k = self.K / (len(ranking) - 1)
+        pre = [(name, score, ratings.get(name, base)) for name, score in ranking]
+        for i, (name, score, r) in enumerate(pre):
+            delta = 0.0
+            for j, (_, other_score, r_other) in enumerate(pre):
+                if i == j:
+                    continue
+                actual   = 1.0 if score > other_score else 0.5 if score == other_score else 0.0
+                expected = 1.0 / (1.0 + 10.0 ** ((r_other - r) / scale))
+                delta   += actual - expected
+            ratings[name] = r + k * delta
+            self.games[name] = self.games.get(name, 0) + 1
+
+    @classmethod
+    def replay(cls, rankings, path: str = None) -> "EloRatings":
+        """Rebuild ratings from an iterable of rankings, oldest game first."""
+        elo = cls(path)
+        update = elo.update
+        for ranking in rankings:
+            update(ranking)
+        return elo
+
+    @classmethod
+    def load(cls, path: str) -> "EloRatings":
+        elo = cls(path)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data["ratings"], dict) and isinstance(data["games"], dict):
+                elo.ratings = data["ratings"]
+                elo.games   = data["games"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return elo
+
+    def to_json(self) -> dict:
+        """A snapshot: later updates do not change the returned dicts."""
+        return {"version": 1, "ratings": dict(self.ratings), "games": dict(self.games)}
+
+    def save(self):
+        write_json_atomic(self.path, self.to_json())
+
+    def leaderboard(self) -> list:
+        """[(name, rating, games)] best first."""
+        return sorted(((n, r, self.games.get(n, 0)) for n, r in self.ratings.items()),
+                      key=lambda x: -x[1])
+
+    def __bool__(self):
+        return bool(self.ratings)
+
+
+def game_ranking(game: dict) -> list:
+    """[(name, final score)] for a recorded-game dict."""
+    return [(name, card_totals({int(r): v for r, v in card.items()})[18])
+            for name, card in zip(game["players"], game["cards"])]
+
+
+class SessionStats:
+    """
+    In-memory stats for one run of the app, carried across play-again
+    games: wins, running averages, per-category totals and head-to-head
+    records.  record() is O(1) per game (for at most eight players).
+    """
+
+    def __init__(self):
+        self.games      = 0
+        self.players    = {}   # name -> PlayerAggregate
+        self.wins       = {}   # name -> games won (a shared top score counts for each)
+        self.cat_totals = {}   # name -> [points per category], aligned to PRIMARY_CATEGORIES
+        self._h2h       = {}   # (a, b) with a < b -> [a wins, b wins, draws]
+
+    def record(self, ranking, cards):
+        """
+        Fold in one finished game.  `ranking` is [(name, score), ...] best
+        first; `cards` maps name -> {row: score} (row 15 = bonus count).
+        """
+        self.games += 1
+        top = ranking[0][1]
+        for name, score in ranking:
+            card     = cards[name]
+            totals   = card_totals(card)
+            yahtziis = (card.get(YAHTZII_ROW) == 50) + (card.get(YAHTZII_BONUS_ROW) or 0)
+            self.players.setdefault(name, PlayerAggregate()).add(score, yahtziis, totals[7] > 0)
+            if score == top and len(ranking) > 1:
+                self.wins[name] = self.wins.get(name, 0) + 1
+            cats = self.cat_totals.setdefault(name, [0] * len(PRIMARY_CATEGORIES))
+            for i, row in enumerate(PRIMARY_CATEGORIES):
+                cats[i] += card.get(row) or 0
+        for i, (a, sa) in enumerate(ranking):
+            for b, sb in ranking[i + 1:]:
+                key = (a, b) if a < b else (b, a)
+                rec = self._h2h.setdefault(key, [0, 0, 0])
+                if sa == sb:
+                    rec[2] += 1
+                else:
+                    rec[0 if (sa > sb) == (key[0] == a) else 1] += 1
+
+    def category_averages(self, name: str) -> list:
+        """Average points per category for `name`, aligned to PRIMARY_CATEGORIES."""
+        agg = self.players.get(name)
+        if agg is None:
+            return [None] * len(PRIMARY_CATEGORIES)
+        return [t / agg.games for t in self.cat_totals[name]]
+
+    def head_to_head(self, a: str, b: str):
+        """(a's wins, b's wins, draws) over this session's games together."""
+        if a < b:
+            wa, wb, d = self._h2h.get((a, b), (0, 0, 0))
+        else:
+            wb, wa, d = self._h2h.get((b, a), (0, 0, 0))
+        return wa, wb, d
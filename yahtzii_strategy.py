@@ -0,0 +1,430 @@
+"""
+yahtzii_strategy.py — Qt-free play-out and estimation helpers.
+
+Builds on the legal-move engine in yahtzii_rules.  Used by the scorecard's
+background estimators and by offline tooling; nothing here imports PyQt6.
+"""
+
+import heapq
+from collections import Counter, namedtuple
+from functools import lru_cache
+from itertools import combinations_with_replacement, product
+from operator import itemgetter, mul
+
+from yahtzii_rules import (
+    UPPER_SECTION, PRIMARY_CATEGORIES, CATEGORY_BIT, CATEGORY_INDEX, ALL_MASK,
+    UPPER_MASK, UPPER_BONUS, UPPER_BONUS_AT, HINT_PRIORITY, DICE_TABLE,
+    legal_moves, rows_in,
+)
+
+# Everything about one player's card that matters for the rest of the game.
+#   claimed      claim bitmask (see yahtzii_rules.CATEGORY_BIT)
+#   upper_sum    sum of the Upper rows so far
+#   other        Lower rows + Yahtzii bonuses so far
+#   yahtzii_box  value in the Yahtzii row, or None while it is open
+PlayerState = namedtuple("PlayerState", "claimed upper_sum other yahtzii_box")
+
+# Order in which a greedy player burns a category when nothing scores.
+BURN_ORDER = [0, 14, 1, 13, 2, 12, 10, 11, 3, 9, 4, 5, 16]
+
+
+def final_score(state: PlayerState) -> int:
+    bonus = UPPER_BONUS if state.upper_sum >= UPPER_BONUS_AT else 0
+    return state.upper_sum + bonus + state.other
+
+
+def apply_claim(state: PlayerState, row: int, score: int, bonus: bool = False) -> PlayerState:
+    """State after scoring `score` in `row` (plus +100 if `bonus`)."""
+    upper_sum, other, box = state.upper_sum, state.other, state.yahtzii_box
+    if row in UPPER_SECTION:
+        upper_sum += score
+    else:
+        other += score
+    if row == 14:
+        box = score
+    if bonus:
+        other += 100
+    return PlayerState(state.claimed | CATEGORY_BIT[row], upper_sum, other, box)
+
+
+# ============================================================================
+# GREEDY PLAY-OUT
+# ============================================================================
+def _roll(dice, held, rnd):
+    return [d if h else int(rnd() * 6) + 1 for d, h in zip(dice, held)]
+
+
+def _greedy_holds(dice):
+    """Hold every die showing the most common face (ties go to the higher face)."""
+    counts = [0] * 7
+    for d in dice:
+        counts[d] += 1
+    face = max(range(1, 7), key=lambda f: (counts[f], f))
+    return [d == face for d in dice]
+
+
+def greedy_row(moves) -> int:
+    """Highest-scoring legal row; burns by BURN_ORDER when nothing scores."""
+    legal = rows_in(moves.legal)
+    best  = max(legal, key=lambda r: (moves.scores[CATEGORY_INDEX[r]], HINT_PRIORITY[r]))
+    if moves.scores[CATEGORY_INDEX[best]] > 0:
+        return best
+    return next(r for r in BURN_ORDER if moves.legal & CATEGORY_BIT[r])
+
+
+def greedy_turn(state: PlayerState, rnd, log=None) -> PlayerState:
+    """
+    Play one greedy turn: up to three rolls chasing the most common face.
+    If `log` is a list, the turn's record (see REGRET ANALYSIS) is appended.
+    """
+    dice  = _roll([0] * 5, [False] * 5, rnd)
+    rolls = [[dice, [False] * 5]] if log is not None else None
+    for _ in range(2):
+        if dice[0] == dice[1] == dice[2] == dice[3] == dice[4]:
+            break
+        held = _greedy_holds(dice)
+        dice = _roll(dice, held, rnd)
+        if rolls is not None:
+            rolls.append([dice, held])
+    moves = legal_moves(dice, state.claimed, state.yahtzii_box)
+    if moves.bonus:
+        moves = legal_moves(dice, state.claimed, state.yahtzii_box, joker=True)
+    row   = greedy_row(moves)
+    score = moves.scores[CATEGORY_INDEX[row]]
+    if log is not None:
+        log.append({"state": list(state), "rolls": rolls, "joker": moves.bonus,
+                    "row": row, "score": score})
+    return apply_claim(state, row, score, moves.bonus)
+
+
+def play_out(state: PlayerState, rnd) -> int:
+    """Final score after greedily filling every open category."""
+    while state.claimed != ALL_MASK:
+        state = greedy_turn(state, rnd)
+    return final_score(state)
+
+
+def win_trial(states, rnd) -> list:
+    """
+    One Monte Carlo game from `states`: each player's share of the win
+    (1 for the sole winner, split evenly on a tie).
+    """
+    finals = [play_out(s, rnd) for s in states]
+    top    = max(finals)
+    n_top  = finals.count(top)
+    return [1.0 / n_top if f == top else 0.0 for f in finals]
+
+
+def win_tally(states, trials: int, rnd) -> list:
+    """Each player's summed win shares over `trials` win_trial games."""
+    wins = [0.0] * len(states)
+    for _ in range(trials):
+        for i, share in enumerate(win_trial(states, rnd)):
+            wins[i] += share
+    return wins
+
+
+# ============================================================================
+# PRECOMPUTED VALUE TABLES
+# ============================================================================
+# Single-target tables: each category chased alone with its optimal holds.
+# They are exact and small enough to build in pure Python on first use:
+#
+#   keep_value[row][r][k]   expected score in `row` from holding KEEPS[k]
+#                           with r rolls still to come (r = 1..3)
+#   turn_ev[row]            keep_value[row][3][empty keep]: a whole turn
+#
+# Projection tables answer in O(1) per lookup.  For ev_open, holds follow a
+# fixed policy (keep whatever beats its category's average by most), so the
+# final-dice distribution is the same every turn and only the category
+# choice depends on the card.  bonus_prob is its own DP, with the holds
+# chosen per state:
+#
+#   ev_open[open_mask]                expected points still to come from the
+#                                     open categories, best category per roll
+#                                     (or a whole turn chasing one, if better)
+#   bonus_prob[upper_open][upper_sum] chance of reaching 63 in the Upper
+#                                     section, holding for it optimally
+DICE       = list(combinations_with_replacement(range(1, 7), 5))
+DICE_INDEX = {d: i for i, d in enumerate(DICE)}
+KEEPS      = [k for n in range(6) for k in combinations_with_replacement(range(1, 7), n)]
+KEEP_INDEX = {k: i for i, k in enumerate(KEEPS)}
+
+ValueTables      = namedtuple("ValueTables", "keep_value turn_ev")
+ProjectionTables = namedtuple("ProjectionTables", "ev_open bonus_prob final_dist")
+
+
+def _outcomes(n):
+    """{sorted n-dice outcome: probability}"""
+    counts = Counter(tuple(sorted(t)) for t in product(range(1, 7), repeat=n))
+    total  = 6 ** n
+    return {k: v / total for k, v in counts.items()}
+
+
+@lru_cache(maxsize=None)
+def _transitions():
+    """Per keep: [(prob, dice index)] after rolling the rest; per dice: its sub-keeps."""
+    outcome_cache = {n: _outcomes(n) for n in range(6)}
+    keep_next = []
+    for keep in KEEPS:
+        keep_next.append([
+            (p, DICE_INDEX[tuple(sorted(keep + out))])
+            for out, p in outcome_cache[5 - len(keep)].items()
+        ])
+    sub_keeps = []
+    for dice in DICE:
+        subs = {tuple(c for c, bit in zip(dice, range(5)) if mask >> bit & 1)
+                for mask in range(32)}
+        sub_keeps.append(sorted(KEEP_INDEX[s] for s in subs))
+    return keep_next, sub_keeps
+
+
+@lru_cache(maxsize=None)
+def value_tables() -> ValueTables:
+    """Single-target keep values for every primary category (built once)."""
+    keep_next, sub_keeps = _transitions()
+    keep_value, turn_ev = {}, {}
+    for row in PRIMARY_CATEGORIES:
+        i = CATEGORY_INDEX[row]
+        dice_value = [DICE_TABLE[d][0][i] for d in DICE]     # no rolls left
+        stages = {}
+        for r in (1, 2, 3):
+            kv = [sum(p * dice_value[j] for p, j in nxt) for nxt in keep_next]
+            stages[r] = kv
+            dice_value = [max(kv[k] for k in subs) for subs in sub_keeps]
+        keep_value[row] = stages
+        turn_ev[row]    = stages[3][KEEP_INDEX[()]]
+    return ValueTables(keep_value, turn_ev)
+
+
+def keep_advantage(r: int, keep_idx: int, open_rows=PRIMARY_CATEGORIES) -> float:
+    """
+    Best single-target gain of holding KEEPS[keep_idx] with r rolls to come,
+    over an average turn spent on that category.
+    """
+    vt = value_tables()
+    return max(vt.keep_value[row][r][keep_idx] - vt.turn_ev[row] for row in open_rows)
+
+
+@lru_cache(maxsize=None)
+def projection_tables() -> ProjectionTables:
+    """Projection tables (built once; a few seconds in pure Python)."""
+    keep_next, sub_keeps = _transitions()
+
+    # Final-dice distribution under the fixed hold policy.
+    final_dist = [0.0] * len(DICE)
+    for p, j in keep_next[KEEP_INDEX[()]]:
+        final_dist[j] += p
+    for r in (2, 1):
+        adv = [keep_advantage(r, k) for k in range(len(KEEPS))]
+        nxt = [0.0] * len(DICE)
+        for i, p in enumerate(final_dist):
+            if p:
+                for q, j in keep_next[max(sub_keeps[i], key=adv.__getitem__)]:
+                    nxt[j] += p * q
+        final_dist = nxt
+
+    # ev_open: score the roll in whichever open category (plus what is left
+    # afterwards) is worth most.  Masks only ever lose bits, so smaller
+    # masks are always ready first.
+    columns = [[DICE_TABLE[d][0][i] for d in DICE] for i in range(len(PRIMARY_CATEGORIES))]
+    ev_open = [0.0] * (ALL_MASK + 1)
+    for mask in range(1, ALL_MASK + 1):
+        cands, m = [], mask
+        while m:
+            low = m & -m
+            rest = ev_open[mask ^ low]
+            cands.append([s + rest for s in columns[low.bit_length() - 1]])
+            m ^= low
+        best = map(max, *cands) if len(cands) > 1 else cands[0]
+        ev_open[mask] = sum(map(mul, final_dist, best))
+
+    # A turn spent chasing one category alone is a policy too; keep it when
+    # it beats the fixed holds (it always does for a lone Yahtzii, say).
+    turn_ev = value_tables().turn_ev
+    for mask in range(1, ALL_MASK + 1):
+        ev_open[mask] = max(ev_open[mask], max(
+            turn_ev[row] + ev_open[mask ^ CATEGORY_BIT[row]] for row in rows_in(mask)))
+
+    return ProjectionTables(ev_open, _bonus_prob(keep_next, sub_keeps), final_dist)
+
+
+def _bonus_prob(keep_next, sub_keeps):
+    """
+    bonus_prob[upper_open][upper_sum]: chance of reaching 63 when every turn
+    goes to an open Upper box, holding and scoring to maximise that chance.
+    An exact DP over (open faces, sum): each state solves its own three-roll
+    turn.  Only sums that can occur and can still reach 63 are solved
+    (about 1 800 states); the rest are 0, or 1 at the cap.
+    """
+    cap    = UPPER_BONUS_AT
+    counts = [[d.count(f) for f in range(1, 7)] for d in DICE]
+    keeps  = [([p for p, _ in nxt], [j for _, j in nxt]) for nxt in keep_next]
+    subs_g = [itemgetter(*subs) for subs in sub_keeps]
+    probs0, idx0 = keeps[KEEP_INDEX[()]]
+    bonus_prob = [[0.0] * cap + [1.0] for _ in range(64)]
+    for m in range(1, 64):                   # sub-masks are always solved first
+        faces  = [f for f in range(1, 7) if m >> (f - 1) & 1]
+        filled = [f for f in range(1, 7) if not m >> (f - 1) & 1]
+        reach  = cap - 5 * sum(faces)
+        sums   = {0}
+        for f in filled:
+            sums = {t + k * f for t in sums for k in range(6)}
+        after  = [(f, f - 1, bonus_prob[m ^ (1 << (f - 1))]) for f in faces]
+        for s0 in sorted(t for t in sums if reach <= t < cap):
+            value = [max(rest[min(cap, s0 + c[i] * f)] for f, i, rest in after) for c in counts]
+            for _ in range(2):               # two re-rolls, best hold before each
+                get   = value.__getitem__
+                kv    = [sum(map(mul, probs, map(get, idx))) for probs, idx in keeps]
+                value = [max(g(kv)) for g in subs_g]
+            bonus_prob[m][s0] = sum(map(mul, probs0, map(value.__getitem__, idx0)))
+    return bonus_prob
+
+
+def projection_ready() -> bool:
+    """True once projection_tables() has been built (e.g. by a warm-up thread)."""
+    return projection_tables.cache_info().currsize > 0
+
+
+def projection(state: PlayerState):
+    """
+    (expected final score, probability of the Upper bonus) for one player —
+    two table lookups.  Yahtzii bonuses still to come are not projected.
+    """
+    tables = projection_tables()
+    open_mask = ALL_MASK & ~state.claimed
+    if state.upper_sum >= UPPER_BONUS_AT:
+        p_bonus = 1.0
+    else:
+        p_bonus = tables.bonus_prob[open_mask & UPPER_MASK][state.upper_sum]
+    current = state.upper_sum + state.other
+    return current + tables.ev_open[open_mask] + UPPER_BONUS * p_bonus, p_bonus
+
+
+# ============================================================================
+# REGRET ANALYSIS
+# ============================================================================
+# The scorecard logs one JSON-able record per turn played on the digital
+# roller:
+#
+#   player  player name
+#   state   PlayerState fields just before the claim
+#   rolls   [[dice, held], ...] — dice after each roll and the holds it used
+#   joker   True if Joker rules applied to the claim
+#   row     row claimed
+#   score   points scored in it
+#
+# Every hold (stopping early counts as holding all five) and the category
+# choice are valued with the tables above; regret is best minus chosen.
+# Hold values target one open category and add what the rest of the card is
+# worth without it; claim values add the Upper-bonus chance as well.
+Decision = namedtuple("Decision", "player turn kind dice chosen best regret")
+Decision.__doc__ = """
+kind    "hold" (chosen/best are kept dice tuples) or "claim" (chosen/best are rows)
+regret  expected points given up by the choice (>= 0)
+"""
+
+RegretReport = namedtuple("RegretReport", "totals decisions worst")
+
+
+def hold_values(dice, r: int, open_mask: int) -> dict:
+    """{keep index: value} for every way of holding `dice` with r rolls to come."""
+    vt, ev_open = value_tables(), projection_tables().ev_open
+    targets = [(vt.keep_value[row][r], ev_open[open_mask & ~CATEGORY_BIT[row]])
+               for row in rows_in(open_mask)]
+    _, sub_keeps = _transitions()
+    return {k: max(kv[k] + rest for kv, rest in targets)
+            for k in sub_keeps[DICE_INDEX[tuple(sorted(dice))]]}
+
+
+def claim_value(state: PlayerState, row: int, score: int) -> float:
+    """Points from scoring `score` in `row` plus the projected rest of the game."""
+    tables = projection_tables()
+    open_mask = ALL_MASK & ~(state.claimed | CATEGORY_BIT[row])
+    upper_sum = state.upper_sum + (score if row in UPPER_SECTION else 0)
+    if upper_sum >= UPPER_BONUS_AT:
+        p_bonus = 1.0
+    else:
+        p_bonus = tables.bonus_prob[open_mask & UPPER_MASK][upper_sum]
+    return score + tables.ev_open[open_mask] + UPPER_BONUS * p_bonus
+
+
+def turn_decisions(record):
+    """Yield a Decision for each hold and the claim in one turn record."""
+    state = PlayerState(*record["state"])
+    if state.claimed & CATEGORY_BIT[record["row"]] or not record["rolls"]:
+        return
+    player, rolls = record["player"], record["rolls"]
+    turn      = bin(state.claimed).count("1") + 1
+    open_mask = ALL_MASK & ~state.claimed
+
+    for k, (dice, _) in enumerate(rolls[:2]):
+        held   = rolls[k + 1][1] if k + 1 < len(rolls) else [True] * 5
+        values = hold_values(dice, 2 - k, open_mask)
+        chosen = KEEP_INDEX[tuple(sorted(d for d, h in zip(dice, held) if h))]
+        best   = max(values, key=values.get)
+        yield Decision(player, turn, "hold", tuple(dice), KEEPS[chosen], KEEPS[best],
+                       max(0.0, values[best] - values[chosen]))
+
+    dice  = rolls[-1][0]
+    moves = legal_moves(dice, state.claimed, state.yahtzii_box, record["joker"])
+    values = {row: claim_value(state, row, moves.scores[CATEGORY_INDEX[row]])
+              for row in rows_in(moves.legal)}
+    if not values:
+        return
+    best   = max(values, key=values.get)
+    chosen = claim_value(state, record["row"], record["score"])
+    yield Decision(player, turn, "claim", tuple(dice), record["row"], best,
+                   max(0.0, values[best] - chosen))
+
+
+def analyze_turns(records):
+    """Stream Decisions over any iterable of turn records."""
+    for record in records:
+        yield from turn_decisions(record)
+
+
+def regret_report(records, worst: int = 5) -> RegretReport:
+    """
+    Total regret per player and the `worst` costliest decisions, in one pass
+    over `records` (a list, a file reader or an archive scan).
+    """
+    totals, decisions, heap = Counter(), 0, []
+    for seq, d in enumerate(analyze_turns(records)):
+        totals[d.player] += d.regret
+        decisions += 1
+        entry = (d.regret, seq, d)
+        if len(heap) < worst:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+    return RegretReport(dict(totals), decisions,
+                        [d for _, _, d in sorted(heap, reverse=True)])
+
+
+# ============================================================================
+# RECORDED GAMES
+# ============================================================================
+# One finished game, as the scorecard saves it under scores/games/:
+#
+#   date     "YYYY-MM-DD HH:MM"
+#   players  [name, ...] in seating order
+#   cards    [{str(row): score, ..., "15": Yahtzii bonus count}, ...] per player
+#   turns    turn records (see REGRET ANALYSIS); roller turns only
+def simulate_game(names, rnd, date: str = "") -> dict:
+    """A greedy game between `names` as a recorded-game dict, turn log included."""
+    states = [PlayerState(0, 0, 0, None) for _ in names]
+    cards  = [{"15": 0} for _ in names]
+    turns  = []
+    while any(s.claimed != ALL_MASK for s in states):
+        for i, name in enumerate(names):
+            if states[i].claimed == ALL_MASK:
+                continue
+            log = []
+            states[i] = greedy_turn(states[i], rnd, log)
+            rec = log[0]
+            rec["player"] = name
+            cards[i][str(rec["row"])] = rec["score"]
+            cards[i]["15"] += rec["joker"]
+            turns.append(rec)
+    return {"date": date, "players": list(names), "cards": cards, "turns": turns}